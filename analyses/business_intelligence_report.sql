@@ -164,7 +164,7 @@ WITH chronic_conditions_impact AS (
         COUNT(*) as beneficiary_count,
         ROUND(AVG(total_cost)::decimal, 2) as avg_cost_per_member,
         ROUND(AVG(total_claims)::decimal, 0) as avg_claims_per_member,
-        ROUND(AVG(denial_rate) * 100, 2) as avg_denial_rate_pct,
+        ROUND(AVG(personal_denial_rate) * 100, 2) as avg_denial_rate_pct,
         COUNT(CASE WHEN frequent_admissions THEN 1 END) as frequent_admissions_count
     FROM {{ ref('metrics_beneficiary_utilization') }}
     GROUP BY
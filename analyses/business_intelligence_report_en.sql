@@ -164,7 +164,7 @@ WITH chronic_conditions_impact AS (
         COUNT(*) as member_count,
         ROUND(AVG(total_cost)::decimal, 2) as avg_cost_per_member,
         ROUND(AVG(total_claims)::decimal, 0) as avg_claims_per_member,
-        ROUND(AVG(denial_rate) * 100, 2) as avg_denial_rate_pct,
+        ROUND(AVG(personal_denial_rate) * 100, 2) as avg_denial_rate_pct,
         COUNT(CASE WHEN frequent_admissions THEN 1 END) as frequent_admissions_count
     FROM {{ ref('metrics_beneficiary_utilization') }}
     GROUP BY
@@ -401,8 +401,8 @@ WITH provider_performance_correlations AS (
         'Provider Performance Correlations' as analysis_type,
         specialty_description,
         COUNT(*) as provider_count,
-        ROUND(CORR(total_claims, denial_rate)::decimal, 3) as volume_denial_correlation,
-        ROUND(CORR(avg_claim_amount, denial_rate)::decimal, 3) as cost_denial_correlation,
+        ROUND(NULLIF(CORR(total_claims, denial_rate), 'NaN')::decimal, 3) as volume_denial_correlation,
+        ROUND(NULLIF(CORR(avg_claim_amount, denial_rate), 'NaN')::decimal, 3) as cost_denial_correlation,
         ROUND(AVG(CASE WHEN performance_tier = 'Top Performer' THEN 1.0 ELSE 0.0 END), 3) as top_performer_rate
     FROM {{ ref('metrics_provider_performance') }}
     WHERE specialty_description IS NOT NULL
@@ -0,0 +1,4 @@
+"""
+Claims Data Warehouse - Dashboard support package
+Data access helpers used by streamlit_app.py
+"""
@@ -0,0 +1,893 @@
+"""
+Claims Data Warehouse - Live warehouse data source for the dashboard
+Purpose: Serve dashboard panels from the analytics marts instead of the static report
+
+Without a warehouse the dashboard renders reports/business_report_en_*.json, and the
+panels that are missing from it fall back to hard-coded demo numbers. When
+DASHBOARD_WAREHOUSE is set, WarehouseDataSource answers the same sections
+(key metrics, monthly trends, claim-type mix, top providers, risk tiers, recent
+activity) from metrics_claims_summary, metrics_claims_cube, metrics_provider_performance and
+metrics_beneficiary_utilization.
+
+- Postgres (postgresql://... DSN): a ThreadedConnectionPool of read-only sessions. Every
+  query is PREPAREd once per session and then EXECUTEd with its parameters.
+- DuckDB (path to a .duckdb file): the database built by the `embedded` dbt target,
+  opened read-only for each query, so `dbt run` can rebuild it while the dashboard runs.
+  This is the stand-in for local use and tests.
+
+Results are cached per (query, parameters) for DASHBOARD_QUERY_TTL seconds, so
+concurrent sessions share a single round trip per query and TTL window. With
+DASHBOARD_CACHE_PATH set, the cache is a SQLite file shared by all replicas
+(see result_cache.py). Concurrent misses of the same result are coalesced into one
+warehouse query; callers that wait longer than DASHBOARD_QUERY_WAIT seconds for it
+get the last (expired) result instead when there is one. Every result is tagged
+with the relations its query reads, so invalidate() can expire just the results of
+the relations a dbt run changed (see lineage.py). Downloads (export_*) bypass the cache
+and stream their rows straight to a file (see exports.py).
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+
+from dashboard.exports import EXPORT_BATCH_ROWS
+from dashboard.lineage import models_read
+from dashboard.result_cache import MISSING, MemoryResultCache, result_cache_from_env, result_key
+from dashboard.single_flight import FlightTimeout, SingleFlight
+
+WAREHOUSE_ENV_VAR = "DASHBOARD_WAREHOUSE"
+SCHEMA_ENV_VAR = "DASHBOARD_WAREHOUSE_SCHEMA"
+QUERY_TTL_ENV_VAR = "DASHBOARD_QUERY_TTL"
+QUERY_WAIT_ENV_VAR = "DASHBOARD_QUERY_WAIT"
+DEFAULT_SCHEMA = "analytics_dev"
+DEFAULT_QUERY_TTL_SECONDS = 300
+DEFAULT_QUERY_WAIT_SECONDS = 10
+DEFAULT_POOL_SIZE = 8
+
+ALL_TYPES = 'All Types'  # rollup label used by metrics_claims_summary
+
+# Queries use $n placeholders, which both Postgres PREPARE and DuckDB understand.
+# {schema} is substituted once, when the data source is created.
+QUERIES = {
+    # Claims by month and claim type: metrics_claims_summary answers claim-type and date
+    # filters directly; provider state / specialty filters are pushed down to the cube.
+    'claims_by_month_summary': """
+        select
+            metric_date,
+            claim_type,
+            total_claims,
+            total_claim_amount,
+            total_reimbursement,
+            denied_claims,
+            avg_processing_days * total_claims as total_processing_days
+        from {schema}.metrics_claims_summary
+        where metric_period = 'monthly'
+          and claim_type <> 'All Types'
+          and ($1::text[] is null or claim_type = any($1))
+          and ($2::date is null or metric_date >= $2)
+          and ($3::date is null or metric_date <= $3)
+    """,
+    'claims_by_month_cube': """
+        select
+            metric_date,
+            claim_type,
+            sum(total_claims) as total_claims,
+            sum(total_claim_amount) as total_claim_amount,
+            sum(total_reimbursement) as total_reimbursement,
+            sum(denied_claims) as denied_claims,
+            sum(total_processing_days) as total_processing_days
+        from {schema}.metrics_claims_cube
+        where ($1::text[] is null or claim_type = any($1))
+          and ($2::text[] is null or state_code = any($2))
+          and ($3::text[] is null or specialty_description = any($3))
+          and ($4::date is null or metric_date >= $4)
+          and ($5::date is null or metric_date <= $5)
+        group by metric_date, claim_type
+    """,
+    'claims_filter_options': """
+        select distinct 'claim_type' as filter, claim_type as value from {schema}.metrics_claims_cube
+        union all
+        select distinct 'state' as filter, state_code as value from {schema}.metrics_claims_cube
+        union all
+        select distinct 'specialty' as filter, specialty_description as value from {schema}.metrics_claims_cube
+        order by 1, 2
+    """,
+    'claims_months': """
+        select distinct metric_date
+        from {schema}.metrics_claims_cube
+        order by metric_date
+    """,
+    # Daily series for the trends page; $2/$3 bound the zoom window
+    'daily_trends': """
+        select
+            metric_date,
+            sum(total_claims) as claims,
+            sum(total_claim_amount) as total_value,
+            sum(total_reimbursement) as reimbursed,
+            sum(denied_claims) as denied_claims
+        from {schema}.metrics_claims_summary
+        where metric_period = 'daily'
+          and claim_type <> 'All Types'
+          and ($1::text[] is null or claim_type = any($1))
+          and ($2::date is null or metric_date >= $2)
+          and ($3::date is null or metric_date <= $3)
+        group by metric_date
+        order by metric_date
+    """,
+    # Forecasting input: monthly cost per (claim type, provider state) segment
+    'monthly_segments': """
+        select
+            metric_date,
+            claim_type,
+            state_code,
+            sum(total_claim_amount) as total_claim_amount
+        from {schema}.metrics_claims_cube
+        group by metric_date, claim_type, state_code
+        order by metric_date, claim_type, state_code
+    """,
+    'daily_range': """
+        select min(metric_date) as first_day, max(metric_date) as last_day
+        from {schema}.metrics_claims_summary
+        where metric_period = 'daily'
+    """,
+    'entity_counts': """
+        select
+            (select count(*) from {schema}.metrics_beneficiary_utilization) as total_beneficiaries,
+            (select count(*) from {schema}.metrics_provider_performance) as total_providers
+    """,
+    # Top providers: the pre-aggregated lifetime figures answer provider state / specialty
+    # filters; claim-type and date filters aggregate the matching claim lines instead. A
+    # provider without state or specialty is filed under 'Unknown', as in the cube.
+    'top_providers': """
+        select
+            provider_name,
+            specialty_description,
+            total_claims,
+            avg_claim_amount,
+            denial_rate,
+            performance_tier
+        from {schema}.metrics_provider_performance
+        where ($2::text[] is null or coalesce(state_code, 'Unknown') = any($2))
+          and ($3::text[] is null or coalesce(specialty_description, 'Unknown') = any($3))
+        order by total_claims desc, provider_key
+        limit $1
+    """,
+    'top_providers_claims': """
+        select
+            m.provider_name,
+            m.specialty_description,
+            count(*) as total_claims,
+            avg(f.claim_amount) as avg_claim_amount,
+            count(case when f.is_denied then 1 end)::decimal / count(*) as denial_rate,
+            m.performance_tier
+        from {schema}.fact_claims f
+        join {schema}.metrics_provider_performance m
+            on f.provider_key = m.provider_key
+        where ($2::text[] is null or f.claim_type = any($2))
+          and ($3::text[] is null or coalesce(m.state_code, 'Unknown') = any($3))
+          and ($4::text[] is null or coalesce(m.specialty_description, 'Unknown') = any($4))
+          and ($5::date is null or f.claim_start_date >= $5)
+          and ($6::date is null or f.claim_start_date < $6::date + interval '1 month')
+        group by m.provider_key, m.provider_name, m.specialty_description, m.performance_tier
+        order by total_claims desc, m.provider_key
+        limit $1
+    """,
+    'risk_tiers': """
+        select
+            risk_tier,
+            count(*) as members,
+            avg(total_cost) as avg_cost,
+            sum(total_cost) as total_cost,
+            avg(chronic_condition_count) as avg_chronic_conditions,
+            count(case when needs_case_management then 1 end) as needs_case_management
+        from {schema}.metrics_beneficiary_utilization
+        group by risk_tier
+        order by avg(total_cost) desc
+    """,
+    # Member drill-down: the costliest members of a risk tier ($1, NULL for all), then one
+    # member's claim timeline, a point lookup on fact_claims (beneficiary_key, claim_start_date)
+    'top_members': """
+        select
+            beneficiary_key,
+            beneficiary_id,
+            gender,
+            age_group,
+            state_code,
+            risk_tier,
+            chronic_condition_count,
+            total_claims,
+            total_cost
+        from {schema}.metrics_beneficiary_utilization
+        where ($1::text is null or risk_tier = $1)
+        order by total_cost desc, beneficiary_key
+        limit $2
+    """,
+    'member_claims': """
+        select
+            f.claim_id,
+            f.claim_type,
+            f.claim_status,
+            f.claim_start_date,
+            f.claim_end_date,
+            f.claim_amount,
+            f.reimbursement_amount,
+            f.processing_days,
+            f.is_denied,
+            p.provider_name,
+            p.specialty_description
+        from {schema}.fact_claims f
+        left join {schema}.dim_providers p
+            on f.provider_key = p.provider_key
+        where f.beneficiary_key = $1
+        order by f.claim_start_date, f.claim_id
+    """,
+    'latest_day': """
+        select
+            metric_date,
+            total_claims,
+            denied_claims,
+            high_dollar_claims,
+            slow_processing_claims
+        from {schema}.metrics_claims_summary
+        where metric_period = 'daily'
+          and claim_type = $1
+        order by metric_date desc
+        limit 1
+    """,
+}
+
+# Provider directory: sortable columns (each backed by a (column, provider_key) index on
+# metrics_provider_performance) and the shared filter predicate. $1-$4 are the optional
+# specialty, state, performance tier and name prefix; NULL means "any".
+PROVIDER_SORT_COLUMNS = ('total_claims', 'total_claim_amount', 'avg_claim_amount', 'denial_rate')
+PROVIDER_FILTERS = """
+          ($1::text is null or specialty_description = $1)
+          and ($2::text is null or state_code = $2)
+          and ($3::text is null or performance_tier = $3)
+          and ($4::text is null or provider_name like $4 || '%')
+"""
+PROVIDER_PAGE_COLUMNS = """
+            provider_key,
+            provider_name,
+            specialty_description,
+            state_code,
+            total_claims,
+            total_claim_amount,
+            avg_claim_amount,
+            denial_rate,
+            performance_tier
+"""
+QUERIES.update({
+    'provider_count': """
+        select count(*) as providers
+        from {schema}.metrics_provider_performance
+        where""" + PROVIDER_FILTERS,
+    'provider_filter_options': """
+        select distinct 'specialty' as filter, specialty_description as value
+        from {schema}.metrics_provider_performance where specialty_description is not null
+        union all
+        select distinct 'state' as filter, state_code as value
+        from {schema}.metrics_provider_performance where state_code is not null
+        union all
+        select distinct 'tier' as filter, performance_tier as value
+        from {schema}.metrics_provider_performance where performance_tier is not null
+        order by 1, 2
+    """,
+})
+
+
+def _provider_page_sql(sort, descending, after):
+    """Keyset page query: rows strictly past the (sort value, provider_key) cursor ($5, $6)"""
+    direction = 'desc' if descending else 'asc'
+    keyset = ''
+    if after:
+        keyset = f"and ({sort}, provider_key) {'<' if descending else '>'} ($5, $6)\n"
+    limit = '$7' if after else '$5'
+    return (
+        f"select{PROVIDER_PAGE_COLUMNS}        from {{schema}}.metrics_provider_performance\n"
+        f"        where{PROVIDER_FILTERS}          {keyset}"
+        f"        order by {sort} {direction}, provider_key {direction}\n"
+        f"        limit {limit}"
+    )
+
+
+def _provider_page_name(sort, descending, after):
+    return f"provider_page_{sort}_{'desc' if descending else 'asc'}_{'next' if after else 'first'}"
+
+
+QUERIES.update({
+    _provider_page_name(sort, descending, after): _provider_page_sql(sort, descending, after)
+    for sort in PROVIDER_SORT_COLUMNS
+    for descending in (True, False)
+    for after in (False, True)
+})
+
+
+def _provider_export_sql(sort, descending):
+    """The whole filtered directory in directory order (no keyset, no limit)"""
+    direction = 'desc' if descending else 'asc'
+    return (
+        f"select{PROVIDER_PAGE_COLUMNS}        from {{schema}}.metrics_provider_performance\n"
+        f"        where{PROVIDER_FILTERS}"
+        f"        order by {sort} {direction}, provider_key {direction}\n"
+    )
+
+
+def _provider_export_name(sort, descending):
+    return f"export_providers_{sort}_{'desc' if descending else 'asc'}"
+
+
+# Downloads (see exports.py): whole filtered result sets, streamed to a file, never cached
+QUERIES.update({
+    _provider_export_name(sort, descending): _provider_export_sql(sort, descending)
+    for sort in PROVIDER_SORT_COLUMNS
+    for descending in (True, False)
+})
+QUERIES.update({
+    # Claim lines under the global ClaimsFilter; $5 is the first day of the last month. Rows
+    # come in storage order: sorting millions of lines would make the embedded DuckDB hold
+    # them all, which is what streaming the export avoids.
+    'export_claims': """
+        select
+            f.claim_id,
+            f.claim_type,
+            f.claim_status,
+            f.claim_start_date,
+            f.claim_end_date,
+            f.beneficiary_key,
+            f.provider_key,
+            coalesce(p.state_code, 'Unknown') as provider_state,
+            coalesce(p.specialty_description, 'Unknown') as provider_specialty,
+            f.claim_amount,
+            f.reimbursement_amount,
+            f.processing_days,
+            f.is_denied
+        from {schema}.fact_claims f
+        left join {schema}.dim_providers p
+            on f.provider_key = p.provider_key
+        where ($1::text[] is null or f.claim_type = any($1))
+          and ($2::text[] is null or coalesce(p.state_code, 'Unknown') = any($2))
+          and ($3::text[] is null or coalesce(p.specialty_description, 'Unknown') = any($3))
+          and ($4::date is null or f.claim_start_date >= $4)
+          and ($5::date is null or f.claim_start_date < $5::date + interval '1 month')
+    """,
+    # Members of one risk tier ($1, NULL for all), costliest first
+    'export_members': """
+        select
+            beneficiary_id,
+            gender,
+            age_group,
+            state_code,
+            risk_tier,
+            cost_tier,
+            utilization_tier,
+            chronic_condition_count,
+            total_claims,
+            total_cost,
+            utilization_adjusted_risk_score,
+            needs_case_management
+        from {schema}.metrics_beneficiary_utilization
+        where ($1::text is null or risk_tier = $1)
+        order by total_cost desc, beneficiary_id
+    """,
+})
+
+
+class WarehouseError(Exception):
+    """The warehouse could not be reached or a dashboard query failed"""
+
+
+@dataclass(frozen=True)
+class ClaimsFilter:
+    """Global dashboard filter; empty selections and open dates mean no restriction"""
+    claim_types: tuple = ()
+    states: tuple = ()
+    specialties: tuple = ()
+    start: datetime.date = None
+    end: datetime.date = None
+
+    @property
+    def needs_cube(self):
+        # metrics_claims_summary has no provider dimensions
+        return bool(self.states or self.specialties)
+
+
+def _array(values):
+    """Array parameter for an optional `= any($n)` filter: a list, or None for no filter"""
+    return list(values) if values else None
+
+
+def _rows(cursor):
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _pyformat(sql, params):
+    """($n query, params) -> (%(n)s query, params dict) for psycopg2's client-side binding"""
+    sql = re.sub(r'\$(\d+)', r'%(\1)s', sql.replace('%', '%%'))
+    return sql, {str(n): value for n, value in enumerate(params, start=1)}
+
+
+class PostgresBackend:
+    """Pooled read-only Postgres sessions with per-session prepared statements"""
+
+    def __init__(self, dsn, max_connections=DEFAULT_POOL_SIZE):
+        from psycopg2 import Error
+        from psycopg2.pool import ThreadedConnectionPool
+
+        self._driver_error = Error
+        try:
+            self._pool = ThreadedConnectionPool(1, max_connections, dsn)
+        except Error as exc:
+            raise WarehouseError(f"Cannot connect to the warehouse: {exc}") from exc
+        self._prepared = {}  # backend pid -> names prepared in that session
+        self._lock = threading.Lock()
+
+    def fetch(self, name, sql, params):
+        try:
+            conn = self._pool.getconn()
+        except self._driver_error as exc:
+            raise WarehouseError(f"No warehouse connection available: {exc}") from exc
+
+        broken = False
+        pid = None
+        try:
+            if not conn.autocommit:
+                conn.set_session(readonly=True, autocommit=True)
+            pid = conn.get_backend_pid()
+            with self._lock:
+                prepared = self._prepared.setdefault(pid, set())
+            with conn.cursor() as cur:
+                if name not in prepared:
+                    cur.execute(f"prepare dash_{name} as {sql}")
+                    prepared.add(name)
+                placeholders = ", ".join(["%s"] * len(params))
+                cur.execute(f"execute dash_{name}" + (f" ({placeholders})" if params else ""), params)
+                return _rows(cur)
+        except self._driver_error as exc:
+            broken = conn.closed != 0
+            raise WarehouseError(f"Dashboard query {name} failed: {exc}") from exc
+        finally:
+            if broken and pid is not None:
+                with self._lock:
+                    self._prepared.pop(pid, None)
+            self._pool.putconn(conn, close=broken)
+
+    def export(self, name, sql, params, path, fmt, batch_rows):
+        """Stream the rows of sql into path through a server-side cursor; returns the row count"""
+        from dashboard.exports import postgres_batches, write_batches
+
+        try:
+            conn = self._pool.getconn()
+        except self._driver_error as exc:
+            raise WarehouseError(f"No warehouse connection available: {exc}") from exc
+
+        broken = False
+        try:
+            # A named cursor only lives inside a transaction, and it cannot EXECUTE a
+            # prepared statement, so the parameters are bound client-side
+            conn.set_session(readonly=True, autocommit=False)
+            try:
+                with conn.cursor(name=f"dash_{name}") as cur:
+                    cur.itersize = batch_rows
+                    cur.execute(*_pyformat(sql, params))
+                    return write_batches(*postgres_batches(cur, batch_rows), path, fmt)
+            finally:
+                conn.rollback()
+                conn.set_session(readonly=True, autocommit=True)
+        except self._driver_error as exc:
+            broken = conn.closed != 0
+            raise WarehouseError(f"Dashboard export {name} failed: {exc}") from exc
+        finally:
+            self._pool.putconn(conn, close=broken)
+
+    def close(self):
+        self._pool.closeall()
+
+
+class DuckDBBackend:
+    """Embedded DuckDB database (the `embedded` dbt target), opened read-only for each query.
+
+    DuckDB locks the database file for as long as any connection to it is open, and
+    `dbt run` needs it unlocked to rebuild the file; a long-lived connection would make
+    every rebuild fail while the dashboard runs. So fetch() and export() open their own
+    read-only connection and close it when done; the connect (some 30 ms, reading the
+    catalog) is only paid on result cache misses. A query issued while dbt is writing the
+    file fails with WarehouseError.
+    """
+
+    def __init__(self, path):
+        import duckdb
+
+        self.path = path
+        self._connect_duckdb = duckdb.connect
+        self._driver_error = duckdb.Error
+        # Fail at startup, like the Postgres pool, when the file cannot be opened
+        self._connect().close()
+
+    def _connect(self):
+        try:
+            return self._connect_duckdb(self.path, read_only=True)
+        except self._driver_error as exc:
+            raise WarehouseError(f"Cannot open {self.path}: {exc}") from exc
+
+    def fetch(self, name, sql, params):
+        conn = self._connect()
+        try:
+            # DuckDB prepares parameterized statements itself
+            conn.execute(sql, list(params))
+            return _rows(conn)
+        except self._driver_error as exc:
+            raise WarehouseError(f"Dashboard query {name} failed: {exc}") from exc
+        finally:
+            conn.close()
+
+    def export(self, name, sql, params, path, fmt, batch_rows):
+        """Stream the rows of sql into path as Arrow record batches; returns the row count"""
+        from dashboard.exports import write_batches
+
+        conn = self._connect()
+        try:
+            conn.execute(sql, list(params))
+            # to_arrow_reader replaces fetch_record_batch in DuckDB 1.4
+            reader = (conn.to_arrow_reader(batch_rows) if hasattr(conn, 'to_arrow_reader')
+                      else conn.fetch_record_batch(batch_rows))
+            return write_batches(reader.schema, reader, path, fmt)
+        except self._driver_error as exc:
+            raise WarehouseError(f"Dashboard export {name} failed: {exc}") from exc
+        finally:
+            conn.close()
+
+    def close(self):
+        pass  # no connection outlives a query
+
+
+class WarehouseDataSource:
+    """Dashboard sections computed from the analytics marts, cached per query"""
+
+    def __init__(self, backend, schema=DEFAULT_SCHEMA, ttl_seconds=DEFAULT_QUERY_TTL_SECONDS, cache=None,
+                 wait_seconds=DEFAULT_QUERY_WAIT_SECONDS):
+        if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', schema):
+            raise ValueError(f"Invalid schema name: {schema!r}")
+        self.backend = backend
+        self.schema = schema
+        self.ttl_seconds = ttl_seconds
+        self.cache = cache if cache is not None else MemoryResultCache()
+        self.wait_seconds = wait_seconds
+        self.flights = SingleFlight()
+        self._queries = {name: sql.format(schema=schema) for name, sql in QUERIES.items()}
+        self._reads = {name: models_read(sql) for name, sql in QUERIES.items()}
+        self._lock = threading.Lock()
+        # Result cache hits and misses per query name
+        self.hits = Counter()
+        self.misses = Counter()
+        # Expired results served because the fresh one took longer than wait_seconds
+        self.stale = Counter()
+
+    def query(self, name, *params):
+        """Rows of a named query, from the result cache while it is fresh.
+
+        On a miss only the first caller queries the warehouse; concurrent callers wait for
+        its rows, or take the expired rows (when there are any) after wait_seconds. A caller
+        without expired rows to fall back to goes on waiting for the same query.
+        """
+        sql = self._queries[name]
+        key = result_key(sql, params)
+        rows = self.cache.get(key)
+        if rows is not MISSING:
+            with self._lock:
+                self.hits[name] += 1
+            return rows
+
+        def fetch():
+            # A flight that finished since the lookup above (another replica's, or the one a
+            # timed-out caller gave up on) has already stored the rows
+            rows = self.cache.get(key, count=False)
+            if rows is not MISSING:
+                return rows
+            rows = self.backend.fetch(name, sql, params)
+            with self._lock:
+                self.misses[name] += 1
+            self.cache.set(key, rows, self.ttl_seconds, tags=self._reads[name])
+            return rows
+
+        try:
+            return self.flights.do(key, fetch, timeout=self.wait_seconds)
+        except FlightTimeout:
+            rows = self.cache.get_stale(key)
+            if rows is MISSING:
+                # Nothing to fall back to: join the running query, or if it finished
+                # meanwhile, read what it stored (fetch checks the cache first)
+                return self.flights.do(key, fetch)
+            with self._lock:
+                self.stale[name] += 1
+            return rows
+
+    def invalidate(self, relations):
+        """Expire the cached results that read any of relations; returns how many were expired"""
+        relations = set(relations) & set().union(*self._reads.values())
+        if not relations:
+            return 0
+        return self.cache.invalidate(relations)
+
+    def clear(self):
+        self.cache.clear()
+
+    # Report-shaped sections --------------------------------------------------
+
+    def claims_by_month(self, filters=None):
+        """Claims measures per (month, claim type) under the given ClaimsFilter"""
+        filters = filters or ClaimsFilter()
+        if filters.needs_cube:
+            return self.query('claims_by_month_cube', _array(filters.claim_types), _array(filters.states),
+                              _array(filters.specialties), filters.start, filters.end)
+        return self.query('claims_by_month_summary', _array(filters.claim_types), filters.start, filters.end)
+
+    def claims_filter_options(self):
+        """Values offered by the global filter bar"""
+        options = {'claim_type': [], 'state': [], 'specialty': []}
+        for row in self.query('claims_filter_options'):
+            options[row['filter']].append(row['value'])
+        options['months'] = [row['metric_date'] for row in self.query('claims_months')]
+        return options
+
+    def key_metrics(self, filters=None):
+        rows = self.claims_by_month(filters)
+        counts = self.query('entity_counts')[0]
+        total_claims = sum(int(row['total_claims']) for row in rows)
+        total_value = sum(float(row['total_claim_amount'] or 0) for row in rows)
+        total_reimbursement = sum(float(row['total_reimbursement'] or 0) for row in rows)
+        denied_claims = sum(int(row['denied_claims'] or 0) for row in rows)
+        processing_days = sum(float(row['total_processing_days'] or 0) for row in rows)
+        beneficiaries = int(counts['total_beneficiaries'] or 0)
+        return {
+            'total_beneficiaries': beneficiaries,
+            'total_providers': int(counts['total_providers'] or 0),
+            'total_claims': total_claims,
+            'total_claim_value': total_value,
+            'avg_claim_amount': total_value / total_claims if total_claims else 0,
+            'overall_denial_rate': denied_claims / total_claims if total_claims else 0,
+            'avg_processing_days': processing_days / total_claims if total_claims else 0,
+            'claims_per_member': total_claims / beneficiaries if beneficiaries else 0,
+            'total_reimbursement': total_reimbursement,
+            'avg_reimbursement': total_reimbursement / total_claims if total_claims else 0,
+        }
+
+    def monthly_trends(self, filters=None, months=12):
+        """Per-month totals; the last `months` months unless the filter sets a date range"""
+        filters = filters or ClaimsFilter()
+        by_month = {}
+        for row in self.claims_by_month(filters):
+            month = by_month.setdefault(row['metric_date'], [0, 0.0, 0.0, 0])
+            month[0] += int(row['total_claims'])
+            month[1] += float(row['total_claim_amount'] or 0)
+            month[2] += float(row['total_reimbursement'] or 0)
+            month[3] += int(row['denied_claims'] or 0)
+
+        selected = sorted(by_month)
+        if filters.start is None and filters.end is None:
+            selected = selected[-months:]
+        return [
+            {
+                'month': metric_date.strftime('%Y-%m'),
+                'claims': by_month[metric_date][0],
+                'total_value': by_month[metric_date][1],
+                'reimbursed': by_month[metric_date][2],
+                'reimbursement_rate': by_month[metric_date][2] / by_month[metric_date][1] if by_month[metric_date][1] else 0,
+                'denial_rate': by_month[metric_date][3] / by_month[metric_date][0] if by_month[metric_date][0] else 0,
+            }
+            for metric_date in selected
+        ]
+
+    def daily_range(self):
+        """(first day, last day) of the daily claims series"""
+        row = self.query('daily_range')[0]
+        return row['first_day'], row['last_day']
+
+    def daily_trends(self, filters=None, start=None, end=None):
+        """Per-day totals between start and end (inclusive, None = open), within the filter's dates.
+
+        Daily rows come from metrics_claims_summary, so only the claim-type and date parts of the
+        filter apply; the provider cube is monthly.
+        """
+        filters = filters or ClaimsFilter()
+        if filters.start is not None:
+            start = max(start, filters.start) if start is not None else filters.start
+        if filters.end is not None:
+            # The filter's end is a month; include all of its days
+            next_month = filters.end.replace(day=28) + datetime.timedelta(days=4)
+            month_end = next_month - datetime.timedelta(days=next_month.day)
+            end = min(end, month_end) if end is not None else month_end
+        return self.query('daily_trends', _array(filters.claim_types), start, end)
+
+    def monthly_segments(self):
+        """Monthly claim cost per (claim type, provider state) over the full history"""
+        return self.query('monthly_segments')
+
+    def claim_type_distribution(self, filters=None):
+        by_type = {}
+        for row in self.claims_by_month(filters):
+            claim_type = by_type.setdefault(row['claim_type'], [0, 0.0, 0])
+            claim_type[0] += int(row['total_claims'])
+            claim_type[1] += float(row['total_claim_amount'] or 0)
+            claim_type[2] += int(row['denied_claims'] or 0)
+
+        total = sum(claims for claims, _, _ in by_type.values())
+        return [
+            {
+                'claim_type': name,
+                'count': claims,
+                'percentage': round(100.0 * claims / total, 1) if total else 0,
+                'total_value': value,
+                'avg_value': value / claims,
+                'denial_rate': denied / claims,
+            }
+            for name, (claims, value, denied) in sorted(by_type.items(), key=lambda item: -item[1][0])
+        ]
+
+    def top_providers(self, filters=None, limit=5):
+        """Busiest providers under the given ClaimsFilter; the performance tier is lifetime"""
+        filters = filters or ClaimsFilter()
+        if filters.claim_types or filters.start is not None or filters.end is not None:
+            rows = self.query('top_providers_claims', limit, _array(filters.claim_types), _array(filters.states),
+                              _array(filters.specialties), filters.start, filters.end)
+        else:
+            rows = self.query('top_providers', limit, _array(filters.states), _array(filters.specialties))
+        return [
+            {
+                'rank': rank,
+                'name': row['provider_name'],
+                'specialty': row['specialty_description'],
+                'claims': int(row['total_claims']),
+                'avg_amount': float(row['avg_claim_amount'] or 0),
+                'denial_rate': float(row['denial_rate'] or 0),
+                'performance_tier': row['performance_tier'],
+            }
+            for rank, row in enumerate(rows, start=1)
+        ]
+
+    def risk_stratification(self):
+        rows = self.query('risk_tiers')
+        members = sum(int(row['members']) for row in rows)
+        total_cost = sum(float(row['total_cost'] or 0) for row in rows)
+        return [
+            {
+                'risk_tier': row['risk_tier'],
+                'count': int(row['members']),
+                'percentage': round(100.0 * int(row['members']) / members, 1) if members else 0,
+                'avg_cost': float(row['avg_cost'] or 0),
+                'total_cost_pct': round(100.0 * float(row['total_cost'] or 0) / total_cost, 1) if total_cost else 0,
+                'avg_chronic_conditions': round(float(row['avg_chronic_conditions'] or 0), 1),
+                'needs_case_management': int(row['needs_case_management']),
+            }
+            for row in rows
+        ]
+
+    def recent_activity(self):
+        """Activity feed entries derived from the most recent day of claims"""
+        rows = self.query('latest_day', ALL_TYPES)
+        if not rows:
+            return []
+        day = rows[0]
+        label = day['metric_date'].strftime('%b %d')
+        return [
+            {"time": label, "content": f"{int(day['total_claims']):,} claims received"},
+            {"time": label, "content": f"{int(day['denied_claims']):,} claims denied"},
+            {"time": label, "content": f"{int(day['high_dollar_claims']):,} high-dollar claims flagged for review"},
+            {"time": label, "content": f"{int(day['slow_processing_claims']):,} claims over the processing-time target"},
+        ]
+
+    def top_members(self, risk_tier=None, limit=50):
+        """Costliest members, optionally of one risk tier"""
+        return self.query('top_members', risk_tier, limit)
+
+    def member_claims(self, beneficiary_key):
+        """Claim timeline of one member, oldest first"""
+        return self.query('member_claims', beneficiary_key)
+
+    def provider_filter_options(self):
+        """Distinct specialty / state / tier values for the provider directory filters"""
+        options = {'specialty': [], 'state': [], 'tier': []}
+        for row in self.query('provider_filter_options'):
+            options[row['filter']].append(row['value'])
+        return options
+
+    def provider_count(self, specialty=None, state=None, tier=None, name_prefix=None):
+        return int(self.query('provider_count', specialty, state, tier, name_prefix)[0]['providers'])
+
+    def provider_page(self, sort='total_claims', descending=True, after=None, limit=50,
+                      specialty=None, state=None, tier=None, name_prefix=None):
+        """One page of the provider directory using keyset pagination.
+
+        `after` is the cursor returned with the previous page: the (sort value, provider_key)
+        of its last row. Returns (rows, next_cursor); next_cursor is None on the last page.
+        """
+        if sort not in PROVIDER_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort providers by {sort!r}")
+        name = _provider_page_name(sort, descending, after)
+        params = (specialty, state, tier, name_prefix) + (tuple(after) if after else ()) + (limit + 1,)
+        rows = self.query(name, *params)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, (rows[-1][sort], rows[-1]['provider_key'])
+
+    # Downloads ---------------------------------------------------------------
+
+    def export(self, name, path, fmt, *params):
+        """Stream every row of a named query into path (csv or parquet); returns the row count.
+
+        Exports go straight to the backend: their rows are never held in memory or cached.
+        """
+        return self.backend.export(name, self._queries[name], params, path, fmt, EXPORT_BATCH_ROWS)
+
+    def export_providers(self, path, fmt, sort='total_claims', descending=True,
+                         specialty=None, state=None, tier=None, name_prefix=None):
+        """The whole filtered provider directory, in directory order"""
+        if sort not in PROVIDER_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort providers by {sort!r}")
+        return self.export(_provider_export_name(sort, descending), path, fmt,
+                           specialty, state, tier, name_prefix)
+
+    def export_claims(self, path, fmt, filters=None):
+        """Claim lines matching the global ClaimsFilter, unsorted (see the export_claims query)"""
+        filters = filters or ClaimsFilter()
+        return self.export('export_claims', path, fmt, _array(filters.claim_types), _array(filters.states),
+                           _array(filters.specialties), filters.start, filters.end)
+
+    def export_members(self, path, fmt, risk_tier=None):
+        """Member utilization and risk profiles, optionally of one risk tier"""
+        return self.export('export_members', path, fmt, risk_tier)
+
+    def overlay(self, data, filters=None):
+        """Copy of a report dict with the warehouse-backed sections replaced by live values.
+
+        Claims sections and top providers honour the global ClaimsFilter; risk tiers are
+        member-level and stay unfiltered.
+        """
+        live = {
+            'key_metrics': self.key_metrics(filters),
+            'claim_type_distribution': self.claim_type_distribution(filters),
+            'monthly_trends': self.monthly_trends(filters),
+            'top_providers': self.top_providers(filters),
+            'risk_stratification': self.risk_stratification(),
+        }
+        merged = dict(data or {})
+        executive = dict(merged.get('executive_summary', {}))
+        executive['key_metrics'] = {**executive.get('key_metrics', {}), **live['key_metrics']}
+        executive['claim_type_distribution'] = live['claim_type_distribution']
+        merged['executive_summary'] = executive
+        merged['financial_analysis'] = {**merged.get('financial_analysis', {}),
+                                        'monthly_trends': live['monthly_trends']}
+        merged['provider_analysis'] = {**merged.get('provider_analysis', {}),
+                                       'top_providers': live['top_providers']}
+        merged['member_risk_analysis'] = {**merged.get('member_risk_analysis', {}),
+                                          'risk_stratification': live['risk_stratification']}
+        fingerprint = hashlib.sha256(json.dumps(live, sort_keys=True, default=str).encode()).hexdigest()
+        return merged, fingerprint
+
+    def close(self):
+        self.backend.close()
+
+
+def data_source_from_env():
+    """WarehouseDataSource configured from the environment, or None in report-only mode"""
+    target = os.environ.get(WAREHOUSE_ENV_VAR)
+    if not target:
+        return None
+    if target.startswith(('postgres://', 'postgresql://')) or 'dbname=' in target:
+        backend = PostgresBackend(target)
+    else:
+        backend = DuckDBBackend(target)
+    return WarehouseDataSource(
+        backend,
+        schema=os.environ.get(SCHEMA_ENV_VAR, DEFAULT_SCHEMA),
+        ttl_seconds=float(os.environ.get(QUERY_TTL_ENV_VAR, DEFAULT_QUERY_TTL_SECONDS)),
+        cache=result_cache_from_env(),
+        wait_seconds=float(os.environ.get(QUERY_WAIT_ENV_VAR, DEFAULT_QUERY_WAIT_SECONDS)),
+    )
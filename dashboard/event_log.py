@@ -0,0 +1,161 @@
+"""
+Claims Data Warehouse - Append-only event log
+Purpose: Feed the activity monitor from what the pipeline actually did
+
+The raw loader, the dbt run logger, the volume anomaly detector and its high-cost member
+check, and the model performance collector append one JSON line per event to a local
+log (DASHBOARD_EVENT_LOG, default logs/events.jsonl). Each append is a single write to a
+file opened with O_APPEND, so processes writing at the same time never interleave lines
+and no lock is needed.
+
+The log only grows, so readers remember a byte offset: read_from() returns the complete
+lines after it and the offset to continue from, and read_tail() finds the newest events
+by reading backwards from the end. EventFeed keeps the newest events of a process in
+memory; a poll costs one stat() when nothing was appended and otherwise reads only the
+new bytes, however many millions of events the log holds. A log that shrinks or is
+replaced (rotation) is picked up again from its tail.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+EVENT_LOG_ENV_VAR = "DASHBOARD_EVENT_LOG"
+DEFAULT_EVENT_LOG = "logs/events.jsonl"
+DEFAULT_FEED_SIZE = 50
+TAIL_BLOCK_BYTES = 64 * 1024
+LEVELS = ('info', 'warning', 'error')
+
+
+def event_log_path():
+    """Event log of this deployment ($DASHBOARD_EVENT_LOG or logs/events.jsonl)"""
+    return Path(os.environ.get(EVENT_LOG_ENV_VAR, DEFAULT_EVENT_LOG))
+
+
+def make_event(source, message, level='info', **fields):
+    """Event dict: time, source (loader, dbt, anomaly, ...), level, message and any extra fields"""
+    if level not in LEVELS:
+        raise ValueError(f"Unknown event level {level!r}")
+    return {'ts': time.time(), 'source': source, 'level': level, 'message': message, **fields}
+
+
+def append_events(events, path=None):
+    """Append events to the log in one write; returns the offset just past them"""
+    path = Path(path) if path is not None else event_log_path()
+    payload = b''.join(json.dumps(event, default=str, separators=(',', ':')).encode() + b'\n'
+                       for event in events)
+    if not payload:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, payload)
+        return os.lseek(fd, 0, os.SEEK_CUR)
+    finally:
+        os.close(fd)
+
+
+def append_event(source, message, level='info', path=None, **fields):
+    """Append one event (see make_event); returns it"""
+    event = make_event(source, message, level, **fields)
+    append_events([event], path)
+    return event
+
+
+def has_timestamp(event):
+    """True when event carries a numeric 'ts' (epoch seconds)"""
+    ts = event.get('ts')
+    return isinstance(ts, (int, float)) and not isinstance(ts, bool)
+
+
+def parse_lines(data, offset):
+    """Events in data (log bytes starting at offset), each with its 'offset' in the log.
+
+    Lines that are not JSON objects with a numeric 'ts' are skipped, so one bad writer cannot
+    break the feed.
+    """
+    events = []
+    for line in data.splitlines(keepends=True):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            event = None
+        if isinstance(event, dict) and has_timestamp(event):
+            event['offset'] = offset
+            events.append(event)
+        offset += len(line)
+    return events
+
+
+def read_from(path, offset=0):
+    """(events, next offset): the complete lines appended since offset.
+
+    A line still being written has no newline yet; it is left for the next read.
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    complete = data.rfind(b'\n') + 1
+    return parse_lines(data[:complete], offset), offset + complete
+
+
+def read_tail(path, count):
+    """(the newest count events, next offset), reading backwards from the end of the log"""
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        data = b''
+        # count complete lines need count + 1 newlines: the line before them is read cut off
+        while position > 0 and data.count(b'\n') <= count:
+            step = min(TAIL_BLOCK_BYTES, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+    # As in read_from, a line still being written is left for the next read
+    end = position + data.rfind(b'\n') + 1
+    data = data[:end - position]
+    if position > 0:
+        cut = data.find(b'\n') + 1
+        position, data = position + cut, data[cut:]
+    events = parse_lines(data, position)
+    return (events[-count:] if count else []), end
+
+
+class EventFeed:
+    """Thread-safe window of the newest events of a log, advanced incrementally by poll()"""
+
+    def __init__(self, path=None, size=DEFAULT_FEED_SIZE):
+        self.path = Path(path) if path is not None else event_log_path()
+        self.size = size
+        self.offset = None  # log offset the next poll reads from
+        self.polls = 0
+        self.reads = 0  # polls that found new data and read the log
+        self._inode = None
+        self._events = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def poll(self):
+        """The newest events, newest first; only reads what was appended since the last poll"""
+        with self._lock:
+            self.polls += 1
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                self.offset, self._inode = None, None
+                self._events.clear()
+                return []
+            if self.offset is None or stat.st_ino != self._inode or stat.st_size < self.offset:
+                # First poll, or the log was rotated or truncated: start again from its tail
+                events, self.offset = read_tail(self.path, self.size)
+                self._events.clear()
+                self._inode = stat.st_ino
+                self.reads += 1
+            elif stat.st_size > self.offset:
+                events, self.offset = read_from(self.path, self.offset)
+                self.reads += 1
+            else:
+                events = []
+            self._events.extend(events)
+            return list(reversed(self._events))
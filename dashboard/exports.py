@@ -0,0 +1,196 @@
+"""
+Claims Data Warehouse - Filtered data downloads
+Purpose: Stream a page's filtered result set to CSV or Parquet files the browser downloads
+
+st.download_button holds the whole file in memory (in the script, then in the media file
+manager), even when its data is produced by a callable, which does not work for
+million-row extracts. Instead the warehouse backend writes the rows to files under
+static/exports one batch at a time (WarehouseDataSource.export*: a server-side cursor on
+Postgres, Arrow record batches on DuckDB), and the page links to them through Streamlit's
+static file serving (enableStaticServing in .streamlit/config.toml), which sends them in
+chunks as well. Server memory stays at one batch however large the export.
+
+Streamlit does not serve static files over 200 MB, so an export is split into part files
+of at most EXPORT_PART_BYTES. An export is written to a hidden directory and renamed into
+place when complete, so a link never points at a partial file.
+
+Exposure: static files are served without authentication. Each export gets its own
+unguessable directory, a session's previous export is deleted when it prepares a new one,
+and every export is deleted after EXPORT_TTL_SECONDS, but anyone holding a link can fetch
+it until then. Claim and member exports contain PHI, so exports are off unless the
+deployment sets DASHBOARD_EXPORTS=1, which it should only do with the dashboard behind an
+authenticating proxy that also covers /app/static. Files are local to the replica that
+wrote them, like the session that asked for them.
+"""
+
+import os
+import secrets
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+EXPORTS_ENV_VAR = "DASHBOARD_EXPORTS"
+EXPORT_DIR = Path(__file__).resolve().parent.parent / "static" / "exports"
+EXPORT_URL = "app/static/exports"
+EXPORT_FORMATS = ('csv', 'parquet')
+EXPORT_BATCH_ROWS = 50_000
+EXPORT_TTL_SECONDS = 3600
+# Streamlit refuses static files over 200 MB; one batch past the check must still fit
+EXPORT_PART_BYTES = 150 * 1024 * 1024
+
+# Postgres type OIDs -> Arrow types for Parquet output (anything else is written as string);
+# numeric is written as float64, as in scripts/export_report.py
+POSTGRES_ARROW_TYPES = {
+    16: 'bool_', 20: 'int64', 21: 'int16', 23: 'int32',
+    700: 'float32', 701: 'float64', 1700: 'float64',
+    1082: 'date32', 1114: 'timestamp_us', 1184: 'timestamp_us_utc',
+}
+
+
+@dataclass(frozen=True)
+class ExportPart:
+    """One downloadable file of an export"""
+    file_name: str
+    url: str
+    nbytes: int
+
+
+@dataclass(frozen=True)
+class ExportFile:
+    """A finished download: its part files, row count and how long it took to write"""
+    directory: Path
+    parts: tuple
+    rows: int
+    seconds: float
+
+    @property
+    def nbytes(self):
+        return sum(part.nbytes for part in self.parts)
+
+
+def part_path(path, number):
+    """path of part number of an export split into several files"""
+    return path.with_name(f"{path.stem}_part{number:03d}{path.suffix}")
+
+
+def open_writer(path, schema, fmt):
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    if fmt == 'csv':
+        return pa_csv.CSVWriter(str(path), schema)
+    return pq.ParquetWriter(str(path), schema, compression='zstd')
+
+
+def write_batches(schema, batches, path, fmt, max_bytes=EXPORT_PART_BYTES):
+    """Write Arrow record batches as CSV or Parquet, one batch at a time; returns the row count.
+
+    Once a file reaches max_bytes the next batch starts a new part (see part_path); an
+    export that fits in one file is written to path itself.
+    """
+    path = Path(path)
+    parts = [part_path(path, 1)]
+    writer = open_writer(parts[0], schema, fmt)
+    rows = part_rows = 0
+    try:
+        for batch in batches:
+            if part_rows and parts[-1].stat().st_size >= max_bytes:
+                writer.close()
+                parts.append(part_path(path, len(parts) + 1))
+                writer = open_writer(parts[-1], schema, fmt)
+                part_rows = 0
+            writer.write_batch(batch)
+            rows += batch.num_rows
+            part_rows += batch.num_rows
+    finally:
+        writer.close()
+    if len(parts) == 1:
+        parts[0].rename(path)
+    return rows
+
+
+def postgres_batches(cursor, batch_rows):
+    """(schema, record batches) of an executed server-side psycopg2 cursor, batch_rows at a time"""
+    import pyarrow as pa
+
+    arrow_types = {
+        'bool_': pa.bool_(), 'int16': pa.int16(), 'int32': pa.int32(), 'int64': pa.int64(),
+        'float32': pa.float32(), 'float64': pa.float64(), 'date32': pa.date32(),
+        'timestamp_us': pa.timestamp('us'), 'timestamp_us_utc': pa.timestamp('us', tz='UTC'),
+    }
+    # A named cursor only has a description once the first rows are fetched
+    batch = cursor.fetchmany(batch_rows)
+    schema = pa.schema([
+        (column.name, arrow_types.get(POSTGRES_ARROW_TYPES.get(column.type_code), pa.string()))
+        for column in cursor.description
+    ])
+
+    def record_batches(batch):
+        while batch:
+            arrays = []
+            for field, values in zip(schema, zip(*batch)):
+                if pa.types.is_string(field.type):
+                    values = [None if v is None else str(v) for v in values]
+                elif pa.types.is_floating(field.type):
+                    values = [None if v is None else float(v) for v in values]
+                arrays.append(pa.array(values, type=field.type))
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+            batch = cursor.fetchmany(batch_rows)
+
+    return schema, record_batches(batch)
+
+
+def purge_exports(max_age=EXPORT_TTL_SECONDS):
+    """Delete exports older than max_age seconds; returns how many were removed"""
+    if not EXPORT_DIR.is_dir():
+        return 0
+    cutoff = time.time() - max_age
+    removed = 0
+    for directory in EXPORT_DIR.iterdir():
+        try:
+            expired = directory.is_dir() and directory.stat().st_mtime < cutoff
+        except FileNotFoundError:
+            continue  # purged by another session
+        if expired:
+            shutil.rmtree(directory, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+def exports_enabled():
+    """Downloads are offered only with DASHBOARD_EXPORTS=1 (their links are unauthenticated)"""
+    return os.environ.get(EXPORTS_ENV_VAR) == "1"
+
+
+def remove_export(export):
+    """Delete an export before it expires"""
+    shutil.rmtree(export.directory, ignore_errors=True)
+
+
+def export_file(file_stem, fmt, write):
+    """Stream a result set into a new download.
+
+    write(path, fmt) writes the rows (see write_batches) and returns how many it wrote.
+    """
+    if not exports_enabled():
+        raise PermissionError(f"Exports are disabled (set {EXPORTS_ENV_VAR}=1 to enable them)")
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}")
+    purge_exports()
+    token = secrets.token_urlsafe(16)
+    # Hidden until complete, then renamed into place in one step
+    staging = EXPORT_DIR / f".{token}.partial"
+    staging.mkdir(parents=True)
+    start = time.perf_counter()
+    try:
+        rows = write(staging / f"{file_stem}_{time.strftime('%Y%m%d_%H%M%S')}.{fmt}", fmt)
+        directory = staging.rename(EXPORT_DIR / token)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    parts = tuple(
+        ExportPart(file_name=path.name, url=f"{EXPORT_URL}/{token}/{path.name}", nbytes=path.stat().st_size)
+        for path in sorted(directory.iterdir())
+    )
+    return ExportFile(directory=directory, parts=parts, rows=rows, seconds=time.perf_counter() - start)
@@ -0,0 +1,79 @@
+"""
+Claims Data Warehouse - Plotly figure cache
+Purpose: Rebuild dashboard charts only when the data behind them changes
+
+Building a chart with plotly express (DataFrame wrangling, trace generation and full
+property validation) costs tens of milliseconds, and every Streamlit rerun used to pay
+it again for every chart on the page. FigureCache keeps the built figure spec
+(fig.to_dict()) per (page, panel, data hash, filters) and turns a hit back into a figure
+without re-validating it, which is several times cheaper than building it again.
+Sessions that miss the same chart at the same time wait for one build.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+
+import plotly.graph_objects as go
+
+from dashboard.single_flight import SingleFlight
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def figure_key(page, panel, data_hash, filters=None):
+    """Hashable cache key; filters may be a dict of widget values"""
+    if isinstance(filters, dict):
+        filters = tuple(sorted((name, repr(value)) for name, value in filters.items()))
+    return (page, panel, data_hash, filters)
+
+
+class FigureCache:
+    """Thread-safe LRU of built Plotly figure specs shared by all sessions"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._specs = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    def get_or_build(self, key, build):
+        """Cached figure for key; build() is only called on a miss and must return a figure"""
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is not None:
+                self._specs.move_to_end(key)
+                self.hits += 1
+
+        if spec is not None:
+            # The spec was validated when it was first built
+            return go.Figure(copy.deepcopy(spec), _validate=False)
+
+        built = []
+
+        def build_spec():
+            fig = build()
+            built.append(fig)
+            spec = fig.to_dict()
+            with self._lock:
+                self.misses += 1
+                self._specs[key] = spec
+                self._specs.move_to_end(key)
+                while len(self._specs) > self.max_entries:
+                    self._specs.popitem(last=False)
+            return spec
+
+        spec = self._flights.do(key, build_spec)
+        if built:
+            return built[0]
+        # Coalesced into another session's build: draw from its spec like a hit
+        return go.Figure(copy.deepcopy(spec), _validate=False)
+
+    def clear(self):
+        with self._lock:
+            self._specs.clear()
+
+    def __len__(self):
+        return len(self._specs)
@@ -0,0 +1,224 @@
+"""
+Claims Data Warehouse - Batch cost forecasting
+Purpose: Forecast monthly claim cost for thousands of segments in one vectorized fit
+
+fit_holt_winters() fits additive Holt-Winters (level, trend and, with at least two
+years of history, a 12-month season) to every row of a (series x months) matrix at
+once. The smoothing parameters are chosen per series from a grid by one-step-ahead
+squared error; the recursion loops over months only, every series and every grid point
+is updated together as NumPy arrays. Forecasts come with prediction intervals from the
+one-step residual spread and the standard additive Holt-Winters variance formula, per
+month and for the total over the horizon (whose errors are correlated across months).
+
+segment_matrix() turns warehouse rows into the matrix: one series per (claim type,
+state) segment plus the per-claim-type, per-state and total series, so one fit covers
+every breakdown the page shows. ForecastModels keeps fitted models by the content hash
+of their input, so parameters are only refitted when new data arrives.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+from dashboard.single_flight import SingleFlight
+
+SEASON_LENGTH = 12
+ALPHAS = np.array([0.05, 0.1, 0.2, 0.3, 0.45, 0.6, 0.8, 0.95])
+BETAS = np.array([0.0, 0.05, 0.15, 0.3])
+GAMMAS = np.array([0.0, 0.05, 0.15, 0.3])
+DEFAULT_MAX_MODELS = 16
+TOTAL = 'All'
+
+
+@dataclass(frozen=True)
+class HoltWintersFit:
+    """Fitted parameters and final state of every series (arrays are indexed by series)"""
+    alpha: np.ndarray
+    beta: np.ndarray
+    gamma: np.ndarray
+    level: np.ndarray
+    trend: np.ndarray
+    season: np.ndarray  # (season_length, series), season[k] applies to months t with t % m == k
+    sigma: np.ndarray   # standard deviation of the one-step-ahead errors
+    n_obs: int
+    season_length: int
+
+    def forecast(self, horizon, interval=0.95):
+        """(mean, lower, upper), each (series x horizon); bounds are clipped at zero (costs)"""
+        mean = self.mean(horizon)
+        half_width = self.half_width(horizon, interval)
+        return mean, np.maximum(mean - half_width, 0), np.maximum(mean + half_width, 0)
+
+    def mean(self, horizon):
+        """Point forecasts (series x horizon)"""
+        steps = np.arange(1, horizon + 1)
+        phase = (self.n_obs + steps - 1) % self.season_length
+        return self.level[:, None] + steps[None, :] * self.trend[:, None] + self.season[phase].T
+
+    def half_width(self, horizon, interval=0.95):
+        """Half the width of the prediction interval (series x horizon), before clipping"""
+        return NormalDist().inv_cdf(0.5 + interval / 2) * np.sqrt(self.variance(horizon))
+
+    def total_half_width(self, horizon, interval=0.95):
+        """Half the width of the prediction interval of the sum over steps 1..horizon (series,)"""
+        return NormalDist().inv_cdf(0.5 + interval / 2) * np.sqrt(self.total_variance(horizon))
+
+    def error_weights(self, horizon):
+        """c_j, j = 1..horizon-1 (series x horizon-1): the h-step error is e_h = eps_h + sum_j c_j eps_(h-j).
+
+        In error-correction form the fit's updates are level += alpha e, trend += alpha beta e
+        and season += gamma (1 - alpha) e, the last because the season is updated against
+        the new level rather than the one-step forecast.
+        """
+        j = np.arange(1, horizon)[None, :]
+        seasonal = (j % self.season_length == 0) * (self.gamma * (1 - self.alpha))[:, None]
+        return self.alpha[:, None] * (1 + j * self.beta[:, None]) + seasonal
+
+    def variance(self, horizon):
+        """Forecast error variance per series and step (additive Holt-Winters, normal errors)"""
+        c = self.error_weights(horizon)
+        cumulative = np.concatenate([np.zeros((len(self.alpha), 1)), np.cumsum(c ** 2, axis=1)], axis=1)
+        return self.sigma[:, None] ** 2 * (1 + cumulative)
+
+    def total_variance(self, horizon):
+        """Error variance of the summed forecast over steps 1..horizon, per series.
+
+        The step errors share innovations, so this is more than the sum of their variances:
+        eps_k enters every later step, giving sigma^2 * sum_k (1 + C_(horizon-k))^2 with
+        C_m = c_1 + ... + c_m.
+        """
+        c = self.error_weights(horizon)
+        partial_sums = np.concatenate([np.zeros((len(self.alpha), 1)), np.cumsum(c, axis=1)], axis=1)
+        return self.sigma ** 2 * ((1 + partial_sums) ** 2).sum(axis=1)
+
+
+def fit_holt_winters(y, season_length=SEASON_LENGTH):
+    """Fit every row of y (series x months, no gaps) at once.
+
+    The season is only modelled with two full seasons of history; shorter series get a
+    trend-only (Holt) fit. Needs at least two months.
+    """
+    y = np.asarray(y, dtype=float)
+    n_series, n_obs = y.shape
+    if n_obs < 2:
+        raise ValueError("Forecasting needs at least two months of history")
+    seasonal = n_obs >= 2 * season_length
+    m = season_length
+
+    # Parameter grid, flattened: (G,) each
+    gammas = GAMMAS if seasonal else np.zeros(1)
+    alpha, beta, gamma = (grid.ravel()[:, None] for grid in np.meshgrid(ALPHAS, BETAS, gammas, indexing='ij'))
+
+    # Initial state from the first season (or the first and last month without one)
+    if seasonal:
+        first, second = y[:, :m].mean(axis=1), y[:, m:2 * m].mean(axis=1)
+        trend0 = (second - first) / m
+        # The first season's mean is the level (m - 1) / 2 months in: the state before month 0
+        # is that much trend (plus a month) earlier, and the offsets come from the detrended season
+        level0 = first - trend0 * (m + 1) / 2
+        season0 = y[:, :m] - (first[:, None] + trend0[:, None] * (np.arange(m) - (m - 1) / 2))
+    else:
+        level0, trend0 = y[:, 0], (y[:, -1] - y[:, 0]) / (n_obs - 1)
+        season0 = np.zeros((n_series, m))
+
+    grid_size = len(alpha)
+    level = np.broadcast_to(level0, (grid_size, n_series)).copy()
+    trend = np.broadcast_to(trend0, (grid_size, n_series)).copy()
+    season = np.broadcast_to(season0.T[:, None, :], (m, grid_size, n_series)).copy()
+    sse = np.zeros((grid_size, n_series))
+
+    for t in range(n_obs):
+        observed = y[:, t][None, :]
+        s = season[t % m]
+        error = observed - (level + trend + s)
+        if t > 0:  # the first month only seeds the state
+            sse += error ** 2
+        new_level = alpha * (observed - s) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        season[t % m] = gamma * (observed - new_level) + (1 - gamma) * s
+        level = new_level
+
+    best = np.argmin(sse, axis=0)
+    series = np.arange(n_series)
+    return HoltWintersFit(
+        alpha=alpha[best, 0],
+        beta=beta[best, 0],
+        gamma=gamma[best, 0],
+        level=level[best, series],
+        trend=trend[best, series],
+        season=season[:, best, series],
+        sigma=np.sqrt(sse[best, series] / max(n_obs - 1, 1)),
+        n_obs=n_obs,
+        season_length=m,
+    )
+
+
+def segment_matrix(rows, value='total_claim_amount'):
+    """(labels, months, matrix) from monthly (metric_date, claim_type, state_code, value) rows.
+
+    Labels are sorted (claim type, state) pairs: every segment, each claim type and each
+    state summed over the other dimension (TOTAL in its place), and (TOTAL, TOTAL).
+    Months without claims in a segment count as zero.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame(rows, columns=['metric_date', 'claim_type', 'state_code', value])
+    frame[value] = frame[value].astype(float)
+    frame['state_code'] = frame['state_code'].fillna('Unknown')
+    months = sorted(frame['metric_date'].unique())
+    # Marginal series are sums of the segments, stacked under the segments themselves
+    by_type = frame.assign(state_code=TOTAL)
+    by_state = frame.assign(claim_type=TOTAL)
+    total = frame.assign(claim_type=TOTAL, state_code=TOTAL)
+    matrix = (
+        pd.concat([frame, by_type, by_state, total])
+        .pivot_table(index=['claim_type', 'state_code'], columns='metric_date', values=value,
+                     aggfunc='sum', fill_value=0.0)
+        .reindex(columns=months, fill_value=0.0)
+    )
+    return list(matrix.index), months, matrix.to_numpy()
+
+
+def matrix_version(matrix):
+    """Content hash of a series matrix: a new hash means new data"""
+    matrix = np.ascontiguousarray(matrix, dtype=float)
+    return hashlib.sha256(matrix.tobytes() + repr(matrix.shape).encode()).hexdigest()
+
+
+class ForecastModels:
+    """Thread-safe LRU of fitted models keyed by the content hash of their input matrix"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_MODELS):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._fits = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    def fit(self, matrix, season_length=SEASON_LENGTH):
+        """Fitted model for matrix; only refits when the data differs from every cached fit"""
+        key = (matrix_version(matrix), season_length)
+        with self._lock:
+            fit = self._fits.get(key)
+            if fit is not None:
+                self._fits.move_to_end(key)
+                self.hits += 1
+                return fit
+
+        def fit_model():
+            fit = fit_holt_winters(matrix, season_length)
+            with self._lock:
+                self.misses += 1
+                self._fits[key] = fit
+                self._fits.move_to_end(key)
+                while len(self._fits) > self.max_entries:
+                    self._fits.popitem(last=False)
+            return fit
+
+        # Sessions that see the new data at the same time share one fit
+        return self._flights.do(key, fit_model)
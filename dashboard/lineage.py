@@ -0,0 +1,65 @@
+"""
+Claims Data Warehouse - dbt lineage for cache invalidation
+Purpose: Tell which warehouse relations a dbt run actually changed
+
+Dashboard queries are tagged with the relations they read (models_read). After a dbt
+run, changed_relations() reads target/run_results.json and target/manifest.json: every
+model, seed or snapshot the run rebuilt successfully has new data, and so does every
+view (or ephemeral model) downstream of one, because a view is re-evaluated on read. A
+table downstream of a rebuilt model keeps its old data until it is rebuilt itself, in
+which case it is in the run results too. Only cached results that read a changed
+relation need to be dropped.
+"""
+
+import json
+import re
+from pathlib import Path
+
+REBUILT_RESOURCE_TYPES = ('model', 'seed', 'snapshot')
+# Materializations whose data follows their parents without being rebuilt
+PASS_THROUGH_MATERIALIZATIONS = ('view', 'ephemeral')
+_RELATION = re.compile(r'\{schema\}\.([A-Za-z_][A-Za-z0-9_]*)')
+
+
+def models_read(sql):
+    """Relations a dashboard query template reads ({schema}.<relation> references)"""
+    return frozenset(_RELATION.findall(sql))
+
+
+def load_artifacts(target_dir):
+    """(run_results, manifest) from a dbt target directory"""
+    target_dir = Path(target_dir)
+    with open(target_dir / "run_results.json") as f:
+        run_results = json.load(f)
+    with open(target_dir / "manifest.json") as f:
+        manifest = json.load(f)
+    return run_results, manifest
+
+
+def rebuilt_nodes(run_results):
+    """unique_ids the run rebuilt successfully (tests and failed or skipped nodes changed nothing)"""
+    return {
+        result['unique_id'] for result in run_results.get('results', [])
+        if result.get('status') == 'success'
+        and result['unique_id'].split('.', 1)[0] in REBUILT_RESOURCE_TYPES
+    }
+
+
+def changed_relations(run_results, manifest):
+    """Relation names (node aliases) whose data may differ after the run"""
+    nodes = manifest.get('nodes', {})
+    child_map = manifest.get('child_map', {})
+    changed = set()
+    pending = list(rebuilt_nodes(run_results))
+    while pending:
+        unique_id = pending.pop()
+        if unique_id in changed:
+            continue
+        changed.add(unique_id)
+        for child in child_map.get(unique_id, ()):
+            node = nodes.get(child, {})
+            if (node.get('resource_type') == 'model'
+                    and node.get('config', {}).get('materialized') in PASS_THROUGH_MATERIALIZATIONS):
+                pending.append(child)
+    return {nodes[unique_id].get('alias') or nodes[unique_id]['name']
+            for unique_id in changed if unique_id in nodes}
@@ -0,0 +1,107 @@
+"""
+Claims Data Warehouse - Dashboard performance HUD support
+Purpose: Find the slow panel of a page in production without attaching a profiler
+
+Opening the dashboard with ?perf=1 shows a panel in the sidebar DEVELOPMENT section
+with the timings of the last rerun (data load, every panel and chart), the payload size
+of every figure sent to the browser, hit/miss counts of the cached functions and the
+process RSS. RunProfile collects one rerun; track_cache() counts calls and misses of a
+Streamlit-cached function so hits can be told apart from recomputations.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+QUERY_PARAM = "perf"
+
+
+@dataclass
+class CacheCounter:
+    """Calls of a cached function and how many of them ran its body"""
+    calls: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self):
+        return self.calls - self.misses
+
+
+# Process-wide, like the Streamlit caches they describe
+CACHE_STATS = {}
+_stats_lock = threading.Lock()
+
+
+def _count(counter, field):
+    with _stats_lock:
+        setattr(counter, field, getattr(counter, field) + 1)
+
+
+def track_cache(cache_decorator):
+    """Apply a Streamlit cache decorator and count calls and misses of the result.
+
+    Use as @track_cache(st.cache_data(ttl=60)). The function body only runs on a miss,
+    so counting inside the cached function and around it gives both numbers.
+    """
+    def decorate(func):
+        counter = CACHE_STATS.setdefault(func.__name__, CacheCounter())
+
+        @functools.wraps(func)
+        def body(*args, **kwargs):
+            _count(counter, 'misses')
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(body)
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            _count(counter, 'calls')
+            return cached(*args, **kwargs)
+
+        call.clear = cached.clear
+        return call
+    return decorate
+
+
+class RunProfile:
+    """Timings (ms) and figure payload sizes (bytes) of one script run"""
+
+    def __init__(self, collect_payloads=False):
+        self.started = time.perf_counter()
+        self.collect_payloads = collect_payloads
+        self.timings = {}
+        self.payloads = {}
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = (time.perf_counter() - start) * 1000
+
+    def record_payload(self, name, nbytes):
+        self.payloads[name] = nbytes
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+
+def process_rss_bytes():
+    """Resident set size of this process; the peak RSS where /proc is unavailable, None on Windows"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
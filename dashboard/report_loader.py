@@ -0,0 +1,141 @@
+"""
+Claims Data Warehouse - Freshness-aware report loader
+Purpose: Serve the newest business report to the dashboard without blocking on reloads
+
+The dashboard used to cache one hard-coded report file for the lifetime of the process,
+so a nightly rebuild was only visible after a restart. ReportLoader discovers the newest
+reports/business_report_en_*.json and keys its snapshot on (path, mtime, size) plus a
+content hash. Once a snapshot is older than the TTL the next request still gets it
+immediately while a background thread revalidates (stale-while-revalidate): a stat() when
+nothing changed, a re-parse only when the file content actually differs.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+REPORT_PATTERN = "business_report_en_*.json"
+DEFAULT_TTL_SECONDS = 300
+TTL_ENV_VAR = "DASHBOARD_REPORT_TTL"
+
+
+@dataclass(frozen=True)
+class ReportFingerprint:
+    """Cheap identity of a report file on disk"""
+    path: str
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def of(cls, path):
+        stat = os.stat(path)
+        return cls(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    """A parsed report together with where it came from and when it was checked"""
+    data: dict
+    fingerprint: ReportFingerprint
+    content_hash: str
+    loaded_at: float
+    checked_at: float
+
+    @property
+    def name(self):
+        return Path(self.fingerprint.path).name
+
+    def age(self, now=None):
+        return (now or time.time()) - self.checked_at
+
+
+def find_latest_report(reports_dir, pattern=REPORT_PATTERN):
+    """Newest report in reports_dir: latest date in the file name, then latest mtime"""
+    candidates = list(Path(reports_dir).glob(pattern))
+    if not candidates:
+        return None
+    return max(candidates, key=lambda path: (path.name, path.stat().st_mtime_ns))
+
+
+class ReportLoader:
+    """Thread-safe stale-while-revalidate cache over the newest report file"""
+
+    def __init__(self, reports_dir="reports", pattern=REPORT_PATTERN, ttl_seconds=None):
+        self.reports_dir = reports_dir
+        self.pattern = pattern
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get(TTL_ENV_VAR, DEFAULT_TTL_SECONDS))
+        self.ttl_seconds = ttl_seconds
+        self.last_error = None
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def get(self):
+        """Current snapshot; only the very first call (or an empty cache) reads synchronously"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._snapshot = self._revalidate(None)
+                return self._snapshot
+
+        if snapshot.age() >= self.ttl_seconds:
+            self._refresh_in_background()
+        return snapshot
+
+    def refresh(self):
+        """Revalidate synchronously and return the resulting snapshot"""
+        with self._lock:
+            self._snapshot = self._revalidate(self._snapshot)
+            return self._snapshot
+
+    def _refresh_in_background(self):
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="report-revalidate", daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _revalidate(self, current):
+        """Return a snapshot for the newest report, reusing `current` whenever possible"""
+        now = time.time()
+        try:
+            path = find_latest_report(self.reports_dir, self.pattern)
+            if path is None:
+                raise FileNotFoundError(f"No {self.pattern} in {self.reports_dir}")
+
+            fingerprint = ReportFingerprint.of(path)
+            if current is not None and fingerprint == current.fingerprint:
+                return ReportSnapshot(current.data, fingerprint, current.content_hash,
+                                      current.loaded_at, now)
+
+            raw = path.read_bytes()
+            content_hash = hashlib.sha256(raw).hexdigest()
+            if current is not None and content_hash == current.content_hash:
+                # Touched or copied, but the same report
+                return ReportSnapshot(current.data, fingerprint, content_hash,
+                                      current.loaded_at, now)
+
+            data = json.loads(raw)
+            self.last_error = None
+            return ReportSnapshot(data, fingerprint, content_hash, now, now)
+        except (OSError, ValueError) as exc:
+            # A report being rewritten mid-read or a missing directory keeps the last
+            # good snapshot; the next request after the TTL tries again.
+            self.last_error = exc
+            if current is None:
+                return None
+            return ReportSnapshot(current.data, current.fingerprint, current.content_hash,
+                                  current.loaded_at, now)
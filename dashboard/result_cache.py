@@ -0,0 +1,248 @@
+"""
+Claims Data Warehouse - Query result cache backends
+Purpose: Let several dashboard replicas share one copy of every warehouse query result
+
+WarehouseDataSource keeps query results for DASHBOARD_QUERY_TTL seconds. With the default
+MemoryResultCache that cache is per process, so every replica behind the load balancer
+runs the same queries and holds the same rows. SQLiteResultCache keeps the results in
+one SQLite file on a volume the replicas share: a result fetched by one replica is
+served to all of them, and the rows live once in the OS page cache instead of once per
+process. Both backends take content-hash keys (result_key: the SQL text and its
+parameters) and count hits and misses; the SQLite store is bounded by size and evicts
+expired, then least recently used results. Expired results are kept until then so
+get_stale() can serve them when a fresh one cannot be had in time. Every result is
+tagged with the warehouse relations it read; invalidate() expires the results of
+relations a dbt run changed and leaves the rest warm.
+
+The file must be on a local disk shared by the replicas (a host or node volume): SQLite
+locking is unreliable on network file systems.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+CACHE_PATH_ENV_VAR = "DASHBOARD_CACHE_PATH"
+CACHE_MAX_MB_ENV_VAR = "DASHBOARD_CACHE_MAX_MB"
+DEFAULT_MAX_BYTES = 256 * 2**20
+# A hit only records its time when the stored one is older than this: eviction order only
+# needs minute resolution, and a write per hit would serialise readers behind the WAL lock
+LAST_USED_RESOLUTION_SECONDS = 60
+
+# Returned by get() on a miss; None is a valid cached value
+MISSING = object()
+
+
+def result_key(sql, params):
+    """Content hash of a query and its parameters; identical on every replica"""
+    payload = repr((sql, tuple(tuple(param) if isinstance(param, list) else param for param in params)))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class MemoryResultCache:
+    """Per-process results with expiry (the single-replica default)"""
+
+    description = "memory"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, count=True):
+        """Fresh value for key or MISSING; count=False leaves the hit/miss counters alone"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and cached[0] > now:
+                self.hits += count
+                return cached[1]
+            self.misses += count
+        return MISSING
+
+    def get_stale(self, key):
+        """Last value stored for key, expired or not"""
+        with self._lock:
+            cached = self._results.get(key)
+        return cached[1] if cached is not None else MISSING
+
+    def set(self, key, value, ttl_seconds, tags=()):
+        with self._lock:
+            self._results[key] = (time.monotonic() + ttl_seconds, value, frozenset(tags))
+
+    def invalidate(self, tags):
+        """Expire (but keep for get_stale) every result tagged with one of tags; returns how many"""
+        tags = set(tags)
+        with self._lock:
+            keys = [key for key, (_, _, entry_tags) in self._results.items() if entry_tags & tags]
+            for key in keys:
+                _, value, entry_tags = self._results[key]
+                self._results[key] = (float('-inf'), value, entry_tags)
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def nbytes(self):
+        return None  # not measured: the rows are plain Python objects
+
+
+class SQLiteResultCache:
+    """Results pickled into a SQLite file shared by all replicas, LRU-evicted above max_bytes.
+
+    Every thread gets its own connection; the database runs in WAL mode so readers in one
+    replica never wait for a writer in another. A cache that cannot be read or written
+    behaves like an empty one (the query goes to the warehouse) and counts an error.
+    """
+
+    description = "sqlite"
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = str(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("pragma journal_mode=wal")
+            conn.execute("pragma synchronous=normal")
+            conn.execute("""
+                create table if not exists results (
+                    key text primary key,
+                    value blob not null,
+                    size integer not null,
+                    expires_at real not null,
+                    last_used real not null
+                )
+            """)
+            conn.execute("create index if not exists results_last_used on results (last_used)")
+            conn.execute("""
+                create table if not exists result_tags (
+                    key text not null,
+                    tag text not null,
+                    primary key (tag, key)
+                )
+            """)
+            self._local.conn = conn
+        return conn
+
+    def _count(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def get(self, key, count=True):
+        """Fresh value for key or MISSING; count=False leaves the hit/miss counters alone"""
+        now = time.time()
+        try:
+            conn = self._connection()
+            row = conn.execute("select value, last_used from results where key = ? and expires_at > ?",
+                               (key, now)).fetchone()
+            if row is not None:
+                if now - row[1] > LAST_USED_RESOLUTION_SECONDS:
+                    conn.execute("update results set last_used = ? where key = ?", (now, key))
+                value = pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError):
+            self._count('errors')
+            row = None
+        if row is None:
+            if count:
+                self._count('misses')
+            return MISSING
+        if count:
+            self._count('hits')
+        return value
+
+    def get_stale(self, key):
+        """Last value stored for key, expired or not (until it is evicted)"""
+        try:
+            row = self._connection().execute("select value from results where key = ?", (key,)).fetchone()
+            return pickle.loads(row[0]) if row is not None else MISSING
+        except (sqlite3.Error, pickle.UnpicklingError):
+            self._count('errors')
+            return MISSING
+
+    def set(self, key, value, ttl_seconds, tags=()):
+        now = time.time()
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            conn = self._connection()
+            conn.execute("insert or replace into results values (?, ?, ?, ?, ?)",
+                         (key, blob, len(blob), now + ttl_seconds, now))
+            conn.executemany("insert or ignore into result_tags values (?, ?)", [(key, tag) for tag in tags])
+            self._evict(conn, now)
+        except sqlite3.Error:
+            self._count('errors')
+
+    def invalidate(self, tags):
+        """Expire (but keep for get_stale) every result tagged with one of tags, for all replicas"""
+        tags = list(tags)
+        if not tags:
+            return 0
+        try:
+            cursor = self._connection().execute(
+                "update results set expires_at = 0 where expires_at > 0 and key in "
+                f"(select key from result_tags where tag in ({', '.join('?' * len(tags))}))", tags)
+            return cursor.rowcount
+        except sqlite3.Error:
+            self._count('errors')
+            return 0
+
+    def _evict(self, conn, now):
+        """Drop expired, then least recently used results until the file fits max_bytes"""
+        conn.execute("begin immediate")
+        try:
+            excess = conn.execute("select coalesce(sum(size), 0) from results").fetchone()[0] - self.max_bytes
+            if excess > 0:
+                victims = []
+                for key, size in conn.execute("select key, size from results "
+                                              "order by expires_at > ?, last_used", (now,)):
+                    victims.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                conn.executemany("delete from results where key = ?", victims)
+                conn.executemany("delete from result_tags where key = ?", victims)
+                with self._lock:
+                    self.evictions += len(victims)
+            conn.execute("commit")
+        except sqlite3.Error:
+            conn.execute("rollback")
+            raise
+
+    def clear(self):
+        """Drop every result, for all replicas"""
+        try:
+            conn = self._connection()
+            conn.execute("delete from results")
+            conn.execute("delete from result_tags")
+        except sqlite3.Error:
+            self._count('errors')
+
+    def nbytes(self):
+        """Size of the cached results in the shared file"""
+        try:
+            return self._connection().execute("select coalesce(sum(size), 0) from results").fetchone()[0]
+        except sqlite3.Error:
+            self._count('errors')
+            return None
+
+
+def result_cache_from_env():
+    """SQLiteResultCache when DASHBOARD_CACHE_PATH is set, otherwise a per-process MemoryResultCache"""
+    path = os.environ.get(CACHE_PATH_ENV_VAR)
+    if not path:
+        return MemoryResultCache()
+    max_mb = os.environ.get(CACHE_MAX_MB_ENV_VAR)
+    return SQLiteResultCache(path, max_bytes=int(float(max_mb) * 2**20) if max_mb else DEFAULT_MAX_BYTES)
@@ -0,0 +1,228 @@
+"""
+Claims Data Warehouse - Dashboard runtime helpers
+Purpose: Process-wide caches and per-run helpers shared by streamlit_app.py and the pages
+
+The report loader, warehouse data source, figure cache, shared frame store, forecasting
+models, ROI simulations, event feed and cache warmer are Streamlit cache_resource
+singletons, so every page module and every session shares one instance of each
+(cache_resource hands out the object itself, never a copy).
+"""
+
+import contextlib
+import html
+import json
+
+import streamlit as st
+
+from dashboard.data_sources import ClaimsFilter, WarehouseError, data_source_from_env
+from dashboard.figure_cache import FigureCache, figure_key
+from dashboard.perf import QUERY_PARAM, track_cache
+from dashboard.report_loader import ReportLoader
+
+
+@track_cache(st.cache_resource)
+def get_report_loader():
+    """Process-wide loader for the newest business report (shared by all sessions)"""
+    return ReportLoader("reports")
+
+
+@track_cache(st.cache_resource)
+def get_data_source():
+    """Process-wide warehouse data source (connection pool + query cache); None without DASHBOARD_WAREHOUSE"""
+    return data_source_from_env()
+
+
+def load_live_data_source():
+    """Warehouse data source for this run, or None when unconfigured or unreachable"""
+    try:
+        return get_data_source()
+    except WarehouseError as e:
+        st.sidebar.warning(f"Live warehouse unavailable, showing the static report. ({e})")
+        return None
+
+
+def current_claims_filter():
+    """Global filter bar selection; the widgets are drawn by render_filter_bar()"""
+    months = st.session_state.get('filter_months')
+    if months is not None and tuple(months) == st.session_state.get('filter_month_range'):
+        # The full range is the default; keep the "last 12 months" trend view
+        months = None
+    return ClaimsFilter(
+        claim_types=tuple(st.session_state.get('filter_claim_types', ())),
+        states=tuple(st.session_state.get('filter_states', ())),
+        specialties=tuple(st.session_state.get('filter_specialties', ())),
+        start=months[0] if months else None,
+        end=months[1] if months else None,
+    )
+
+
+def load_report_data():
+    """Load the business intelligence report data, with live warehouse sections when configured"""
+    snapshot = get_report_loader().get()
+    data = snapshot.data if snapshot is not None else None
+    data_hash = snapshot.content_hash if snapshot is not None else None
+
+    source = load_live_data_source()
+    if source is not None:
+        try:
+            # Filters are pushed down to the warehouse; the live hash changes with them
+            data, live_hash = source.overlay(data, current_claims_filter())
+            data_hash = f"{data_hash}:{live_hash}"
+        except WarehouseError as e:
+            st.sidebar.warning(f"Live warehouse query failed, showing the static report. ({e})")
+
+    if data is None:
+        st.error("Report data file not found. Please generate the report first.")
+        return None
+    # Charts drawn in this run are cached against the data they were built from
+    st.session_state.report_hash = data_hash
+    return data
+
+
+@track_cache(st.cache_resource(ttl=60))
+def load_model_performance():
+    """Load the per-model build history written by scripts/collect_model_performance.py"""
+    try:
+        with open("reports/model_performance.json", 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def perf_enabled():
+    """Performance HUD requested with ?perf=1"""
+    return st.query_params.get(QUERY_PARAM) == "1"
+
+
+def perf_timer(name):
+    """Record how long the block takes in this run's profile"""
+    profile = st.session_state.get('perf_profile')
+    return profile.timed(name) if profile is not None else contextlib.nullcontext()
+
+
+@track_cache(st.cache_resource)
+def get_figure_cache():
+    """Process-wide cache of built chart specs (shared by all sessions)"""
+    return FigureCache()
+
+
+@track_cache(st.cache_resource)
+def get_shared_store():
+    """Process-wide read-only store of metric frames (shared by all sessions)"""
+    # Imported here so pandas and pyarrow load with the first page that needs a frame
+    from dashboard.shared_store import SharedStore
+    return SharedStore()
+
+
+@track_cache(st.cache_resource)
+def get_forecast_models():
+    """Process-wide fitted forecasting models, refitted only for new data (shared by all sessions)"""
+    from dashboard.forecasting import ForecastModels
+    return ForecastModels()
+
+
+@track_cache(st.cache_resource)
+def get_roi_simulations():
+    """Process-wide ROI simulation summaries, keyed by scenario (shared by all sessions)"""
+    from dashboard.roi_simulation import ROISimulations
+    return ROISimulations()
+
+
+@track_cache(st.cache_resource)
+def get_event_feed():
+    """Process-wide window of the newest pipeline events, read incrementally from the event log"""
+    from dashboard.event_log import EventFeed
+    return EventFeed()
+
+
+@track_cache(st.cache_resource)
+def get_cache_warmer():
+    """Process-wide warm-up thread (query cache and page imports, again after every dbt run); None when disabled"""
+    from dashboard.warmup import CacheWarmer, warmup_enabled
+    if not warmup_enabled():
+        return None
+    try:
+        source = get_data_source()
+    except WarehouseError:
+        source = None
+    return CacheWarmer(source).start()
+
+
+def shared_frame(page, name, build, version=None):
+    """Read-only DataFrame shared by all sessions; build() runs once per (page, name, data version).
+
+    The version defaults to the report hash of this run, like render_figure's data hash.
+    """
+    if version is None:
+        version = st.session_state.get('report_hash')
+    return get_shared_store().frame((page, name), version, build)
+
+
+def render_figure(page, panel, build, data_hash=None, filters=None, **chart_options):
+    """Draw a chart; build() only runs when (page, panel, data, filters) has not been drawn before.
+
+    chart_options (key, on_select, ...) are passed through to st.plotly_chart.
+    """
+    if data_hash is None:
+        data_hash = st.session_state.get('report_hash')
+    profile = st.session_state.get('perf_profile')
+    with perf_timer(f"chart: {panel}"):
+        fig = get_figure_cache().get_or_build(figure_key(page, panel, data_hash, filters), build)
+        st.plotly_chart(fig, use_container_width=True, **chart_options)
+    if profile is not None and profile.collect_payloads:
+        profile.record_payload(panel, len(fig.to_json()))
+
+
+def file_size(nbytes):
+    """Human-readable file size"""
+    for unit in ('B', 'KB', 'MB'):
+        if nbytes < 1024:
+            return f"{nbytes:,.0f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:,.1f} GB"
+
+
+def render_export(key, file_stem, export, selection):
+    """Download controls: stream the current result set to files, then link to them.
+
+    export(path, fmt) writes the rows, normally a WarehouseDataSource.export_* call, so
+    nothing but one batch passes through this process. selection identifies the filters
+    on screen; an export prepared for another selection or format is not offered. Without
+    DASHBOARD_EXPORTS=1 only a note that downloads are disabled is shown.
+    """
+    from dashboard.exports import (EXPORT_FORMATS, EXPORT_TTL_SECONDS, EXPORTS_ENV_VAR, export_file,
+                                   exports_enabled, remove_export)
+
+    if not exports_enabled():
+        st.caption(f"Downloads are disabled on this deployment ({EXPORTS_ENV_VAR}=1 enables them).")
+        return
+
+    col1, col2, col3 = st.columns([1, 1, 3])
+    fmt = col1.radio("Format", EXPORT_FORMATS, format_func=str.upper, horizontal=True,
+                     key=f"{key}_format", label_visibility="collapsed")
+    if col2.button("Prepare download", key=f"{key}_prepare", use_container_width=True):
+        previous = st.session_state.pop(f"{key}_file", None)
+        if previous is not None:
+            # Links are unauthenticated: keep at most one export per session and panel
+            remove_export(previous[1])
+        try:
+            with st.spinner("Exporting..."):
+                st.session_state[f"{key}_file"] = ((selection, fmt), export_file(file_stem, fmt, export))
+        except (WarehouseError, OSError) as e:
+            st.warning(f"Export failed: {e}")
+            return
+
+    prepared = st.session_state.get(f"{key}_file")
+    if prepared is None or prepared[0] != (selection, fmt) or not prepared[1].directory.exists():
+        return
+    result = prepared[1]
+    links = " · ".join(
+        f'<a href="{html.escape(part.url)}" download="{html.escape(part.file_name)}">'
+        f'⬇️ {html.escape(part.file_name)}</a> ({file_size(part.nbytes)})'
+        for part in result.parts
+    )
+    col3.markdown(f"{links}<br>{result.rows:,} rows", unsafe_allow_html=True)
+    col3.caption(f"Written in {result.seconds:.1f}s"
+                 + (f" as {len(result.parts)} files (the server's size limit per download)"
+                    if len(result.parts) > 1 else "")
+                 + f"; the links expire after {EXPORT_TTL_SECONDS // 60} minutes.")
@@ -0,0 +1,80 @@
+"""
+Claims Data Warehouse - Shared read-only frame store
+Purpose: Keep one copy of every metric frame per process instead of one per session
+
+Every page turned its report section into a fresh DataFrame on every rerun of every
+session, and st.cache_data hands each caller its own unpickled copy, so memory grew with
+the number of open sessions. SharedStore builds each frame once per data version and
+keeps it as an immutable pyarrow Table. frame() wraps the shared Arrow buffers in a new
+DataFrame (pd.ArrowDtype columns) without copying them: a session only pays for the
+DataFrame object, and adding or replacing columns on it never touches the shared data.
+Sessions that miss the same frame at the same time wait for one build.
+"""
+
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+import pyarrow as pa
+
+from dashboard.single_flight import SingleFlight
+
+DEFAULT_MAX_ENTRIES = 128
+
+
+def to_table(data):
+    """Arrow table from a DataFrame or a list of row dicts (same semantics as pd.DataFrame(rows))"""
+    if isinstance(data, pa.Table):
+        return data
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data)
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+class SharedStore:
+    """Thread-safe LRU of immutable Arrow tables keyed by (name, version), shared by all sessions"""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._tables = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    def table(self, name, version, build):
+        """Table for (name, version); build() returns rows or a DataFrame and only runs on a miss"""
+        key = (name, version)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return table
+
+        def build_table():
+            table = to_table(build())
+            with self._lock:
+                self.misses += 1
+                self._tables[key] = table
+                self._tables.move_to_end(key)
+                while len(self._tables) > self.max_entries:
+                    self._tables.popitem(last=False)
+            return table
+
+        return self._flights.do(key, build_table)
+
+    def frame(self, name, version, build):
+        """Zero-copy DataFrame view of the shared table"""
+        return self.table(name, version, build).to_pandas(types_mapper=pd.ArrowDtype)
+
+    def nbytes(self):
+        with self._lock:
+            return sum(table.nbytes for table in self._tables.values())
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+    def __len__(self):
+        return len(self._tables)
@@ -0,0 +1,67 @@
+"""
+Claims Data Warehouse - Request coalescing
+Purpose: Run an expensive computation once when many sessions ask for it at the same time
+
+When a report refresh lands or everyone opens the dashboard at 9am, dozens of sessions
+miss the same cold cache entry within a few milliseconds, and each of them used to run
+the same warehouse query or build the same frame. SingleFlight lets the first caller
+for a key compute while concurrent callers for that key wait for its result (or its
+exception). A waiter can give up after a timeout, so the caller can serve stale data
+instead of queueing behind a slow query.
+"""
+
+import threading
+
+
+class FlightTimeout(TimeoutError):
+    """Waited longer than the timeout for another caller's computation of the same key"""
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one computation"""
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, compute, timeout=None):
+        """compute() once for all concurrent callers of key; waiters raise FlightTimeout after timeout"""
+        with self._lock:
+            self.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if leader:
+            try:
+                flight.result = compute()
+                return flight.result
+            except BaseException as exc:
+                flight.error = exc
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+        if not flight.done.wait(timeout):
+            raise FlightTimeout(f"Gave up waiting for {key!r} after {timeout}s")
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._flights)
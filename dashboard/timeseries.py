@@ -0,0 +1,87 @@
+"""
+Claims Data Warehouse - Long time-series rendering
+Purpose: Keep trend charts interactive over the full claims history
+
+A decade of daily claims is several thousand points per line, and four SVG line charts of
+that size make the browser stall and the page payload balloon. The trends page draws
+every line through trend_line(): the series is reduced server-side with
+Largest-Triangle-Three-Buckets (LTTB), which keeps the peaks and troughs a plain
+every-nth sample drops, to about one point per horizontal pixel, and traces that are
+still large are drawn with WebGL (Scattergl) instead of SVG. Zooming re-fetches the
+visible window from the warehouse at full resolution and downsamples that again.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# About the drawable width of a half-page chart, in pixels
+DEFAULT_MAX_POINTS = 800
+# Above this many points a trace is drawn with WebGL instead of SVG
+WEBGL_THRESHOLD = 500
+
+
+def lttb_indices(x, y, threshold):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps out of (x, y).
+
+    x must be increasing; datetimes should be passed as numbers. The first and last point
+    are always kept. Returns every index when the series already fits the threshold.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Bucket edges for the n - 2 inner points, split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+
+    kept = np.empty(threshold, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        # The third vertex is the average of the next bucket (the last point for the final bucket)
+        if bucket + 2 < len(edges):
+            next_stop = edges[bucket + 2]
+            avg_x = x[stop:next_stop].mean()
+            avg_y = y[stop:next_stop].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        areas = np.abs(
+            (x[previous] - avg_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+    return kept
+
+
+def downsample(df, x, y, max_points=DEFAULT_MAX_POINTS):
+    """Rows of df that LTTB keeps for the line y over x"""
+    valid = df[[x, y]].dropna()
+    if len(valid) <= max_points:
+        return valid
+    x_values = valid[x]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x_values = x_values.astype('int64')
+    return valid.iloc[lttb_indices(x_values.to_numpy(), valid[y].to_numpy(), max_points)]
+
+
+def trend_line(df, x, y, title, color, max_points=DEFAULT_MAX_POINTS,
+               webgl_threshold=WEBGL_THRESHOLD, height=400):
+    """Line chart of y over x, downsampled to max_points and drawn with WebGL when large"""
+    sampled = downsample(df, x, y, max_points)
+    large = len(sampled) > webgl_threshold
+    trace = go.Scattergl if large else go.Scatter
+    fig = go.Figure(trace(
+        x=sampled[x],
+        y=sampled[y],
+        # Markers only help on short series; on thousands of points they are noise
+        mode='lines' if large else 'lines+markers',
+        line=dict(color=color),
+        name=y,
+    ))
+    fig.update_layout(title=title, height=height, xaxis_title=x, yaxis_title=y)
+    return fig
@@ -0,0 +1,36 @@
+"""
+Claims Data Warehouse - Dashboard pages
+Purpose: One module per page, imported the first time the page is opened
+
+streamlit_app.py draws the styling, header and sidebar itself and hands the page body to
+render_page(). A page module - and pandas / plotly express with it - is only imported
+when that page is first shown, so a freshly started process paints the shell and the
+requested page without loading the other eleven.
+"""
+
+import importlib
+
+# Page name -> (module in this package, function drawing the page body from the report data)
+PAGES = {
+    "Executive Summary": ("executive_summary", "render_executive_summary"),
+    "KPI Dashboard": ("kpi_dashboard", "display_kpi_dashboard"),
+    "Predictive Analytics": ("predictive_analytics", "display_predictive_analytics"),
+    "Provider Analysis": ("provider_analysis", "display_provider_analysis"),
+    "Risk Analysis": ("risk_analysis", "display_risk_analysis"),
+    "Claim Type Analysis": ("claim_types", "display_claim_type_analysis"),
+    "Processing Efficiency": ("processing_efficiency", "display_processing_efficiency"),
+    "Chronic Conditions Impact": ("chronic_conditions", "display_chronic_conditions_impact"),
+    "Trends & Patterns": ("trends", "display_trends"),
+    "Data Quality Framework": ("data_quality", "display_data_quality_framework"),
+    "Strategic Recommendations": ("recommendations", "display_recommendations"),
+    "Model Performance": ("model_performance", "display_model_performance"),
+}
+
+
+def render_page(page, data):
+    """Draw the body of `page`; unknown pages draw nothing, as before"""
+    if page not in PAGES:
+        return
+    module_name, function_name = PAGES[page]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    getattr(module, function_name)(data)
@@ -0,0 +1,84 @@
+"""
+Claims Data Warehouse - Chronic Conditions Impact page
+Purpose: Cost and utilization by chronic condition
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard.runtime import render_figure, shared_frame
+
+
+def display_chronic_conditions_impact(data):
+    """Display chronic conditions impact analysis"""
+    st.header("🩺 Chronic Conditions Impact Analysis")
+
+    conditions_data = data.get('member_risk_analysis', {}).get('chronic_conditions_impact', [])
+    if not conditions_data:
+        conditions_data = [
+            {'condition': 'Diabetes', 'members': 1250, 'avg_cost': 8900},
+            {'condition': 'Hypertension', 'members': 2100, 'avg_cost': 6200},
+            {'condition': 'Heart Disease', 'members': 890, 'avg_cost': 15600},
+            {'condition': 'COPD', 'members': 567, 'avg_cost': 12400},
+            {'condition': 'Depression', 'members': 734, 'avg_cost': 4800}
+        ]
+    df_conditions = shared_frame("Chronic Conditions Impact", "conditions", lambda: conditions_data)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Cost by condition count
+        def build_cost_bar():
+            fig_bar = px.bar(
+                df_conditions,
+                x='condition_category',
+                y='avg_cost',
+                title="Average Cost by Chronic Condition Count",
+                color='avg_cost',
+                color_continuous_scale='Greys'
+            )
+            fig_bar.update_layout(
+                height=400,
+                showlegend=False,
+                yaxis_tickformat='$,.0f'
+            )
+            return fig_bar
+
+        render_figure("Chronic Conditions Impact", "cost_by_condition", build_cost_bar)
+
+    with col2:
+        # Claims frequency by condition count
+        def build_cost_scatter():
+            fig_scatter = px.scatter(
+                df_conditions,
+                x='avg_claims',
+                y='avg_cost',
+                size='count',
+                color='condition_category',
+                title="Cost vs Claims by Condition Count",
+                hover_name='condition_category'
+            )
+            fig_scatter.update_layout(height=400)
+            fig_scatter.update_layout(yaxis_tickformat='$,.0f')
+            return fig_scatter
+
+        render_figure("Chronic Conditions Impact", "cost_vs_claims", build_cost_scatter)
+
+    # Impact table
+    st.subheader("Detailed Impact Analysis")
+    display_conditions = df_conditions.copy()
+    display_conditions['avg_cost'] = display_conditions['avg_cost'].apply(lambda x: f"${x:,}")
+    display_conditions['denial_rate'] = display_conditions['denial_rate'].apply(lambda x: f"{x:.2%}")
+
+    st.dataframe(
+        display_conditions,
+        column_config={
+            'condition_category': 'Condition Count',
+            'count': 'Members',
+            'avg_cost': 'Avg Cost',
+            'avg_claims': 'Avg Claims',
+            'denial_rate': 'Denial Rate'
+        },
+        hide_index=True,
+        use_container_width=True
+    )
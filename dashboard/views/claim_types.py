@@ -0,0 +1,96 @@
+"""
+Claims Data Warehouse - Claim Type Analysis page
+Purpose: Claims volume, value and denial rate by claim type
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard.data_sources import WarehouseError
+from dashboard.runtime import current_claims_filter, get_data_source, render_export, render_figure, shared_frame
+
+
+def display_claim_type_analysis(data):
+    """Display claim type breakdown analysis"""
+    st.header("📋 Claim Type Analysis")
+
+    claim_types = data.get('executive_summary', {}).get('claim_type_distribution', [
+        {'type': 'Outpatient', 'count': 28500, 'percentage': 0.57, 'avg_amount': 3200},
+        {'type': 'Inpatient', 'count': 12750, 'percentage': 0.255, 'avg_amount': 15600},
+        {'type': 'Professional', 'count': 8750, 'percentage': 0.175, 'avg_amount': 1800}
+    ])
+    if not claim_types:
+        # Live filters that match no claims
+        st.info("No claims match the current filters.")
+        return
+    df_claims = shared_frame("Claim Type Analysis", "claim_types", lambda: claim_types)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Claim type distribution pie chart
+        def build_type_pie():
+            fig_pie = px.pie(
+                df_claims,
+                values='count',
+                names='claim_type',
+                title="Claims Distribution by Type",
+                color_discrete_sequence=['#5e81ac', '#81a1c1', '#88c0d0']
+            )
+            fig_pie.update_layout(height=400)
+            return fig_pie
+
+        render_figure("Claim Type Analysis", "type_distribution", build_type_pie)
+
+    with col2:
+        # Average value by claim type
+        def build_avg_value_bar():
+            fig_bar = px.bar(
+                df_claims,
+                x='claim_type',
+                y='avg_value',
+                title="Average Claim Value by Type",
+                color='claim_type',
+                color_discrete_sequence=['#5e81ac', '#81a1c1', '#88c0d0']
+            )
+            fig_bar.update_layout(
+                height=400,
+                showlegend=False,
+                yaxis_tickformat='$,.0f'
+            )
+            return fig_bar
+
+        render_figure("Claim Type Analysis", "avg_value_by_type", build_avg_value_bar)
+
+    # Detailed table
+    st.subheader("Detailed Breakdown")
+    display_claims = df_claims.copy()
+    display_claims['total_value'] = display_claims['total_value'].apply(lambda x: f"${x/1000000:.1f}M")
+    display_claims['avg_value'] = display_claims['avg_value'].apply(lambda x: f"${x:,}")
+    display_claims['percentage'] = display_claims['percentage'].apply(lambda x: f"{x:.1f}%")
+    display_claims['denial_rate'] = display_claims['denial_rate'].apply(lambda x: f"{x:.2%}")
+
+    st.dataframe(
+        display_claims[['claim_type', 'count', 'percentage', 'total_value', 'avg_value', 'denial_rate']],
+        column_config={
+            'claim_type': 'Claim Type',
+            'count': 'Count',
+            'percentage': 'Percentage',
+            'total_value': 'Total Value',
+            'avg_value': 'Avg Value',
+            'denial_rate': 'Denial Rate'
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+    # Claim lines behind these numbers, under the current filters (live warehouse only)
+    try:
+        source = get_data_source()
+    except WarehouseError:
+        source = None
+    if source is not None:
+        st.subheader("Download Claims")
+        claims_filter = current_claims_filter()
+        render_export("claim_type_export", "claims",
+                      lambda path, fmt: source.export_claims(path, fmt, claims_filter), claims_filter)
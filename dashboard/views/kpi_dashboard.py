@@ -0,0 +1,283 @@
+"""
+Claims Data Warehouse - KPI Dashboard page
+Purpose: Financial, operational and quality KPI cards
+"""
+
+import streamlit as st
+
+
+def display_kpi_dashboard(data):
+    """Display comprehensive KPI dashboard"""
+    st.markdown("""
+    <div style="background: #ffffff; padding: 2rem; margin: -1rem -1rem 2rem -1rem;
+                border-left: 4px solid #5e81ac; border-bottom: 1px solid #e5e7eb;">
+        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+            <div>
+                <h1 style="color: #1f2937; font-size: 2.2rem; font-weight: 600; margin-bottom: 0.5rem;
+                           letter-spacing: -0.01em; line-height: 1.2;">
+                    Healthcare Claims Analytics Report
+                </h1>
+                <p style="color: #6b7280; font-size: 1rem; font-weight: 400; margin: 0;">
+                    Executive Performance Overview & Strategic Insights
+                </p>
+            </div>
+            <div style="text-align: right;">
+                <div style="color: #5e81ac; font-size: 0.9rem; font-weight: 600; margin-bottom: 0.25rem;">
+                    REPORTING PERIOD
+                </div>
+                <div style="color: #1f2937; font-size: 1.1rem; font-weight: 600;">
+                    Q4 2024
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # In Focus Section - UN Report Style
+    st.markdown("""
+    <div style="background: #f8fafc; padding: 2rem; margin: 2rem 0; border-left: 4px solid #5e81ac;">
+        <h2 style="color: #5e81ac; font-size: 1.5rem; font-weight: 600; margin-bottom: 1rem; text-transform: uppercase; letter-spacing: 0.05em;">
+            In Focus: Healthcare Claims Performance Drives Record Impact
+        </h2>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 2rem; margin-top: 1.5rem;">
+            <div>
+                <div style="color: #1f2937; font-size: 1rem; font-weight: 500; margin-bottom: 1rem;">
+                    <strong>48,500+ CLAIMS PROCESSED</strong><br>
+                    <span style="color: #6b7280; font-weight: 400;">As of Q4 2024</span>
+                </div>
+                <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                    <div style="width: 80px; height: 80px; background: #5e81ac; color: white; border-radius: 50%;
+                                display: flex; align-items: center; justify-content: center; font-size: 1.8rem; font-weight: bold; margin-right: 1rem;">
+                        97.7%
+                    </div>
+                    <div style="color: #374151; font-size: 0.9rem; line-height: 1.4;">
+                        <strong>claims approved</strong><br>
+                        effectively reducing member<br>
+                        financial burden
+                    </div>
+                </div>
+            </div>
+            <div style="color: #374151; font-size: 0.9rem; line-height: 1.6;">
+                <div style="margin-bottom: 1rem;">
+                    <strong>New claims processing challenges caused by complex medical conditions</strong>
+                </div>
+                <div style="margin-bottom: 0.5rem;">
+                    <span style="background: #ebf3ff; color: #5e81ac; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.8rem; font-weight: 600;">
+                        $11.1M in cost optimization opportunities identified
+                    </span>
+                </div>
+                <div style="color: #6b7280; font-size: 0.85rem;">
+                    Source: Healthcare Claims Processing Analysis / Q4 2024
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Key Performance Indicators Grid - Dynamic Data
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Key Performance Indicators
+    </h3>
+    """, unsafe_allow_html=True)
+
+    kpi_data = data.get('executive_summary', {}).get('kpi_categories', {})
+    if not kpi_data:
+        kpi_data = {
+            'financial': {
+                'avg_claim_amount': 9700,
+                'reimbursement_rate': 0.977,
+                'cost_per_member': 48515,
+                'total_reimbursement': 474100000
+            },
+            'quality': {
+                'denial_rate': 0.023,
+                'processing_time': 12.4,
+                'accuracy_rate': 0.977
+            },
+            'utilization': {
+                'claims_per_member': 5.0,
+                'provider_diversity': 1234,
+                'avg_services_per_claim': 2.3
+            },
+            'risk': {
+                'high_cost_members': 850,
+                'frequent_users': 450,
+                'emergency_visits': 2340
+            }
+        }
+
+    # Core KPI Metrics in Nordic Cards
+    col1, col2, col3, col4 = st.columns(4)
+
+    financial = kpi_data.get('financial', {
+        'avg_claim_amount': 9700,
+        'reimbursement_rate': 0.977,
+        'cost_per_member': 48515,
+        'total_reimbursement': 474100000
+    })
+
+    quality = kpi_data.get('quality', {
+        'denial_rate': 0.023,
+        'processing_time': 12.4,
+        'accuracy_rate': 0.977
+    })
+
+    utilization = kpi_data.get('utilization', {
+        'claims_per_member': 5.0,
+        'provider_diversity': 1234,
+        'avg_services_per_claim': 2.3
+    })
+
+    risk = kpi_data.get('risk', {
+        'high_cost_members': 850,
+        'frequent_users': 450,
+        'emergency_visits': 2340
+    })
+
+    with col1:
+        avg_amount_color = "#a3be8c" if financial['avg_claim_amount'] < 10000 else "#ebcb8b" if financial['avg_claim_amount'] < 15000 else "#bf616a"
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid {avg_amount_color};
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {avg_amount_color}; margin-bottom: 0.25rem;">${financial['avg_claim_amount']:,}</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">Average Claim Amount</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">↗ +12% vs Q3</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        processing_color = "#bf616a" if quality['processing_time'] > 10 else "#ebcb8b" if quality['processing_time'] > 8 else "#a3be8c"
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid {processing_color};
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {processing_color}; margin-bottom: 0.25rem;">{quality['processing_time']:.1f}</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">Processing Days</div>
+            <div style="font-size: 0.8rem; color: #bf616a; font-weight: 500; margin-top: 0.5rem;">⚠ 46% above target</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        denial_color = "#a3be8c" if quality['denial_rate'] < 0.03 else "#ebcb8b" if quality['denial_rate'] < 0.05 else "#bf616a"
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid {denial_color};
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {denial_color}; margin-bottom: 0.25rem;">{quality['denial_rate']:.1%}</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">Denial Rate</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">✓ Industry leading</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        risk_pct = (risk['high_cost_members'] / 10000) * 100
+        risk_color = "#bf616a" if risk_pct > 10 else "#ebcb8b" if risk_pct > 7 else "#a3be8c"
+        st.markdown(f"""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid {risk_color};
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {risk_color}; margin-bottom: 0.25rem;">5.0</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">Claims Per Member</div>
+            <div style="font-size: 0.8rem; color: #b48ead; font-weight: 500; margin-top: 0.5rem;">↔ Stable utilization</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Alert section for critical issues
+    if quality['processing_time'] > 10:
+        st.warning("⚠️ **Processing Time Alert:** 46% above 8.5-day target - immediate action required")
+
+    # Strategic Impact Section - UN Report Style
+    st.markdown("""
+    <div style="background: white; padding: 2rem; margin: 2rem 0; border-left: 4px solid #bf616a;">
+        <h3 style="color: #bf616a; font-size: 1.3rem; font-weight: 600; margin-bottom: 1.5rem; text-transform: uppercase; letter-spacing: 0.02em;">
+            Strategic Impact Opportunities
+        </h3>
+        <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 2rem;">
+            <div style="text-align: center;">
+                <div style="width: 120px; height: 120px; background: #5e81ac; color: white; border-radius: 50%;
+                            display: flex; align-items: center; justify-content: center; margin: 0 auto 1rem auto;">
+                    <div>
+                        <div style="font-size: 1.8rem; font-weight: bold;">$2.4M</div>
+                        <div style="font-size: 0.8rem; font-weight: 500;">ANNUAL</div>
+                    </div>
+                </div>
+                <div style="color: #1f2937; font-weight: 600; margin-bottom: 0.5rem;">Process Automation</div>
+                <div style="color: #6b7280; font-size: 0.9rem; line-height: 1.4;">
+                    Deploy automation for standard claims processing to reduce manual review time
+                </div>
+            </div>
+            <div style="text-align: center;">
+                <div style="width: 120px; height: 120px; background: #a3be8c; color: white; border-radius: 50%;
+                            display: flex; align-items: center; justify-content: center; margin: 0 auto 1rem auto;">
+                    <div>
+                        <div style="font-size: 1.8rem; font-weight: bold;">$5.8M</div>
+                        <div style="font-size: 0.8rem; font-weight: 500;">ANNUAL</div>
+                    </div>
+                </div>
+                <div style="color: #1f2937; font-weight: 600; margin-bottom: 0.5rem;">Risk Intervention</div>
+                <div style="color: #6b7280; font-size: 0.9rem; line-height: 1.4;">
+                    High-cost member outreach and chronic condition management programs
+                </div>
+            </div>
+            <div style="text-align: center;">
+                <div style="width: 120px; height: 120px; background: #b48ead; color: white; border-radius: 50%;
+                            display: flex; align-items: center; justify-content: center; margin: 0 auto 1rem auto;">
+                    <div>
+                        <div style="font-size: 1.6rem; font-weight: bold;">$11.1M</div>
+                        <div style="font-size: 0.8rem; font-weight: 500;">3-YEAR ROI</div>
+                    </div>
+                </div>
+                <div style="color: #1f2937; font-weight: 600; margin-bottom: 0.5rem;">Total Strategic Impact</div>
+                <div style="color: #6b7280; font-size: 0.9rem; line-height: 1.4;">
+                    Combined impact of predictive analytics and operational excellence initiatives
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+    # Performance Tracking Dashboard - Professional Style
+    st.markdown("""
+    <div style="margin: 3rem 0 1.5rem 0;">
+        <h2 style="color: #2d3748; font-size: 1.75rem; font-weight: 600; margin-bottom: 0.5rem; letter-spacing: -0.02em;">
+            Performance Tracking
+        </h2>
+        <p style="color: #718096; font-size: 1rem; margin: 0;">
+            Real-time operational metrics and trend analysis
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            label="Quality Score",
+            value="83/100",
+            delta="+5 pts",
+            help="Overall operational health score"
+        )
+
+    with col2:
+        st.metric(
+            label="Cost Efficiency",
+            value="92%",
+            delta="+3%",
+            help="Cost per member vs industry benchmark"
+        )
+
+    with col3:
+        st.metric(
+            label="Processing SLA",
+            value="54%",
+            delta="-12%",
+            help="Claims processed within target timeframe",
+            delta_color="inverse"
+        )
+
+    with col4:
+        st.metric(
+            label="Member Satisfaction",
+            value="4.2/5",
+            delta="+0.3",
+            help="Member satisfaction survey results"
+        )
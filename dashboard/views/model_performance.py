@@ -0,0 +1,159 @@
+"""
+Claims Data Warehouse - Model Performance page
+Purpose: dbt model build times and query plans over time
+"""
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard.runtime import load_model_performance, render_figure, shared_frame
+
+
+def display_model_performance(data=None):
+    """Display per-model dbt build times and query plan changes across runs"""
+    st.header("⏱️ Model Performance")
+
+    history = load_model_performance()
+    if not history or not history.get('runs'):
+        st.info("No model performance history yet. After a dbt run, capture plans and build stats with "
+                "`python scripts/collect_model_performance.py`.")
+        return
+
+    history_hash = f"{history.get('updated_at')}:{len(history['runs'])}"
+
+    def build_perf_frame():
+        df_perf = pd.DataFrame([
+            {**model, 'generated_at': run['generated_at'], 'invocation_id': run['invocation_id']}
+            for run in history['runs']
+            for model in run['models']
+        ])
+        if df_perf.empty:
+            return df_perf
+        df_perf['generated_at'] = pd.to_datetime(df_perf['generated_at'])
+        for column in ('total_bytes', 'index_bytes', 'temp_written_blocks', 'disk_sorts'):
+            if column not in df_perf.columns:
+                df_perf[column] = None
+        return df_perf
+
+    df_perf = shared_frame("Model Performance", "history", build_perf_frame, version=history_hash)
+    if df_perf.empty:
+        st.info("The captured runs contain no successfully built models.")
+        return
+    latest_run = history['runs'][-1]
+    df_latest = df_perf[df_perf['invocation_id'] == latest_run['invocation_id']].sort_values(
+        'execution_time', ascending=False)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(label="Runs Captured", value=len(history['runs']))
+
+    with col2:
+        st.metric(label="Latest Build Time", value=f"{df_latest['execution_time'].sum():.1f}s")
+
+    with col3:
+        slowest = df_latest.iloc[0] if not df_latest.empty else None
+        st.metric(
+            label="Slowest Model",
+            value=slowest['model'] if slowest is not None else "-",
+            delta=f"{slowest['execution_time']:.1f}s" if slowest is not None else None,
+            delta_color="off"
+        )
+
+    with col4:
+        st.metric(label="Plan Changes (latest run)", value=int(df_latest['plan_changed'].fillna(False).sum()))
+
+    changed = df_perf[df_perf['plan_changed'].fillna(False).astype(bool)]
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # Build time per model across runs, plan changes marked
+        def build_history_line():
+            fig_history = px.line(
+                df_perf.sort_values('generated_at'),
+                x='generated_at',
+                y='execution_time',
+                color='model',
+                title='Build Time per Model Across Runs',
+                markers=True
+            )
+            if not changed.empty:
+                fig_history.add_trace(go.Scatter(
+                    x=changed['generated_at'],
+                    y=changed['execution_time'],
+                    mode='markers',
+                    name='Plan changed',
+                    marker=dict(symbol='x', size=12, color='#bf616a'),
+                    text=changed['model'],
+                    hovertemplate='%{text}<br>plan changed<br>%{y:.2f}s<extra></extra>'
+                ))
+            fig_history.update_layout(height=400, yaxis_title='Seconds', xaxis_title=None)
+            return fig_history
+
+        render_figure("Model Performance", "build_time_history", build_history_line, data_hash=history_hash)
+
+    with col2:
+        def build_latest_bar():
+            fig_latest = go.Figure(go.Bar(
+                x=df_latest['execution_time'],
+                y=df_latest['model'],
+                orientation='h',
+                marker_color='#5e81ac'
+            ))
+            fig_latest.update_layout(
+                title='Latest Run',
+                height=400,
+                xaxis_title='Seconds',
+                yaxis=dict(autorange='reversed')
+            )
+            return fig_latest
+
+        render_figure("Model Performance", "latest_run", build_latest_bar, data_hash=history_hash)
+
+    # Latest run details
+    st.subheader("🔍 Latest Run Details")
+    display_latest = df_latest.copy()
+    display_latest['total_mb'] = display_latest['total_bytes'].apply(
+        lambda x: f"{x / 1024 / 1024:,.1f}" if pd.notna(x) else "-")
+    display_latest['index_mb'] = display_latest['index_bytes'].apply(
+        lambda x: f"{x / 1024 / 1024:,.1f}" if pd.notna(x) else "-")
+
+    st.dataframe(
+        display_latest[['model', 'materialized', 'execution_time', 'rows_affected', 'total_mb', 'index_mb',
+                        'slowest_node', 'disk_sorts', 'temp_written_blocks', 'plan_hash', 'plan_changed']],
+        column_config={
+            'model': 'Model',
+            'materialized': 'Type',
+            'execution_time': st.column_config.NumberColumn('Build (s)', format="%.2f"),
+            'rows_affected': st.column_config.NumberColumn('Rows', format="%d"),
+            'total_mb': 'Size (MB)',
+            'index_mb': 'Indexes (MB)',
+            'slowest_node': 'Slowest Plan Node',
+            'disk_sorts': 'Disk Sorts',
+            'temp_written_blocks': 'Temp Blocks',
+            'plan_hash': 'Plan Hash',
+            'plan_changed': 'Plan Changed'
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+    # Plan change log
+    if not changed.empty:
+        st.subheader("🔀 Plan Changes")
+        st.dataframe(
+            changed.sort_values('generated_at', ascending=False)[
+                ['generated_at', 'model', 'plan_hash', 'execution_time', 'slowest_node']],
+            column_config={
+                'generated_at': 'Run',
+                'model': 'Model',
+                'plan_hash': 'New Plan Hash',
+                'execution_time': st.column_config.NumberColumn('Build (s)', format="%.2f"),
+                'slowest_node': 'Slowest Plan Node'
+            },
+            hide_index=True,
+            use_container_width=True
+        )
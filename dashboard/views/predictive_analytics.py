@@ -0,0 +1,353 @@
+"""
+Claims Data Warehouse - Predictive Analytics page
+Purpose: Forecasts and predictive indicators
+
+In live warehouse mode the cost trajectory is a Holt-Winters forecast of the monthly claim
+cost in metrics_claims_cube, fitted in one batch per (claim type, state) segment and for
+every per-type, per-state and total series (dashboard/forecasting.py), scoped by the global
+claim type / state filter. Without a warehouse the page shows the illustrative trajectory.
+"""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard.data_sources import WarehouseError
+from dashboard.forecasting import TOTAL, matrix_version, segment_matrix
+from dashboard.runtime import (current_claims_filter, get_data_source, get_forecast_models, render_figure,
+                               shared_frame)
+
+FORECAST_MONTHS = 12
+# Share of the projected cost the intervention programme saves: the gap between the
+# no-intervention and with-intervention scenarios of the original cost trajectory
+INTERVENTION_SAVINGS_RATE = 0.07
+
+
+def load_forecast():
+    """(history, forecasts, projections, version, seasonal) for every segment series, or None without a warehouse.
+
+    history has one row per (claim_type, state_code, month) with the actual cost; forecasts one
+    row per (claim_type, state_code, month) ahead with the point forecast and the half width of
+    its 95% interval; projections one row per (claim_type, state_code) with the forecast total
+    over FORECAST_MONTHS and the half width of its 95% interval. All are shared by all sessions
+    until the monthly data changes.
+    """
+    try:
+        source = get_data_source()
+        rows = source.monthly_segments() if source is not None else None
+    except WarehouseError as e:
+        st.warning(f"Live forecast unavailable, showing the illustrative trajectory. ({e})")
+        return None
+    if not rows:
+        return None
+    labels, months, matrix = segment_matrix(rows)
+    if len(months) < 2:
+        return None
+
+    version = matrix_version(matrix)
+    index = pd.MultiIndex.from_tuples(labels, names=['claim_type', 'state_code'])
+
+    def build_history():
+        history = pd.DataFrame(matrix, index=index, columns=pd.to_datetime(months))
+        return history.rename_axis(columns='month').stack().rename('actual').reset_index()
+
+    def build_forecasts():
+        fit = get_forecast_models().fit(matrix)
+        ahead = pd.date_range(pd.Timestamp(months[-1]) + pd.offsets.MonthBegin(), periods=FORECAST_MONTHS,
+                              freq='MS', name='month')
+        # A falling trend can extrapolate below zero; costs cannot
+        mean = pd.DataFrame(fit.mean(FORECAST_MONTHS).clip(min=0), index=index, columns=ahead).stack().rename('forecast')
+        half_width = pd.DataFrame(fit.half_width(FORECAST_MONTHS), index=index, columns=ahead).stack()
+        return mean.to_frame().assign(half_width=half_width).reset_index()
+
+    def build_projections():
+        fit = get_forecast_models().fit(matrix)
+        # Monthly errors of one series are correlated, so the interval of their total comes
+        # from the model, not from the monthly half widths
+        return pd.DataFrame({
+            'forecast': fit.mean(FORECAST_MONTHS).clip(min=0).sum(axis=1),
+            'half_width': fit.total_half_width(FORECAST_MONTHS),
+        }, index=index).reset_index()
+
+    history = shared_frame("Predictive Analytics", "forecast_history", build_history, version=version)
+    forecasts = shared_frame("Predictive Analytics", "segment_forecasts", build_forecasts, version=version)
+    projections = shared_frame("Predictive Analytics", "segment_projections", build_projections, version=version)
+    return history, forecasts, projections, version, len(months) >= 24
+
+
+def scope_labels(filters):
+    """(claim_type, state_code) series that add up to the filtered total"""
+    claim_types = filters.claim_types or (TOTAL,)
+    states = filters.states or (TOTAL,)
+    return [(claim_type, state) for claim_type in claim_types for state in states]
+
+
+def scoped(frame, labels):
+    return frame[pd.Series(list(zip(frame['claim_type'], frame['state_code'])), index=frame.index).isin(labels)]
+
+
+def scope_series(history, forecasts, labels):
+    """(actual per month, forecast per month with lower/upper) summed over the scoped series.
+
+    The interval of a sum treats the series as independent (half widths add in quadrature).
+    """
+    actual = scoped(history, labels).groupby('month')['actual'].sum().astype(float)
+    ahead = scoped(forecasts, labels).assign(
+        variance=lambda df: df['half_width'].astype(float) ** 2
+    ).groupby('month').agg(forecast=('forecast', 'sum'), variance=('variance', 'sum'))
+    ahead['forecast'] = ahead['forecast'].astype(float)
+    width = np.sqrt(ahead.pop('variance'))
+    ahead['lower'] = (ahead['forecast'] - width).clip(lower=0)
+    ahead['upper'] = ahead['forecast'] + width
+    return actual, ahead
+
+
+def trailing_year(actual):
+    """Cost of the last 12 months, annualized when there is less history"""
+    recent = actual.tail(12)
+    return recent.sum() * 12 / len(recent)
+
+
+def render_projection_card(projection=None, growth=None):
+    if projection is None:
+        value, detail = "$547M", '<span style="color: var(--nord-11);">↑ 12.8% Growth</span> vs Current'
+    else:
+        color = 'var(--nord-11)' if growth >= 0 else 'var(--nord-14)'
+        value = f"${projection / 1e6:,.1f}M"
+        detail = f'<span style="color: {color};">{"↑" if growth >= 0 else "↓"} {abs(growth):.1%}</span> vs last 12 months'
+    st.markdown(f"""
+    <div class="kpi-card">
+        <div class="kpi-value" style="color: var(--nord-11);">{value}</div>
+        <div class="kpi-label">12-Month Cost Projection</div>
+        <div style="font-size: 0.8rem; color: var(--nord-3); margin-top: 8px;">
+            {detail}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def render_live_forecast(history, forecasts, projections, version, seasonal, filters, labels, actual, ahead):
+    """Forecast chart with its interval, the intervention scenario and per-segment projections"""
+    def build_forecast_chart():
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=ahead.index, y=ahead['upper'], line=dict(width=0), showlegend=False,
+                                 hoverinfo='skip'))
+        fig.add_trace(go.Scatter(x=ahead.index, y=ahead['lower'], line=dict(width=0), fill='tonexty',
+                                 fillcolor='rgba(191, 97, 106, 0.15)', name='95% interval'))
+        fig.add_trace(go.Scatter(x=actual.index, y=actual.values, name='Actual', line=dict(color='#5e81ac')))
+        fig.add_trace(go.Scatter(x=ahead.index, y=ahead['forecast'], name='No Intervention',
+                                 line=dict(color='#bf616a')))
+        fig.add_trace(go.Scatter(x=ahead.index, y=ahead['forecast'] * (1 - INTERVENTION_SAVINGS_RATE),
+                                 name='With Intervention', line=dict(color='#a3be8c', dash='dash')))
+        fig.update_layout(title="Monthly Claim Cost: Actual and Forecast", height=400,
+                          yaxis_title="Claim cost ($)", hovermode='x unified')
+        return fig
+
+    render_figure("Predictive Analytics", "cost_forecast", build_forecast_chart, data_hash=version,
+                  filters={'labels': labels})
+    model = "seasonal Holt-Winters" if seasonal else "Holt trend model (less than two years of history, no season)"
+    st.caption(f"{model} fitted to {forecasts[['claim_type', 'state_code']].drop_duplicates().shape[0]:,} "
+               "segment series at once; parameters are refitted only when the monthly data changes."
+               + (" The specialty filter does not apply to forecasts." if filters.specialties else ""))
+
+    # 12-month projection per claim type and per state
+    trailing = history.groupby(['claim_type', 'state_code'])['actual'].apply(
+        lambda values: trailing_year(values.astype(float)))
+    segments = projections.set_index(['claim_type', 'state_code']).astype(float).rename(
+        columns={'half_width': 'width'}).assign(trailing=trailing).reset_index()
+    marginal = segments[(segments['claim_type'] == TOTAL) != (segments['state_code'] == TOTAL)]
+    table = pd.DataFrame({
+        'Segment': np.where(marginal['state_code'] == TOTAL, marginal['claim_type'], 'State ' + marginal['state_code']),
+        'Next 12 Months ($M)': marginal['forecast'] / 1e6,
+        '95% Low ($M)': (marginal['forecast'] - marginal['width']).clip(lower=0) / 1e6,
+        '95% High ($M)': (marginal['forecast'] + marginal['width']) / 1e6,
+        'Growth (%)': ((marginal['forecast'] / marginal['trailing'] - 1) * 100).replace([np.inf, -np.inf], np.nan),
+    })
+    st.markdown("**Projection by claim type and provider state**")
+    st.dataframe(table.sort_values('Next 12 Months ($M)', ascending=False), hide_index=True,
+                 use_container_width=True,
+                 column_config={column: st.column_config.NumberColumn(format="%.2f")
+                                for column in table.columns if column != 'Segment'})
+
+
+def render_illustrative_trajectory():
+    """Hard-coded trajectory shown without a warehouse"""
+    months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+    # Historical baseline (current year projected)
+    baseline_costs = [40.2, 37.8, 41.1, 39.5, 40.8, 42.1, 38.9, 41.3, 42.8, 40.1, 41.7, 43.2]
+
+    # Predicted costs with no intervention
+    no_intervention = [45.3, 42.7, 46.4, 44.6, 46.1, 47.6, 43.9, 46.7, 48.3, 45.3, 47.1, 48.8]
+
+    # Predicted costs with interventions
+    with_intervention = [42.1, 39.8, 43.2, 41.6, 42.9, 44.2, 40.8, 43.4, 44.9, 42.1, 43.8, 45.3]
+
+    def build_trajectory_line():
+        chart_data = pd.DataFrame({
+            'Month': months,
+            'Historical Baseline ($M)': baseline_costs,
+            'No Intervention ($M)': no_intervention,
+            'With Intervention ($M)': with_intervention
+        })
+
+        fig = px.line(chart_data, x='Month',
+                      y=['Historical Baseline ($M)', 'No Intervention ($M)', 'With Intervention ($M)'],
+                      title="Cost Trajectory Comparison",
+                      color_discrete_sequence=['#5e81ac', '#bf616a', '#a3be8c'])
+
+        fig.update_layout(height=400)
+        return fig
+
+    render_figure("Predictive Analytics", "cost_trajectory", build_trajectory_line)
+    st.caption("Illustrative trajectory. Set DASHBOARD_WAREHOUSE to forecast from metrics_claims_cube.")
+
+
+def display_predictive_analytics(data):
+    """Display predictive analytics and forecasts"""
+    st.header("🔮 Predictive Analytics & Future Outlook")
+
+    forecast = load_forecast()
+    if forecast is not None:
+        history, forecasts, projections, version, seasonal = forecast
+        filters = current_claims_filter()
+        labels = scope_labels(filters)
+        actual, ahead = scope_series(history, forecasts, labels)
+        projection = ahead['forecast'].sum()
+        baseline = trailing_year(actual)
+        growth = projection / baseline - 1 if baseline else 0.0
+
+    # Executive Summary of Predictions
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        if forecast is not None:
+            render_projection_card(projection, growth)
+        else:
+            render_projection_card()
+
+    with col2:
+        st.markdown("""
+        <div class="kpi-card">
+            <div class="kpi-value" style="color: var(--nord-12);">15%</div>
+            <div class="kpi-label">High-Risk Member Growth</div>
+            <div style="font-size: 0.8rem; color: var(--nord-3); margin-top: 8px;">
+                Industry: 8% | <span style="color: var(--nord-11);">⚠️ 87% Higher</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="kpi-card">
+            <div class="kpi-value" style="color: var(--nord-14);">$14.3M</div>
+            <div class="kpi-label">Intervention Savings Potential</div>
+            <div style="font-size: 0.8rem; color: var(--nord-3); margin-top: 8px;">
+                ROI: 572% | <span style="color: var(--nord-14);">✅ High Return</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Cost Projection Chart
+    st.subheader("📈 12-Month Cost Trajectory Analysis")
+
+    if forecast is not None:
+        render_live_forecast(history, forecasts, projections, version, seasonal, filters, labels, actual, ahead)
+    else:
+        render_illustrative_trajectory()
+
+    # Risk Factors Analysis
+    st.subheader("⚠️ Key Risk Factors")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.markdown("**🚨 Critical Risk Drivers**")
+        st.write("• **High-Risk Member Growth**: 15% annually (vs 8% industry)")
+        st.write("• **Emergency Visit Increase**: +22% projected")
+        st.write("• **Chronic Condition Complications**: +18% growth")
+        st.write("• **Processing Delays**: 46% slower than industry standard")
+        st.write("• **Provider Network Issues**: 20% need improvement")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.markdown("**💡 Optimization Opportunities**")
+        st.write("• **AI Processing**: 65% of claims can be automated")
+        st.write("• **Provider Focus**: Top 20% handle 60% volume efficiently")
+        st.write("• **Case Management**: 35% of escalations preventable")
+        st.write("• **Member Engagement**: Proactive care reduces costs 25%")
+        st.write("• **Network Optimization**: Value-based contracts available")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Predictive Models
+    st.subheader("🤖 Machine Learning Insights")
+
+    # Member Risk Prediction
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Risk distribution prediction
+        def build_risk_bar():
+            risk_data = pd.DataFrame({
+                'Risk Level': ['High Risk', 'Medium Risk', 'Low Risk'],
+                'Current (%)': [8.5, 23.4, 68.1],
+                'Predicted 12M (%)': [9.8, 25.1, 65.1],
+                'Cost Impact ($M)': [242, 89, 15]
+            })
+
+            fig_risk = px.bar(risk_data, x='Risk Level', y=['Current (%)', 'Predicted 12M (%)'],
+                              title="Risk Distribution: Current vs Predicted",
+                              color_discrete_sequence=['#5e81ac', '#81a1c1'],
+                              barmode='group')
+            fig_risk.update_layout(height=400)
+            return fig_risk
+
+        render_figure("Predictive Analytics", "risk_distribution", build_risk_bar)
+
+    with col2:
+        # Cost prediction by intervention
+        def build_intervention_bar():
+            intervention_data = pd.DataFrame({
+                'Intervention': ['No Action', 'Partial Implementation', 'Full Implementation'],
+                'Annual Cost ($M)': [547, 489, 432],
+                'Savings ($M)': [0, 58, 115],
+                'ROI (%)': [0, 280, 572]
+            })
+
+            fig_intervention = px.bar(intervention_data, x='Intervention', y='Annual Cost ($M)',
+                                      title="Cost Impact of Intervention Scenarios",
+                                      color='Savings ($M)',
+                                      color_continuous_scale='RdYlGn')
+            fig_intervention.update_layout(height=400)
+            return fig_intervention
+
+        render_figure("Predictive Analytics", "intervention_scenarios", build_intervention_bar)
+
+    # Alerts and Recommendations
+    st.subheader("🚨 Predictive Alerts & Recommendations")
+
+    # High priority alerts
+    st.markdown("""
+    <div class="recommendation-list" style="background: linear-gradient(90deg, #fdebeb 0%, #ffffff 100%); border-left: 4px solid #e74c3c;">
+        <h4 style="color: #c0392b;">🚨 URGENT: Processing Bottleneck Alert</h4>
+        <p><strong>Prediction:</strong> Current processing delays will increase member complaints by 35% in next quarter</p>
+        <p><strong>Impact:</strong> Estimated 12% member retention risk, $8.2M revenue exposure</p>
+        <p><strong>Action Required:</strong> Implement automated processing within 90 days</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Medium priority opportunities
+    st.markdown("""
+    <div class="recommendation-list" style="background: linear-gradient(90deg, #fef5e7 0%, #ffffff 100%); border-left: 4px solid #f39c12;">
+        <h4 style="color: #d68910;">⚠️ OPPORTUNITY: High-Risk Member Intervention</h4>
+        <p><strong>Prediction:</strong> 850 high-risk members will cost $35,570 each by year-end (+25% vs current)</p>
+        <p><strong>Impact:</strong> Without intervention, total high-risk costs reach $30.2M</p>
+        <p><strong>Action Required:</strong> Deploy case management program within 60 days</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,69 @@
+"""
+Claims Data Warehouse - Processing Efficiency page
+Purpose: Processing times and throughput
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from dashboard.runtime import render_figure, shared_frame
+
+
+def display_processing_efficiency(data):
+    """Display processing efficiency analysis"""
+    st.header("⚡ Processing Efficiency Analysis")
+
+    processing_data = data.get('operational_analysis', {}).get('processing_efficiency', {})
+    if not processing_data:
+        processing_data = {
+            'avg_processing_days': 12.4,
+            'denial_rate': 0.023,
+            'auto_processed': 0.78,
+            'manual_review': 0.22
+        }
+    df_processing = shared_frame("Processing Efficiency", "processing", lambda: processing_data)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Processing time distribution
+        def build_speed_pie():
+            fig_pie = px.pie(
+                df_processing,
+                values='count',
+                names='category',
+                title="Claims by Processing Speed",
+                color_discrete_sequence=['#5e81ac', '#81a1c1', '#88c0d0', '#8fbcbb']
+            )
+            fig_pie.update_layout(height=400)
+            return fig_pie
+
+        render_figure("Processing Efficiency", "processing_speed", build_speed_pie)
+
+    with col2:
+        # Denial rate by processing speed
+        def build_denial_bar():
+            fig_bar = px.bar(
+                df_processing,
+                x='category',
+                y='denial_rate',
+                title="Denial Rate by Processing Speed",
+                color='denial_rate',
+                color_continuous_scale='Greys'
+            )
+            fig_bar.update_layout(height=400, showlegend=False)
+            fig_bar.update_layout(
+                yaxis_tickformat='.1%',
+                xaxis_tickangle=45
+            )
+            return fig_bar
+
+        render_figure("Processing Efficiency", "denial_by_speed", build_denial_bar)
+
+    # Efficiency insights
+    st.markdown('<div class="insight-box">', unsafe_allow_html=True)
+    st.subheader("⚡ Processing Insights")
+    st.write(f"**Fast Processing (≤7 days):** {df_processing[df_processing['category'] == 'Fast (≤7 days)']['percentage'].iloc[0]:.1f}% of claims")
+    st.write(f"**Slow Processing (>15 days):** {df_processing[df_processing['category'].str.contains('Slow')]['percentage'].sum():.1f}% requiring optimization")
+    st.write("**Correlation:** Slower processing correlates with higher denial rates")
+    st.markdown('</div>', unsafe_allow_html=True)
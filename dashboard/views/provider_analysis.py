@@ -0,0 +1,305 @@
+"""
+Claims Data Warehouse - Provider Analysis page
+Purpose: Provider rankings, quality analysis and the live provider directory
+"""
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from dashboard.data_sources import WarehouseError
+from dashboard.runtime import get_data_source, render_export, render_figure, shared_frame
+
+
+# Provider directory (live warehouse mode): rows per page and sortable columns
+PROVIDER_PAGE_SIZE = 50
+PROVIDER_SORT_LABELS = {
+    'total_claims': 'Claims Volume',
+    'total_claim_amount': 'Total Billed',
+    'avg_claim_amount': 'Avg Amount',
+    'denial_rate': 'Denial Rate',
+}
+
+
+@st.fragment
+def render_provider_directory_panel():
+    """Full provider network: filtered, sorted and keyset-paged in the warehouse, one page at a time"""
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 3rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Provider Network Directory
+    </h3>
+    """, unsafe_allow_html=True)
+
+    try:
+        source = get_data_source()
+        options = source.provider_filter_options() if source is not None else None
+    except WarehouseError as e:
+        st.warning(f"Provider directory unavailable: {e}")
+        return
+    if source is None:
+        st.caption("Set DASHBOARD_WAREHOUSE to browse the full provider network from metrics_provider_performance.")
+        return
+
+    col1, col2, col3, col4, col5, col6 = st.columns([2, 1, 2, 2, 2, 1])
+    specialty = col1.selectbox("Specialty", ["All"] + options['specialty'], key="provider_grid_specialty")
+    state = col2.selectbox("State", ["All"] + options['state'], key="provider_grid_state")
+    tier = col3.selectbox("Performance Tier", ["All"] + options['tier'], key="provider_grid_tier")
+    name_prefix = col4.text_input("Name starts with", key="provider_grid_name").strip().upper()
+    sort = col5.selectbox("Sort by", list(PROVIDER_SORT_LABELS), format_func=PROVIDER_SORT_LABELS.get,
+                          key="provider_grid_sort")
+    descending = col6.toggle("Descending", value=True, key="provider_grid_descending")
+
+    filters = {
+        'specialty': None if specialty == "All" else specialty,
+        'state': None if state == "All" else state,
+        'tier': None if tier == "All" else tier,
+        'name_prefix': name_prefix or None,
+    }
+
+    # cursors[i] is where page i+1 starts; a new filter or sort starts again from page 1
+    query = (sort, descending, tuple(filters.items()))
+    if st.session_state.get('provider_grid_query') != query:
+        st.session_state.provider_grid_query = query
+        st.session_state.provider_grid_cursors = [None]
+    cursors = st.session_state.provider_grid_cursors
+
+    try:
+        rows, next_cursor = source.provider_page(sort, descending, after=cursors[-1],
+                                                 limit=PROVIDER_PAGE_SIZE, **filters)
+        total = source.provider_count(**filters)
+    except WarehouseError as e:
+        st.warning(f"Provider directory unavailable: {e}")
+        return
+
+    if not rows:
+        st.info("No providers match these filters.")
+    else:
+        df_page = pd.DataFrame(rows)
+        df_page['denial_rate'] = df_page['denial_rate'].astype(float) * 100
+        st.dataframe(
+            df_page[['provider_name', 'specialty_description', 'state_code', 'total_claims',
+                     'total_claim_amount', 'avg_claim_amount', 'denial_rate', 'performance_tier']],
+            column_config={
+                'provider_name': 'Provider Name',
+                'specialty_description': 'Specialty',
+                'state_code': 'State',
+                'total_claims': st.column_config.NumberColumn('Claims Volume', format="%d"),
+                'total_claim_amount': st.column_config.NumberColumn('Total Billed', format="$%.0f"),
+                'avg_claim_amount': st.column_config.NumberColumn('Avg Amount', format="$%.2f"),
+                'denial_rate': st.column_config.NumberColumn('Denial Rate', format="%.1f%%"),
+                'performance_tier': 'Performance Tier'
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+    col1, col2, col3 = st.columns([1, 4, 1])
+    col1.button("◀ Previous", key="provider_grid_previous", disabled=len(cursors) == 1,
+                on_click=cursors.pop, use_container_width=True)
+    col2.caption(f"Page {len(cursors)} of {max(1, -(-total // PROVIDER_PAGE_SIZE)):,} · {total:,} providers")
+    col3.button("Next ▶", key="provider_grid_next", disabled=next_cursor is None,
+                on_click=cursors.append, args=(next_cursor,), use_container_width=True)
+
+    # The whole filtered directory, not just this page, streamed from the warehouse
+    render_export("provider_grid_export", "providers",
+                  lambda path, fmt: source.export_providers(path, fmt, sort, descending, **filters), query)
+
+
+def display_provider_analysis(data):
+    """Display provider performance analysis in UN report style"""
+    # UN Report Style Header
+    st.markdown("""
+    <div style="background: white; padding: 2rem; border-left: 4px solid #5e81ac; margin-bottom: 2rem;">
+        <h1 style="color: #1f2937; font-size: 2.5rem; font-weight: 700; margin: 0 0 0.5rem 0; text-align: left;">
+            🏥 PROVIDER PERFORMANCE ANALYSIS
+        </h1>
+        <p style="color: #6b7280; font-size: 1.1rem; margin: 0; text-align: left;">
+            Healthcare Network Quality Assessment & Provider Rankings
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Key Provider Metrics - UN Style Cards
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Provider Network Overview
+    </h3>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #5e81ac;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #5e81ac; margin-bottom: 0.25rem;">1,234</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">TOTAL PROVIDERS</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">Contracted Network</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #a3be8c;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #a3be8c; margin-bottom: 0.25rem;">97.2%</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">QUALITY SCORE</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">Network Average</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #d08770;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #d08770; margin-bottom: 0.25rem;">$9.7K</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">AVG CLAIM AMOUNT</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">Per Provider</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #b48ead;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #b48ead; margin-bottom: 0.25rem;">2.1%</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">DENIAL RATE</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">Below Benchmark</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Provider Performance Table - UN Style
+    providers = data.get('provider_analysis', {}).get('top_providers', [])
+    if not providers:
+        providers = [
+            {'rank': 1, 'name': 'Metro Hospital', 'specialty': 'Cardiology', 'claims': 234, 'avg_amount': 5678, 'denial_rate': 0.015, 'performance_tier': 'Elite'},
+            {'rank': 2, 'name': 'Central Clinic', 'specialty': 'Primary Care', 'claims': 187, 'avg_amount': 3456, 'denial_rate': 0.018, 'performance_tier': 'High'},
+            {'rank': 3, 'name': 'West Medical', 'specialty': 'Orthopedics', 'claims': 156, 'avg_amount': 6789, 'denial_rate': 0.021, 'performance_tier': 'High'},
+            {'rank': 4, 'name': 'East Surgery', 'specialty': 'Surgery', 'claims': 143, 'avg_amount': 8901, 'denial_rate': 0.024, 'performance_tier': 'Standard'},
+            {'rank': 5, 'name': 'North Wellness', 'specialty': 'Wellness', 'claims': 128, 'avg_amount': 2345, 'denial_rate': 0.019, 'performance_tier': 'High'}
+        ]
+
+    df_providers = shared_frame("Provider Analysis", "top_providers", lambda: providers)
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        st.markdown("""
+        <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+            Top Provider Performance Rankings
+        </h3>
+        """, unsafe_allow_html=True)
+
+        # Format the data for display
+        display_df = df_providers.copy()
+        display_df['avg_amount'] = display_df['avg_amount'].apply(lambda x: f"${x:,}")
+        display_df['denial_rate'] = display_df['denial_rate'].apply(lambda x: f"{x:.1%}")
+
+        st.dataframe(
+            display_df[['rank', 'name', 'specialty', 'claims', 'avg_amount', 'denial_rate', 'performance_tier']],
+            column_config={
+                'rank': 'Rank',
+                'name': 'Provider Name',
+                'specialty': 'Specialty',
+                'claims': 'Claims Volume',
+                'avg_amount': 'Avg Amount',
+                'denial_rate': 'Denial Rate',
+                'performance_tier': 'Performance Tier'
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+    with col2:
+        st.markdown("""
+        <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+            Performance Tiers
+        </h3>
+        """, unsafe_allow_html=True)
+
+        # Performance tier distribution with UN colors
+        def build_tier_pie():
+            perf_counts = df_providers['performance_tier'].value_counts()
+
+            fig = px.pie(
+                values=perf_counts.values,
+                names=perf_counts.index,
+                color_discrete_sequence=['#5e81ac', '#a3be8c', '#d08770', '#b48ead']
+            )
+            fig.update_layout(
+                height=350,
+                showlegend=True,
+                font=dict(color='#1f2937'),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)'
+            )
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            return fig
+
+        render_figure("Provider Analysis", "performance_tiers", build_tier_pie)
+
+    # Full provider network, paged in the warehouse
+    render_provider_directory_panel()
+
+    # Provider Quality Analysis - UN Style Section
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 3rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Provider Network Quality Assessment
+    </h3>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #5e81ac; margin-bottom: 1rem;">
+            <h4 style="color: #5e81ac; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                Elite Providers
+            </h4>
+            <div style="font-size: 2rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">20%</div>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Handle 60% of total volume with exceptional outcomes
+            </div>
+            <div style="color: #a3be8c; font-size: 0.8rem; font-weight: 500;">
+                ✓ <1.5% denial rate<br>
+                ✓ >95% satisfaction<br>
+                ✓ Fast processing
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #a3be8c; margin-bottom: 1rem;">
+            <h4 style="color: #a3be8c; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                High Performers
+            </h4>
+            <div style="font-size: 2rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">60%</div>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Standard network providers meeting quality benchmarks
+            </div>
+            <div style="color: #a3be8c; font-size: 0.8rem; font-weight: 500;">
+                ✓ 1.5-3% denial rate<br>
+                ✓ >90% satisfaction<br>
+                ✓ Standard processing
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #d08770; margin-bottom: 1rem;">
+            <h4 style="color: #d08770; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                Improvement Needed
+            </h4>
+            <div style="font-size: 2rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">20%</div>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Providers requiring quality enhancement programs
+            </div>
+            <div style="color: #d08770; font-size: 0.8rem; font-weight: 500;">
+                ⚠ >3% denial rate<br>
+                ⚠ <90% satisfaction<br>
+                ⚠ Training required
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,338 @@
+"""
+Claims Data Warehouse - Strategic Recommendations page
+Purpose: Prioritized strategic recommendations
+
+The impact summary is a Monte Carlo simulation (dashboard/roi_simulation.py) of the three
+priority recommendations: 100,000 scenarios of effect size, cost base and budget overrun
+give the savings, ROI and payback as a median with a 90% range, and the scenario sliders
+rerun only that section.
+"""
+
+import math
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard.roi_simulation import DEFAULT_SCENARIOS, Intervention, Scenario
+from dashboard.runtime import get_roi_simulations, render_figure
+
+# Planned investment, the annual cost each recommendation acts on and the share of it
+# saved (low, most likely, high); the most likely case reproduces the planned savings
+INTERVENTIONS = (
+    Intervention("Processing Efficiency Automation", investment=850_000, cost_base=12_800_000,
+                 effect=(0.15, 0.25, 0.35), lead_months=3),
+    Intervention("High-Risk Member Case Management", investment=1_200_000, cost_base=30_000_000,
+                 effect=(0.14, 0.29, 0.44), cost_cv=0.15, lead_months=2),
+    Intervention("Provider Network Optimization", investment=450_000, cost_base=24_000_000,
+                 effect=(0.05, 0.10, 0.15), lead_months=6),
+)
+SCENARIO_COUNTS = (DEFAULT_SCENARIOS, 250_000, 500_000, 1_000_000)
+
+
+def millions(value):
+    """$ amount as $X.XM"""
+    return f"${value / 1e6:.1f}M"
+
+
+def impact_card(value, label, note, color):
+    """One Strategic Impact Summary card"""
+    st.markdown(f"""
+    <div style="background: white; padding: 1.5rem; border-left: 3px solid {color};
+                margin-bottom: 1rem; text-align: left;">
+        <div style="font-size: 2.5rem; font-weight: 700; color: {color}; margin-bottom: 0.25rem;">{value}</div>
+        <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">{label}</div>
+        <div style="font-size: 0.8rem; color: {color}; font-weight: 500; margin-top: 0.5rem;">{note}</div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+def scenario_sliders():
+    """Scenario from the executive sliders"""
+    col1, col2, col3, col4, col5 = st.columns(5)
+    with col1:
+        effect = st.slider("Effect size vs plan", 50, 150, 100, step=5, format="%d%%", key="roi_effect_scale")
+    with col2:
+        adoption = st.slider("Adoption", 25, 100, 100, step=5, format="%d%%", key="roi_adoption")
+    with col3:
+        cost_trend = st.slider("Addressable cost change", -20, 20, 0, step=1, format="%d%%", key="roi_cost_trend")
+    with col4:
+        overrun = st.slider("Worst-case budget overrun", 0, 100, 25, step=5, format="%d%%", key="roi_overrun")
+    with col5:
+        n_scenarios = st.select_slider("Scenarios", options=SCENARIO_COUNTS, value=DEFAULT_SCENARIOS,
+                                       format_func=lambda n: f"{n:,}", key="roi_scenarios")
+    return Scenario(effect_scale=effect / 100, adoption=adoption / 100, cost_trend=cost_trend / 100,
+                    overrun=overrun / 100, n_scenarios=n_scenarios)
+
+
+@st.fragment
+def render_roi_simulator():
+    """Simulated impact cards and savings ranges; moving a slider reruns only this section"""
+    scenario = scenario_sliders()
+    summary = get_roi_simulations().run(INTERVENTIONS, scenario)
+
+    def span(values, fmt):
+        return f"90% range {fmt(values[0])} – {fmt(values[2])}"
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        impact_card(millions(summary.total_savings[1]), "TOTAL ANNUAL SAVINGS",
+                    span(summary.total_savings, millions), "#a3be8c")
+    with col2:
+        impact_card(millions(summary.total_investment[1]), "TOTAL INVESTMENT",
+                    span(summary.total_investment, millions), "#d08770")
+    with col3:
+        impact_card(f"{summary.total_roi[1]:.0%}", "ANNUAL ROI",
+                    span(summary.total_roi, lambda roi: f"{roi:.0%}"), "#5e81ac")
+    def payback(months):
+        return f"{months:.1f}" if math.isfinite(months) else "never"
+
+    with col4:
+        impact_card(payback(summary.payback_months[1]), "PAYBACK MONTHS",
+                    span(summary.payback_months, payback), "#b48ead")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        def build_savings_ranges():
+            low, median, high = summary.savings.T / 1e6
+            fig = go.Figure(go.Bar(
+                x=median, y=list(summary.names), orientation='h', marker_color='#5e81ac',
+                error_x=dict(type='data', symmetric=False, array=high - median, arrayminus=median - low),
+                customdata=list(zip(low, high, summary.break_even)),
+                hovertemplate="%{y}<br>Median $%{x:.1f}M<br>90% range $%{customdata[0]:.1f}M – "
+                              "$%{customdata[1]:.1f}M<br>Pays back in year 1: %{customdata[2]:.0%}<extra></extra>",
+            ))
+            fig.update_layout(title="Annual Savings by Recommendation (median, 90% range)", height=400,
+                              xaxis_title="Annual savings ($M)", yaxis=dict(autorange='reversed'))
+            return fig
+
+        render_figure("Strategic Recommendations", "savings_ranges", build_savings_ranges, filters=scenario)
+
+    with col2:
+        def build_savings_distribution():
+            counts, edges = summary.histogram
+            fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2e6, y=counts / counts.sum(),
+                                   width=(edges[1] - edges[0]) / 1e6, marker_color='#a3be8c',
+                                   hovertemplate="$%{x:.1f}M: %{y:.1%} of scenarios<extra></extra>"))
+            for value, dash in zip(summary.total_savings / 1e6, ('dot', 'solid', 'dot')):
+                fig.add_vline(x=value, line_dash=dash, line_color='#1f2937')
+            fig.update_layout(title="Portfolio Savings Across Scenarios", height=400,
+                              xaxis_title="Total annual savings ($M)", yaxis_tickformat='.0%', bargap=0)
+            return fig
+
+        render_figure("Strategic Recommendations", "savings_distribution", build_savings_distribution,
+                      filters=scenario)
+
+    st.caption(f"{summary.n_scenarios:,} simulated scenarios in {summary.seconds * 1000:.0f} ms "
+               "(reused while the sliders stay put) · payback counts implementation time")
+
+
+def display_recommendations(data):
+    """Display strategic recommendations in UN report style"""
+    # UN Report Style Header
+    st.markdown("""
+    <div style="background: white; padding: 2rem; border-left: 4px solid #d08770; margin-bottom: 2rem;">
+        <h1 style="color: #1f2937; font-size: 2.5rem; font-weight: 700; margin: 0 0 0.5rem 0; text-align: left;">
+            🎯 STRATEGIC RECOMMENDATIONS
+        </h1>
+        <p style="color: #6b7280; font-size: 1.1rem; margin: 0; text-align: left;">
+            Implementation Roadmap & ROI Analysis for Healthcare Operations Optimization
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Executive Summary Cards - UN Style
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Strategic Impact Summary
+    </h3>
+    """, unsafe_allow_html=True)
+
+    render_roi_simulator()
+
+    # Priority 1: Immediate Actions - UN Style
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 3rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Priority 1: Immediate Actions (0-90 Days)
+    </h3>
+    """, unsafe_allow_html=True)
+
+    # Processing Efficiency Initiative
+    st.markdown("""
+    <div style="background: white; padding: 1.5rem; border-left: 3px solid #bf616a; margin-bottom: 2rem;">
+        <h4 style="color: #bf616a; font-size: 1.2rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+            🚨 Processing Efficiency Automation
+        </h4>
+        <div style="color: #1f2937; font-size: 1rem; margin-bottom: 1rem; font-weight: 500;">
+            Reduce average processing time from 12.4 to 8.5 days through AI-powered pre-authorization system
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">$850K</div>
+            <div style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">INVESTMENT</div>
+            <div style="font-size: 0.8rem; color: #6b7280; margin-top: 0.5rem;">90 Days Timeline</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">$3.2M</div>
+            <div style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">ANNUAL SAVINGS</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; margin-top: 0.5rem; font-weight: 500;">376% ROI</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: #f7fee7; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; margin-bottom: 0.5rem;">SUCCESS METRICS</div>
+            <div style="font-size: 0.8rem; color: #6b7280;">
+                • Processing time ≤8.5 days<br>
+                • Automation rate ≥65%<br>
+                • Error reduction 40%
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # High-Risk Member Case Management
+    st.markdown("""
+    <div style="background: white; padding: 1.5rem; border-left: 3px solid #bf616a; margin-bottom: 2rem;">
+        <h4 style="color: #bf616a; font-size: 1.2rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+            🏥 High-Risk Member Case Management Program
+        </h4>
+        <div style="color: #1f2937; font-size: 1rem; margin-bottom: 1rem; font-weight: 500;">
+            Implement intensive case management for 425 high-risk members to reduce cost trajectory
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">$1.2M</div>
+            <div style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">INVESTMENT</div>
+            <div style="font-size: 0.8rem; color: #6b7280; margin-top: 0.5rem;">60 Days Timeline</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">$8.7M</div>
+            <div style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">ANNUAL SAVINGS</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; margin-top: 0.5rem; font-weight: 500;">725% ROI</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: #f7fee7; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; margin-bottom: 0.5rem;">SUCCESS METRICS</div>
+            <div style="font-size: 0.8rem; color: #6b7280;">
+                • High-risk cost growth ≤8%<br>
+                • Hospital readmissions -30%<br>
+                • Care coordination +85%
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Priority 2: Strategic Initiatives - UN Style
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 3rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Priority 2: Strategic Initiatives (3-12 Months)
+    </h3>
+    """, unsafe_allow_html=True)
+
+    # Provider Network Optimization
+    st.markdown("""
+    <div style="background: white; padding: 1.5rem; border-left: 3px solid #d08770; margin-bottom: 2rem;">
+        <h4 style="color: #d08770; font-size: 1.2rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+            🤝 Provider Network Optimization
+        </h4>
+        <div style="color: #1f2937; font-size: 1rem; margin-bottom: 1rem; font-weight: 500;">
+            Increase volume allocation to top-performing providers while improving underperformers
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown("""
+        <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">$450K</div>
+            <div style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">INVESTMENT</div>
+            <div style="font-size: 0.8rem; color: #6b7280; margin-top: 0.5rem;">6 Months Timeline</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 1.5rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">$2.4M</div>
+            <div style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">ANNUAL SAVINGS</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; margin-top: 0.5rem; font-weight: 500;">533% ROI</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: #f7fee7; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; margin-bottom: 0.5rem;">SUCCESS METRICS</div>
+            <div style="font-size: 0.8rem; color: #6b7280;">
+                • Top-tier provider volume +35%<br>
+                • Network denial rate ≤1.8%<br>
+                • Quality scores +15%
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Implementation Framework - UN Style
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 3rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Implementation Framework & Resource Allocation
+    </h3>
+    """, unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #5e81ac; margin-bottom: 1rem;">
+            <h4 style="color: #5e81ac; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                Cost Optimization Initiatives
+            </h4>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Strategic approaches to reduce operational expenses while maintaining quality
+            </div>
+            <div style="color: #1f2937; font-size: 0.8rem;">
+                <strong>Provider Negotiations:</strong> $2.4M savings potential<br>
+                <strong>Generic Drug Programs:</strong> $1.8M savings potential<br>
+                <strong>Preventive Care Focus:</strong> $3.2M savings potential<br>
+                <strong>Automation Implementation:</strong> $4.9M savings potential
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #a3be8c; margin-bottom: 1rem;">
+            <h4 style="color: #a3be8c; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                Quality Enhancement Programs
+            </h4>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Systematic improvements to operational efficiency and member outcomes
+            </div>
+            <div style="color: #1f2937; font-size: 0.8rem;">
+                <strong>Claims Processing:</strong> 6 months timeline, high impact<br>
+                <strong>Provider Network:</strong> 12 months timeline, medium impact<br>
+                <strong>Member Engagement:</strong> 9 months timeline, high impact<br>
+                <strong>Risk Management:</strong> 3 months timeline, high impact
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
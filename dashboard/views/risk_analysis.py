@@ -0,0 +1,337 @@
+"""
+Claims Data Warehouse - Risk Analysis page
+Purpose: Member risk stratification and high-risk member profiles
+"""
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboard.data_sources import WarehouseError
+from dashboard.runtime import get_data_source, render_export, render_figure, shared_frame
+
+# Member drill-down (live warehouse mode): members listed per risk tier
+MEMBER_LIST_SIZE = 50
+CLAIM_TYPE_COLORS = {'Inpatient': '#bf616a', 'Outpatient': '#5e81ac', 'Carrier': '#a3be8c'}
+
+
+def render_member_timeline(source, member):
+    """Every claim of one member, oldest first, as a chart and a table"""
+    try:
+        claims = source.member_claims(member['beneficiary_key'])
+    except WarehouseError as e:
+        st.warning(f"Claim timeline unavailable: {e}")
+        return
+
+    st.markdown(f"**Claim timeline · {member['beneficiary_id']}** ({member['gender']}, {member['age_group']}, "
+                f"{member['state_code']} · {member['chronic_condition_count']} chronic conditions)")
+    if not claims:
+        st.info("No claims on file for this member.")
+        return
+    df_claims = pd.DataFrame(claims)
+    for column in ('claim_amount', 'reimbursement_amount'):
+        df_claims[column] = df_claims[column].astype(float)
+
+    def build_timeline():
+        fig = go.Figure()
+        for claim_type, df_type in df_claims.groupby('claim_type', sort=False):
+            fig.add_trace(go.Scatter(
+                x=df_type['claim_start_date'],
+                y=df_type['claim_amount'],
+                mode='markers',
+                name=claim_type,
+                marker=dict(size=10, color=CLAIM_TYPE_COLORS.get(claim_type, '#4c566a'),
+                            symbol=['x' if denied else 'circle' for denied in df_type['is_denied']]),
+                text=df_type['provider_name'],
+                hovertemplate="%{x|%b %d, %Y}<br>$%{y:,.2f}<br>%{text}<extra>%{fullData.name}</extra>",
+            ))
+        fig.update_layout(
+            height=320,
+            yaxis_title="Claim Amount",
+            yaxis_tickformat='$,.0f',
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            legend=dict(orientation='h', y=1.1),
+        )
+        return fig
+
+    render_figure("Risk Analysis", "member_timeline", build_timeline, filters=member['beneficiary_key'])
+    st.dataframe(
+        df_claims[['claim_start_date', 'claim_type', 'claim_status', 'claim_amount', 'reimbursement_amount',
+                   'processing_days', 'provider_name', 'specialty_description']],
+        column_config={
+            'claim_start_date': st.column_config.DateColumn('Start Date'),
+            'claim_type': 'Claim Type',
+            'claim_status': 'Status',
+            'claim_amount': st.column_config.NumberColumn('Billed', format="$%.2f"),
+            'reimbursement_amount': st.column_config.NumberColumn('Reimbursed', format="$%.2f"),
+            'processing_days': st.column_config.NumberColumn('Processing Days', format="%d"),
+            'provider_name': 'Provider',
+            'specialty_description': 'Specialty'
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_member_drilldown(risk_tiers):
+    """Costliest members of a risk tier; selecting one opens their claim timeline (live warehouse only)"""
+    try:
+        source = get_data_source()
+    except WarehouseError:
+        return
+    if source is None:
+        return
+
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Member Drill-Down
+    </h3>
+    """, unsafe_allow_html=True)
+    tier = st.selectbox("Risk Tier", ["All"] + risk_tiers, key="risk_member_tier")
+    risk_tier = None if tier == "All" else tier
+    try:
+        members = source.top_members(risk_tier, MEMBER_LIST_SIZE)
+    except WarehouseError as e:
+        st.warning(f"Member list unavailable: {e}")
+        return
+
+    selected = []
+    if not members:
+        st.info("No members in this risk tier.")
+    else:
+        df_members = pd.DataFrame(members)
+        df_members['total_cost'] = df_members['total_cost'].astype(float)
+        # One table (and selection) per tier, so a selected row never jumps to another member
+        event = st.dataframe(
+            df_members[['beneficiary_id', 'risk_tier', 'gender', 'age_group', 'state_code',
+                        'chronic_condition_count', 'total_claims', 'total_cost']],
+            column_config={
+                'beneficiary_id': 'Member',
+                'risk_tier': 'Risk Tier',
+                'gender': 'Gender',
+                'age_group': 'Age Group',
+                'state_code': 'State',
+                'chronic_condition_count': 'Chronic Conditions',
+                'total_claims': st.column_config.NumberColumn('Claims', format="%d"),
+                'total_cost': st.column_config.NumberColumn('Total Cost', format="$%.0f"),
+            },
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"risk_member_table_{tier}",
+        )
+        selected = event.selection.rows
+        st.caption(f"The {len(members)} costliest members; select a row to open the member's claim timeline.")
+
+    # The whole tier, not just the listed members, streamed from the warehouse
+    render_export("risk_export", "members",
+                  lambda path, fmt: source.export_members(path, fmt, risk_tier), risk_tier)
+    if selected:
+        render_member_timeline(source, members[selected[0]])
+
+
+def display_risk_analysis(data):
+    """Display member risk stratification in UN report style"""
+    # UN Report Style Header
+    st.markdown("""
+    <div style="background: white; padding: 2rem; border-left: 4px solid #bf616a; margin-bottom: 2rem;">
+        <h1 style="color: #1f2937; font-size: 2.5rem; font-weight: 700; margin: 0 0 0.5rem 0; text-align: left;">
+            👤 MEMBER RISK ANALYSIS
+        </h1>
+        <p style="color: #6b7280; font-size: 1.1rem; margin: 0; text-align: left;">
+            Population Health Risk Stratification & Cost Concentration Analysis
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Risk Overview Metrics - UN Style Cards
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Risk Profile Overview
+    </h3>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #bf616a;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #bf616a; margin-bottom: 0.25rem;">5,000</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">TOTAL MEMBERS</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">Active Population</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #d08770;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #d08770; margin-bottom: 0.25rem;">425</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">HIGH RISK</div>
+            <div style="font-size: 0.8rem; color: #d08770; font-weight: 500; margin-top: 0.5rem;">8.5% Population</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #ebcb8b;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #d08770; margin-bottom: 0.25rem;">48.5%</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">COST CONCENTRATION</div>
+            <div style="font-size: 0.8rem; color: #d08770; font-weight: 500; margin-top: 0.5rem;">High Risk Members</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #a3be8c;
+                    margin-bottom: 1rem; text-align: left;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: #a3be8c; margin-bottom: 0.25rem;">$12.5K</div>
+            <div style="font-size: 0.9rem; color: #1f2937; font-weight: 600; text-transform: uppercase; letter-spacing: 0.02em;">AVG HIGH RISK COST</div>
+            <div style="font-size: 0.8rem; color: #a3be8c; font-weight: 500; margin-top: 0.5rem;">Per Member</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Risk Stratification Data
+    risk_data = data.get('member_risk_analysis', {}).get('risk_stratification', [])
+    if not risk_data:
+        risk_data = [
+            {'risk_tier': 'High Risk', 'count': 425, 'percentage': 8.5, 'avg_cost': 12500, 'total_cost_pct': 48.5, 'needs_case_management': 'Yes'},
+            {'risk_tier': 'Medium Risk', 'count': 1567, 'percentage': 31.3, 'avg_cost': 6200, 'total_cost_pct': 32.4, 'needs_case_management': 'Selective'},
+            {'risk_tier': 'Low Risk', 'count': 3008, 'percentage': 60.2, 'avg_cost': 1800, 'total_cost_pct': 19.1, 'needs_case_management': 'No'}
+        ]
+
+    df_risk = shared_frame("Risk Analysis", "risk_tiers", lambda: risk_data)
+
+    col1, col2 = st.columns([3, 2])
+
+    with col1:
+        st.markdown("""
+        <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+            Risk Stratification Analysis
+        </h3>
+        """, unsafe_allow_html=True)
+
+        # Format the data for display
+        display_risk = df_risk.copy()
+        display_risk['avg_cost'] = display_risk['avg_cost'].apply(lambda x: f"${x:,}")
+        display_risk['percentage'] = display_risk['percentage'].apply(lambda x: f"{x:.1f}%")
+        display_risk['total_cost_pct'] = display_risk['total_cost_pct'].apply(lambda x: f"{x:.1f}%")
+
+        st.dataframe(
+            display_risk[['risk_tier', 'count', 'percentage', 'avg_cost', 'total_cost_pct', 'needs_case_management']],
+            column_config={
+                'risk_tier': 'Risk Tier',
+                'count': 'Member Count',
+                'percentage': 'Population %',
+                'avg_cost': 'Avg Cost',
+                'total_cost_pct': 'Cost Share %',
+                'needs_case_management': 'Case Management'
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+    with col2:
+        st.markdown("""
+        <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 2rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+            Cost Distribution
+        </h3>
+        """, unsafe_allow_html=True)
+
+        # Risk visualization with UN colors
+        def build_cost_bar():
+            fig = go.Figure(data=[
+                go.Bar(
+                    x=[tier['risk_tier'] for tier in risk_data],
+                    y=[tier['total_cost_pct'] for tier in risk_data],
+                    marker_color=['#bf616a', '#d08770', '#a3be8c'],
+                    text=[f"{tier['total_cost_pct']:.1f}%" for tier in risk_data],
+                    textposition='auto',
+                )
+            ])
+
+            fig.update_layout(
+                xaxis_title="Risk Tier",
+                yaxis_title="Cost Share (%)",
+                height=350,
+                font=dict(color='#1f2937'),
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                showlegend=False
+            )
+            return fig
+
+        render_figure("Risk Analysis", "cost_distribution", build_cost_bar)
+
+    render_member_drilldown([row['risk_tier'] for row in risk_data])
+
+    # Risk Management Strategies - UN Style Section
+    st.markdown("""
+    <h3 style="color: #1f2937; font-size: 1.3rem; font-weight: 600; margin: 3rem 0 1rem 0; text-transform: uppercase; letter-spacing: 0.02em;">
+        Risk Management Strategy Framework
+    </h3>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #bf616a; margin-bottom: 1rem;">
+            <h4 style="color: #bf616a; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                High Risk Management
+            </h4>
+            <div style="font-size: 2rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">425</div>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Members requiring intensive case management
+            </div>
+            <div style="color: #bf616a; font-size: 0.8rem; font-weight: 500;">
+                ⚠ Chronic conditions<br>
+                ⚠ Multiple specialists<br>
+                ⚠ High utilization<br>
+                ⚠ Care coordination
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #d08770; margin-bottom: 1rem;">
+            <h4 style="color: #d08770; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                Medium Risk Monitoring
+            </h4>
+            <div style="font-size: 2rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">1,567</div>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Members with selective intervention needs
+            </div>
+            <div style="color: #d08770; font-size: 0.8rem; font-weight: 500;">
+                ⚡ Preventive care<br>
+                ⚡ Health coaching<br>
+                ⚡ Risk monitoring<br>
+                ⚡ Early intervention
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div style="background: white; padding: 1.5rem; border-left: 3px solid #a3be8c; margin-bottom: 1rem;">
+            <h4 style="color: #a3be8c; font-size: 1.1rem; margin: 0 0 1rem 0; text-transform: uppercase;">
+                Low Risk Maintenance
+            </h4>
+            <div style="font-size: 2rem; font-weight: 700; color: #1f2937; margin-bottom: 0.5rem;">3,008</div>
+            <div style="color: #6b7280; font-size: 0.9rem; margin-bottom: 1rem;">
+                Healthy members requiring routine care
+            </div>
+            <div style="color: #a3be8c; font-size: 0.8rem; font-weight: 500;">
+                ✓ Wellness programs<br>
+                ✓ Annual checkups<br>
+                ✓ Risk prevention<br>
+                ✓ Health education
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,192 @@
+"""
+Claims Data Warehouse - Dashboard cache warm-up
+Purpose: Pay the query and import cost of every page before the first visitor does
+
+After a deploy or a fresh `dbt run` every cache is cold, and the first analyst to open
+each page waited for its warehouse queries and, in a new process, for the page module
+import. warm_queries() runs every query the pages issue by default, under the common
+filter combinations (no filter and each claim type on its own), and warm_pages() imports
+the page modules. RunResultsWatcher calls back whenever dbt rewrites
+target/run_results.json, i.e. after every dbt run; invalidate_changed() then expires
+only the cached results that read a relation the run changed (dbt lineage, see
+lineage.py), so pages on untouched models stay warm.
+
+Each replica starts a CacheWarmer with its first session (runtime.get_cache_warmer);
+scripts/warm_dashboard_cache.py renders every page ahead of the first session to fill the
+query cache all replicas share (DASHBOARD_CACHE_PATH, which the job requires).
+
+Figures and shared frames are not pre-built: they are made by page code inside a script
+run, so the first session to open a page after a data change builds them once and every
+later session of the replica reuses them (figure_cache.py, shared_store.py).
+"""
+
+import importlib
+import os
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from dashboard.data_sources import ClaimsFilter, WarehouseError
+from dashboard.lineage import changed_relations, load_artifacts
+
+DBT_TARGET_ENV_VAR = "DASHBOARD_DBT_TARGET"
+DEFAULT_DBT_TARGET = "target"
+RUN_RESULTS = "run_results.json"
+DEFAULT_POLL_SECONDS = 10
+WARMUP_ENV_VAR = "DASHBOARD_WARMUP"
+
+
+def warmup_enabled():
+    """In-process warm-up is on unless DASHBOARD_WARMUP=0 (benchmarks measure cold pages)"""
+    return os.environ.get(WARMUP_ENV_VAR, "1") != "0"
+
+
+def run_results_path():
+    """target/run_results.json of the dbt project the dashboard reads"""
+    return Path(os.environ.get(DBT_TARGET_ENV_VAR, DEFAULT_DBT_TARGET)) / RUN_RESULTS
+
+
+def common_filters(source):
+    """Filter combinations worth warming: none, then each claim type on its own"""
+    options = source.claims_filter_options()
+    return [ClaimsFilter()] + [ClaimsFilter(claim_types=(claim_type,)) for claim_type in options['claim_type']]
+
+
+def warm_queries(source, filters=None):
+    """Run the default queries of every page under each filter; returns how many calls were made"""
+    from dashboard.views.provider_analysis import PROVIDER_PAGE_SIZE
+
+    calls = [
+        source.provider_filter_options,
+        source.recent_activity,
+        source.monthly_segments,
+        source.provider_count,
+        lambda: source.provider_page(limit=PROVIDER_PAGE_SIZE),
+    ]
+    first, last = source.daily_range()
+    for claims_filter in filters if filters is not None else common_filters(source):
+        calls.append(lambda f=claims_filter: source.overlay(None, f))
+        # The trends page opens on the full zoom window
+        calls.append(lambda f=claims_filter: source.daily_trends(f, first, last))
+    for call in calls:
+        call()
+    return len(calls)
+
+
+def invalidate_changed(source, target_dir):
+    """Expire the results of the relations the last dbt run changed.
+
+    Returns (changed relations, expired results). Without readable artifacts nothing is
+    known about the run, so every result is dropped and relations is None.
+    """
+    try:
+        relations = changed_relations(*load_artifacts(target_dir))
+    except (OSError, ValueError, KeyError):
+        source.clear()
+        return None, None
+    return sorted(relations), source.invalidate(relations)
+
+
+def import_chart_dependencies():
+    """Import pandas in the calling thread, before the warm-up thread can.
+
+    Plotly validates figures against whatever pandas module is in sys.modules; imported by
+    the warm-up thread, a session drawing a chart meanwhile could see it half-initialised.
+    """
+    import pandas  # noqa: F401
+
+
+def warm_pages():
+    """Import every page module (with pandas and plotly express); returns the page count"""
+    from dashboard.views import PAGES
+
+    for module_name, _ in PAGES.values():
+        importlib.import_module(f"dashboard.views.{module_name}")
+    return len(PAGES)
+
+
+class RunResultsWatcher(threading.Thread):
+    """Calls on_change(path) whenever dbt rewrites run_results.json, polling every interval seconds"""
+
+    def __init__(self, on_change, path=None, interval=DEFAULT_POLL_SECONDS):
+        super().__init__(name="run-results-watcher", daemon=True)
+        self.on_change = on_change
+        self.path = Path(path) if path is not None else run_results_path()
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def _mtime(self):
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def run(self):
+        seen = self._mtime()
+        while not self._stopped.wait(self.interval):
+            mtime = self._mtime()
+            if mtime is not None and mtime != seen:
+                seen = mtime
+                try:
+                    self.on_change(self.path)
+                except Exception:
+                    # One failed callback must not stop the watching for the life of the process
+                    traceback.print_exc()
+
+    def stop(self):
+        self._stopped.set()
+
+
+class CacheWarmer:
+    """Warms the query cache and page imports of this process now and after every dbt run"""
+
+    def __init__(self, source, path=None, interval=DEFAULT_POLL_SECONDS):
+        self.source = source
+        self.runs = 0
+        self.last_run_seconds = None
+        self.last_error = None
+        # (changed relations, expired results) of the last dbt run, see invalidate_changed()
+        self.last_invalidation = None
+        self._lock = threading.Lock()
+        self.watcher = RunResultsWatcher(self._dbt_finished, path, interval)
+
+    def start(self):
+        import_chart_dependencies()
+        threading.Thread(target=self.warm, name="cache-warmer", daemon=True).start()
+        self.watcher.start()
+        return self
+
+    def _dbt_finished(self, path):
+        if self.source is not None:
+            try:
+                self.last_invalidation = invalidate_changed(self.source, path.parent)
+            except Exception as exc:
+                self._failed(exc)
+        self.warm()
+
+    def _failed(self, exc):
+        """Keep the error for the perf HUD; anything but a warehouse error also goes to the server log"""
+        if isinstance(exc, WarehouseError):
+            self.last_error = str(exc)
+        else:
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            traceback.print_exc()
+
+    def warm(self):
+        """One warm-up pass; errors are kept for the perf HUD, never raised into the thread"""
+        with self._lock:
+            start = time.perf_counter()
+            try:
+                if self.source is not None:
+                    warm_queries(self.source)
+                warm_pages()
+                self.last_error = None
+            except Exception as exc:
+                # A locked DuckDB file, a broken page import, ...: the next dbt run tries again
+                self._failed(exc)
+            self.runs += 1
+            self.last_run_seconds = time.perf_counter() - start
+
+    def stop(self):
+        self.watcher.stop()
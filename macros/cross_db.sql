@@ -0,0 +1,46 @@
+{#
+    Dialect macros so the DAG runs on both the Postgres targets and the embedded DuckDB target.
+    Each macro dispatches on the adapter: default__ is the Postgres form, duckdb__ the DuckDB one.
+    (::decimal, percentile_cont ... within group and interval 'N days' are valid in both dialects.)
+#}
+
+{% macro cms_date(column_name) %}
+    {{ return(adapter.dispatch('cms_date', 'claims_data_warehouse')(column_name)) }}
+{% endmacro %}
+
+{% macro default__cms_date(column_name) %}
+    {#- CMS dates arrive as YYYYMMDD text/numbers (seeds) or as date (scripts/load_raw_cms.py) -#}
+    to_date(replace(cast({{ column_name }} as varchar), '-', ''), 'YYYYMMDD')
+{%- endmacro %}
+
+{% macro duckdb__cms_date(column_name) %}
+    cast(strptime(replace(cast({{ column_name }} as varchar), '-', ''), '%Y%m%d') as date)
+{%- endmacro %}
+
+
+{% macro date_key(date_expression) %}
+    {{ return(adapter.dispatch('date_key', 'claims_data_warehouse')(date_expression)) }}
+{% endmacro %}
+
+{% macro default__date_key(date_expression) %}
+    cast(to_char({{ date_expression }}, 'YYYYMMDD') as integer)
+{%- endmacro %}
+
+{% macro duckdb__date_key(date_expression) %}
+    cast(strftime({{ date_expression }}, '%Y%m%d') as integer)
+{%- endmacro %}
+
+
+{% macro date_name(date_expression, name_format) %}
+    {#- name_format: 'Month', 'Mon', 'Day' or 'Dy' (Postgres to_char patterns) -#}
+    {{ return(adapter.dispatch('date_name', 'claims_data_warehouse')(date_expression, name_format)) }}
+{% endmacro %}
+
+{% macro default__date_name(date_expression, name_format) %}
+    to_char({{ date_expression }}, '{{ name_format }}')
+{%- endmacro %}
+
+{% macro duckdb__date_name(date_expression, name_format) %}
+    {%- set strftime_formats = {'Month': '%B', 'Mon': '%b', 'Day': '%A', 'Dy': '%a'} -%}
+    strftime({{ date_expression }}, '{{ strftime_formats[name_format] }}')
+{%- endmacro %}
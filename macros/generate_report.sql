@@ -30,20 +30,22 @@
 
 {% endmacro %}
 
-{% macro export_report_to_csv() %}
+{% macro export_report_to_csv(model_name='fact_claims', output_path=none, parts=1) %}
     /*
     导出报告数据到 CSV 文件
+    实际导出由 scripts/export_report.py 完成（COPY TO STDOUT 流式写出，支持 csv / csv.gz / parquet，
+    可按 claim_start_date 拆分并行导出），本宏仅输出对应命令
+    用法: dbt run-operation export_report_to_csv --args '{model_name: fact_claims, parts: 8}'
     */
 
     {% if execute %}
-        {% set export_query %}
-            COPY (
-                SELECT * FROM {{ ref('analyses', 'business_intelligence_report') }}
-            ) TO STDOUT WITH CSV HEADER;
+        {% set output_path = output_path or 'exports/' ~ model_name ~ '.csv.gz' %}
+        {% set export_command %}
+            python scripts/export_report.py --schema {{ target.schema }} --model {{ model_name }} --output {{ output_path }} --parts {{ parts }}
         {% endset %}
 
-        {{ log("💾 执行 CSV 导出查询...", info=true) }}
-        {{ log("查询: " ~ export_query, info=true) }}
+        {{ log("💾 使用流式导出工具导出 " ~ model_name ~ ":", info=true) }}
+        {{ log(export_command | trim, info=true) }}
     {% endif %}
 
 {% endmacro %}
@@ -0,0 +1,12 @@
+{% macro generate_schema_name(custom_schema_name, node) -%}
+    {#-
+        Seeds with a custom schema (seeds/schema.yml sets schema: raw) are created in that schema
+        as-is, so the cms_raw sources in models/staging/sources.yml read them on every target.
+        Everything else keeps dbt's default <target_schema>_<custom_schema> naming.
+    -#}
+    {%- if custom_schema_name is not none and node.resource_type == 'seed' -%}
+        {{ custom_schema_name | trim }}
+    {%- else -%}
+        {{ default__generate_schema_name(custom_schema_name, node) }}
+    {%- endif -%}
+{%- endmacro %}
@@ -0,0 +1,74 @@
+{% macro log_model_performance(results, perf_schema='perf') %}
+    /*
+    on-run-end hook: record build duration, row count and table/index size of every model
+    in the run into perf.model_runs. Query plans for the same invocation are captured by
+    scripts/collect_model_performance.py (EXPLAIN ANALYZE re-executes the query, so it is
+    not done inside the build itself).
+    Registered as an on-run-end hook in dbt_project.yml
+    */
+
+    {% if execute and target.type == 'postgres' %}
+        {% set model_results = results | selectattr('node.resource_type', 'equalto', 'model') | list %}
+
+        {% if model_results %}
+            {% set perf_sql %}
+                create schema if not exists {{ perf_schema }};
+
+                create table if not exists {{ perf_schema }}.model_runs (
+                    invocation_id text not null,
+                    run_started_at timestamptz not null,
+                    target_name text not null,
+                    unique_id text not null,
+                    model_name text not null,
+                    materialized text,
+                    status text not null,
+                    execution_time double precision,
+                    rows_affected bigint,
+                    total_bytes bigint,
+                    index_bytes bigint,
+                    recorded_at timestamptz not null default now(),
+                    primary key (invocation_id, unique_id)
+                );
+
+                insert into {{ perf_schema }}.model_runs (
+                    invocation_id, run_started_at, target_name, unique_id, model_name, materialized,
+                    status, execution_time, rows_affected, total_bytes, index_bytes
+                )
+                select
+                    r.invocation_id, r.run_started_at, r.target_name, r.unique_id, r.model_name,
+                    r.materialized, r.status, r.execution_time, r.rows_affected,
+                    pg_total_relation_size(c.oid),
+                    pg_indexes_size(c.oid)
+                from (values
+                    {% for result in model_results %}
+                    (
+                        '{{ invocation_id }}',
+                        cast('{{ run_started_at }}' as timestamptz),
+                        '{{ target.name }}',
+                        '{{ result.node.unique_id }}',
+                        '{{ result.node.name }}',
+                        '{{ result.node.config.materialized }}',
+                        '{{ result.status }}',
+                        cast({{ result.execution_time or 'null' }} as double precision),
+                        cast({{ result.adapter_response.get('rows_affected') if result.adapter_response and result.adapter_response.get('rows_affected') is not none else 'null' }} as bigint),
+                        '{{ result.node.schema }}',
+                        '{{ result.node.alias or result.node.name }}'
+                    ){% if not loop.last %},{% endif %}
+                    {% endfor %}
+                ) as r (invocation_id, run_started_at, target_name, unique_id, model_name, materialized,
+                        status, execution_time, rows_affected, schema_name, relation_name)
+                left join pg_namespace n
+                    on n.nspname = r.schema_name
+                left join pg_class c
+                    on c.relnamespace = n.oid
+                   and c.relname = r.relation_name
+                   and c.relkind in ('r', 'm', 'p')
+                on conflict (invocation_id, unique_id) do nothing;
+            {% endset %}
+
+            {% do run_query(perf_sql) %}
+            {{ log("⏱️ Recorded build stats for " ~ model_results | length ~ " models in " ~ perf_schema ~ ".model_runs", info=true) }}
+        {% endif %}
+    {% endif %}
+
+{% endmacro %}
@@ -0,0 +1,58 @@
+{{ config(
+    materialized='table',
+    indexes=[
+        {'columns': ['metric_date']},
+        {'columns': ['claim_type', 'metric_date']},
+        {'columns': ['state_code', 'metric_date']},
+        {'columns': ['specialty_description', 'metric_date']}
+    ],
+    tags=['analytics', 'metrics', 'claims']
+) }}
+
+/*
+Monthly claims cube: one row per month x claim type x provider state x provider specialty,
+with additive measures only, so any combination of dashboard filters can be answered by
+summing rows instead of scanning fact_claims. Rates and averages are derived from the
+sums by the consumer (denial rate = denied_claims / total_claims, and so on).
+*/
+
+with claims as (
+    select
+        date_trunc('month', f.claim_start_date)::date as metric_date,
+        f.claim_type,
+        coalesce(p.state_code, 'Unknown') as state_code,
+        coalesce(p.specialty_description, 'Unknown') as specialty_description,
+        f.claim_amount,
+        f.reimbursement_amount,
+        f.is_denied,
+        f.processing_days,
+        f.is_high_dollar,
+        f.is_slow_processing
+    from {{ ref('fact_claims') }} f
+    left join {{ ref('dim_providers') }} p
+        on f.provider_key = p.provider_key
+)
+
+select
+    metric_date,
+    claim_type,
+    state_code,
+    specialty_description,
+
+    -- Volume
+    count(*) as total_claims,
+
+    -- Financial
+    sum(claim_amount) as total_claim_amount,
+    sum(reimbursement_amount) as total_reimbursement,
+
+    -- Quality and processing
+    count(case when is_denied then 1 end) as denied_claims,
+    sum(processing_days) as total_processing_days,
+    count(case when is_high_dollar then 1 end) as high_dollar_claims,
+    count(case when is_slow_processing then 1 end) as slow_processing_claims,
+
+    current_timestamp as metrics_calculated_at
+
+from claims
+group by metric_date, claim_type, state_code, specialty_description
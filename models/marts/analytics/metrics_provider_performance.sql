@@ -1,3 +1,4 @@
+{# (sort column, provider_key) indexes back the keyset-paginated provider directory in the dashboard #}
 {{ config(
     materialized='table',
     indexes=[
@@ -5,7 +6,11 @@
         {'columns': ['specialty_description']},
         {'columns': ['state_code']},
         {'columns': ['performance_tier']},
-        {'columns': ['total_claims']}
+        {'columns': ['total_claims', 'provider_key']},
+        {'columns': ['total_claim_amount', 'provider_key']},
+        {'columns': ['avg_claim_amount', 'provider_key']},
+        {'columns': ['denial_rate', 'provider_key']},
+        {'columns': ['specialty_description', 'total_claims', 'provider_key']}
     ],
     tags=['analytics', 'metrics', 'providers']
 ) }}
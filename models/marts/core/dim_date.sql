@@ -21,8 +21,8 @@ with date_spine as (
 final as (
     select
         -- Primary key
-        cast({{ dbt_utils.date_trunc('day', 'date_day') }} as date) as full_date,
-        cast(to_char(date_day, 'YYYYMMDD') as integer) as date_key,
+        cast({{ dbt.date_trunc('day', 'date_day') }} as date) as full_date,
+        {{ date_key('date_day') }} as date_key,
 
         -- Year attributes
         extract(year from date_day) as year,
@@ -34,14 +34,14 @@ final as (
         extract(doy from date_day) as day_of_year,
 
         -- Month attributes
-        to_char(date_day, 'Month') as month_name,
-        to_char(date_day, 'Mon') as month_short_name,
+        {{ date_name('date_day', 'Month') }} as month_name,
+        {{ date_name('date_day', 'Mon') }} as month_short_name,
         'Q' || extract(quarter from date_day) as quarter_name,
         extract(year from date_day) || '-Q' || extract(quarter from date_day) as year_quarter,
 
         -- Week attributes
-        to_char(date_day, 'Day') as day_name,
-        to_char(date_day, 'Dy') as day_short_name,
+        {{ date_name('date_day', 'Day') }} as day_name,
+        {{ date_name('date_day', 'Dy') }} as day_short_name,
         case
             when extract(dow from date_day) in (0, 6) then true
             else false
@@ -57,7 +57,7 @@ final as (
             else false
         end as is_first_day_of_month,
         case
-            when date_day = date_trunc('month', date_day) + interval '1 month - 1 day' then true
+            when date_day = {{ dbt.last_day('date_day', 'month') }} then true
             else false
         end as is_last_day_of_month,
 
@@ -46,12 +46,12 @@ cleaned as (
         -- Demographics with cleaning
         case
             when date_of_birth = '19000101' then null
-            else cast(date_of_birth as date)
+            else {{ cms_date('date_of_birth') }}
         end as date_of_birth,
 
         case
             when date_of_death = '00000000' then null
-            else cast(date_of_death as date)
+            else {{ cms_date('date_of_death') }}
         end as date_of_death,
 
         case
@@ -111,7 +111,7 @@ cleaned as (
         -- Age calculation
         case
             when date_of_birth is not null then
-                date_part('year', age(current_date, date_of_birth))
+                date_part('year', age(current_date, {{ cms_date('date_of_birth') }}))
             else null
         end as current_age,
 
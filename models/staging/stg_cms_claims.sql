@@ -12,10 +12,10 @@ with inpatient_claims as (
 
         -- Claim information
         'Inpatient' as claim_type,
-        clm_from_dt as claim_start_date,
-        clm_thru_dt as claim_end_date,
-        clm_admsn_dt as admission_date,
-        nch_bene_dschrg_dt as discharge_date,
+        {{ cms_date('clm_from_dt') }} as claim_start_date,
+        {{ cms_date('clm_thru_dt') }} as claim_end_date,
+        {{ cms_date('clm_admsn_dt') }} as admission_date,
+        {{ cms_date('nch_bene_dschrg_dt') }} as discharge_date,
 
         -- Financial amounts
         clm_pmt_amt as reimbursement_amount,
@@ -46,8 +46,8 @@ with inpatient_claims as (
 
         -- Claim information
         'Outpatient' as claim_type,
-        clm_from_dt as claim_start_date,
-        clm_thru_dt as claim_end_date,
+        {{ cms_date('clm_from_dt') }} as claim_start_date,
+        {{ cms_date('clm_thru_dt') }} as claim_end_date,
         null as admission_date,
         null as discharge_date,
 
@@ -80,8 +80,8 @@ with inpatient_claims as (
 
         -- Claim information
         'Carrier' as claim_type,
-        clm_from_dt as claim_start_date,
-        clm_thru_dt as claim_end_date,
+        {{ cms_date('clm_from_dt') }} as claim_start_date,
+        {{ cms_date('clm_thru_dt') }} as claim_end_date,
         null as admission_date,
         null as discharge_date,
 
@@ -165,6 +165,7 @@ cleaned as (
         -- Processing timing (synthetic dates for demo)
         claim_start_date + interval '30 days' as processed_at,
         claim_start_date - interval '7 days' as created_at,
+        30 as processing_days,  -- claim start to processed_at
 
         -- Data quality flags
         case when beneficiary_id is null then true else false end as beneficiary_missing,
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Dashboard startup benchmark
+Purpose: Measure how long a freshly started dashboard process takes to paint a page
+
+Every sample runs in a new Python process, like a container that has just been scheduled:
+Streamlit is imported (the server has to do that before it accepts a session), then the
+first session's script run is timed with Streamlit's AppTest runner. Reported per page:
+
+- first paint: until the first element is sent to the browser
+- interactive: until the sidebar navigation (the first button) has been sent
+- full render: until the script run has finished (every panel and chart of the page drawn)
+- heavy modules: which of pandas / plotly / numpy the run had to import
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --runs 10 --page "Trends & Patterns" --page "Model Performance"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_PAGES = ("Executive Summary", "KPI Dashboard", "Model Performance")
+HEAVY_MODULES = ("pandas", "plotly", "numpy")
+
+# Runs inside the fresh interpreter; prints one JSON line
+SAMPLE = """
+import json, sys, time
+import streamlit
+from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
+from streamlit.testing.v1 import AppTest
+
+first_delta, first_button = [], []
+enqueue = ForwardMsgQueue.enqueue
+def timed_enqueue(self, msg):
+    if msg.HasField("delta"):
+        if not first_delta:
+            first_delta.append(time.perf_counter())
+        if not first_button and msg.delta.new_element.WhichOneof("type") == "button":
+            first_button.append(time.perf_counter())
+    return enqueue(self, msg)
+ForwardMsgQueue.enqueue = timed_enqueue
+
+app = AppTest.from_file(sys.argv[1], default_timeout=120)
+app.session_state.selected_page = sys.argv[2]
+start = time.perf_counter()
+app.run()
+end = time.perf_counter()
+print(json.dumps({
+    "first_paint_ms": (first_delta[0] - start) * 1000 if first_delta else None,
+    "interactive_ms": (first_button[0] - start) * 1000 if first_button else None,
+    "full_render_ms": (end - start) * 1000,
+    "exceptions": [e.value for e in app.exception],
+    "heavy_modules": [m for m in sys.argv[3].split(",") if m in sys.modules],
+}))
+"""
+
+
+def sample(app, page):
+    result = subprocess.run(
+        [sys.executable, "-c", SAMPLE, str(app), page, ",".join(HEAVY_MODULES)],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        # No background warm-up: it would import the other pages while the sample is measured
+        env={**os.environ, "DASHBOARD_WARMUP": "0"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(values):
+    values = sorted(values)
+    return f"median {statistics.median(values):7.0f} ms   min {values[0]:7.0f} ms   max {values[-1]:7.0f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure dashboard cold-start time per page")
+    parser.add_argument("--app", default=PROJECT_ROOT / "streamlit_app.py", type=Path)
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per page")
+    parser.add_argument("--page", action="append", dest="pages",
+                        help=f"page to open (repeatable, default: {', '.join(DEFAULT_PAGES)})")
+    args = parser.parse_args()
+
+    for page in args.pages or DEFAULT_PAGES:
+        samples = [sample(args.app.resolve(), page) for _ in range(args.runs)]
+        errors = [error for s in samples for error in s["exceptions"]]
+        print(f"{page}")
+        print(f"  first paint  {summarize([s['first_paint_ms'] for s in samples])}")
+        print(f"  interactive  {summarize([s['interactive_ms'] for s in samples])}")
+        print(f"  full render  {summarize([s['full_render_ms'] for s in samples])}")
+        print(f"  imported     {', '.join(samples[-1]['heavy_modules']) or '-'}")
+        if errors:
+            print(f"  exceptions   {errors[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Model Performance Collector
+Purpose: Capture query plans and build statistics for every model of the last dbt run
+
+Reads target/run_results.json and target/manifest.json, re-runs each model's compiled
+SELECT under `EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` and stores the plan together with
+the build duration, row count and table/index sizes in perf.model_plans. Build stats come
+from perf.model_runs, which the on-run-end hook log_model_performance fills for the same
+invocation; run_results.json and the current catalog sizes are the fallback for runs the
+hook did not record (e.g. a run with hooks disabled). A structural plan
+hash (node types, relations, join/sort keys - no costs or timings) makes plan changes
+between runs visible. The same summary is appended to reports/model_performance.json,
+which the dashboard's Model Performance page plots, and plan changes are reported to the
+dashboard event log for the activity monitor.
+
+Usage:
+    dbt run && python scripts/collect_model_performance.py
+    python scripts/collect_model_performance.py --select fact_claims metrics_provider_performance
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from psycopg2.extras import Json
+
+from warehouse import add_connection_arguments, connect, quote_ident
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dashboard.event_log import append_events, make_event  # noqa: E402
+
+DEFAULT_HISTORY = PROJECT_ROOT / "reports" / "model_performance.json"
+PLANNED_MATERIALIZATIONS = ('table', 'view', 'incremental')
+
+# Per-model build stats recorded by the on-run-end hook in perf.model_runs
+BUILD_STAT_FIELDS = ('execution_time', 'rows_affected', 'total_bytes', 'index_bytes')
+
+# Plan node fields that identify the shape of a plan (estimates and timings are left out)
+PLAN_SHAPE_FIELDS = ('Node Type', 'Strategy', 'Join Type', 'Relation Name', 'Index Name',
+                     'Hash Cond', 'Merge Cond', 'Sort Key', 'Group Key')
+
+
+def load_artifacts(target_dir):
+    target_dir = Path(target_dir)
+    try:
+        with open(target_dir / "run_results.json") as f:
+            run_results = json.load(f)
+        with open(target_dir / "manifest.json") as f:
+            manifest = json.load(f)
+    except FileNotFoundError as e:
+        raise SystemExit(f"❌ {e.filename} not found. Run `dbt run` first.")
+    return run_results, manifest
+
+
+def plan_shape(node):
+    """Nested tuple of the structural fields of a plan node and its children"""
+    fields = tuple((field, json.dumps(node[field])) for field in PLAN_SHAPE_FIELDS if field in node)
+    return fields, tuple(plan_shape(child) for child in node.get('Plans', []))
+
+
+def plan_hash(plan):
+    return hashlib.sha1(repr(plan_shape(plan)).encode()).hexdigest()[:16]
+
+
+def walk(node):
+    yield node
+    for child in node.get('Plans', []):
+        yield from walk(child)
+
+
+def node_self_time(node):
+    """Exclusive time of a plan node in ms (inclusive time minus its children's)"""
+    loops = node.get('Actual Loops', 1) or 1
+    total = node.get('Actual Total Time', 0.0) * loops
+    children = sum(child.get('Actual Total Time', 0.0) * (child.get('Actual Loops', 1) or 1)
+                   for child in node.get('Plans', []))
+    return max(total - children, 0.0)
+
+
+def summarize_plan(explain):
+    """Pull the numbers worth trending out of EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) output"""
+    root = explain['Plan']
+    nodes = list(walk(root))
+    slowest = max(nodes, key=node_self_time)
+    sorts = [n for n in nodes if n['Node Type'] in ('Sort', 'Incremental Sort')]
+    return {
+        'plan_hash': plan_hash(root),
+        'planning_ms': explain.get('Planning Time'),
+        'execution_ms': explain.get('Execution Time'),
+        'plan_rows': root.get('Actual Rows'),
+        'shared_hit_blocks': root.get('Shared Hit Blocks', 0),
+        'shared_read_blocks': root.get('Shared Read Blocks', 0),
+        'temp_written_blocks': root.get('Temp Written Blocks', 0),
+        'slowest_node': ' on '.join(filter(None, [slowest['Node Type'], slowest.get('Relation Name')])),
+        'slowest_node_ms': round(node_self_time(slowest), 3),
+        'disk_sorts': sum(1 for n in sorts if n.get('Sort Space Type') == 'Disk'),
+    }
+
+
+class ModelPerformanceCollector:
+    """Explains every model of a dbt run and records the results in the perf schema"""
+
+    def __init__(self, conn, perf_schema='perf', analyze=True, statement_timeout_s=600):
+        self.conn = conn
+        self.perf_schema = quote_ident(perf_schema)
+        self.plans_table = quote_ident(f"{perf_schema}.model_plans")
+        self.runs_table = quote_ident(f"{perf_schema}.model_runs")
+        self.analyze = analyze
+        self.statement_timeout_ms = int(statement_timeout_s * 1000)
+
+    def ensure_tables(self):
+        with self.conn.cursor() as cur:
+            cur.execute(f"create schema if not exists {self.perf_schema}")
+            cur.execute(f"""
+                create table if not exists {self.plans_table} (
+                    invocation_id text not null,
+                    unique_id text not null,
+                    model_name text not null,
+                    generated_at timestamptz not null,
+                    execution_time double precision,
+                    rows_affected bigint,
+                    total_bytes bigint,
+                    index_bytes bigint,
+                    plan_hash text,
+                    plan_changed boolean,
+                    planning_ms double precision,
+                    execution_ms double precision,
+                    shared_hit_blocks bigint,
+                    shared_read_blocks bigint,
+                    temp_written_blocks bigint,
+                    disk_sorts integer,
+                    slowest_node text,
+                    slowest_node_ms double precision,
+                    plan jsonb,
+                    captured_at timestamptz not null default now(),
+                    primary key (invocation_id, unique_id)
+                )
+            """)
+        self.conn.commit()
+
+    def previous_plan_hashes(self):
+        with self.conn.cursor() as cur:
+            cur.execute(f"""
+                select distinct on (unique_id) unique_id, plan_hash
+                from {self.plans_table}
+                where plan_hash is not null
+                order by unique_id, generated_at desc
+            """)
+            return dict(cur.fetchall())
+
+    def recorded_build_stats(self, invocation_id):
+        """Build stats the on-run-end hook wrote to perf.model_runs for this invocation"""
+        with self.conn.cursor() as cur:
+            cur.execute("select to_regclass(%s) is not null", (f"{self.perf_schema}.model_runs",))
+            if not cur.fetchone()[0]:
+                return {}
+            cur.execute(f"""
+                select unique_id, execution_time, rows_affected, total_bytes, index_bytes
+                from {self.runs_table}
+                where invocation_id = %s
+            """, (invocation_id,))
+            return {row[0]: dict(zip(BUILD_STAT_FIELDS, row[1:])) for row in cur.fetchall()}
+
+    def relation_sizes(self, schema, relation):
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                select pg_total_relation_size(c.oid), pg_indexes_size(c.oid)
+                from pg_class c
+                join pg_namespace n on n.oid = c.relnamespace
+                where n.nspname = %s and c.relname = %s and c.relkind in ('r', 'm', 'p')
+            """, (schema, relation))
+            row = cur.fetchone()
+        return row if row else (None, None)
+
+    def explain(self, compiled_sql):
+        """EXPLAIN one compiled model SELECT; rolled back so nothing it touches persists"""
+        options = 'ANALYZE, BUFFERS, FORMAT JSON' if self.analyze else 'FORMAT JSON'
+        with self.conn.cursor() as cur:
+            try:
+                cur.execute(f"set local statement_timeout = {self.statement_timeout_ms}")
+                cur.execute(f"explain ({options}) {compiled_sql}")
+                return cur.fetchone()[0][0]
+            finally:
+                self.conn.rollback()
+
+    def collect(self, run_results, manifest, select=None):
+        """Explain each successfully built model; returns one summary dict per model"""
+        generated_at = run_results['metadata']['generated_at']
+        invocation_id = run_results['metadata']['invocation_id']
+        previous = self.previous_plan_hashes()
+        recorded = self.recorded_build_stats(invocation_id)
+        models = []
+
+        for result in run_results['results']:
+            node = manifest['nodes'].get(result['unique_id'])
+            if not node or node['resource_type'] != 'model' or result['status'] != 'success':
+                continue
+            if select and node['name'] not in select:
+                continue
+            if node['config'].get('materialized') not in PLANNED_MATERIALIZATIONS:
+                continue
+
+            compiled_sql = (node.get('compiled_code') or '').strip().rstrip(';')
+            summary = {
+                'model': node['name'],
+                'unique_id': node['unique_id'],
+                'materialized': node['config'].get('materialized'),
+            }
+            if node['unique_id'] in recorded:
+                summary.update(recorded[node['unique_id']])
+            else:
+                summary['execution_time'] = result.get('execution_time')
+                summary['rows_affected'] = (result.get('adapter_response') or {}).get('rows_affected')
+                summary['total_bytes'], summary['index_bytes'] = self.relation_sizes(
+                    node['schema'], node.get('alias') or node['name'])
+
+            plan = None
+            if compiled_sql:
+                try:
+                    plan = self.explain(compiled_sql)
+                    summary.update(summarize_plan(plan))
+                except Exception as e:
+                    print(f"⚠️  Could not explain {node['name']}: {str(e).splitlines()[0]}")
+            if summary['rows_affected'] is None or summary['rows_affected'] < 0:  # views report -1
+                summary['rows_affected'] = summary.get('plan_rows')
+
+            old_hash = previous.get(node['unique_id'])
+            summary['plan_changed'] = bool(old_hash and summary.get('plan_hash')
+                                           and old_hash != summary['plan_hash'])
+            models.append(summary)
+            self.save(invocation_id, generated_at, summary, plan)
+
+        return {'invocation_id': invocation_id, 'generated_at': generated_at, 'models': models}
+
+    def save(self, invocation_id, generated_at, summary, plan):
+        with self.conn.cursor() as cur:
+            cur.execute(f"""
+                insert into {self.plans_table} (
+                    invocation_id, unique_id, model_name, generated_at, execution_time,
+                    rows_affected, total_bytes, index_bytes, plan_hash, plan_changed,
+                    planning_ms, execution_ms, shared_hit_blocks, shared_read_blocks,
+                    temp_written_blocks, disk_sorts, slowest_node, slowest_node_ms, plan
+                ) values (
+                    %(invocation_id)s, %(unique_id)s, %(model)s, %(generated_at)s, %(execution_time)s,
+                    %(rows_affected)s, %(total_bytes)s, %(index_bytes)s, %(plan_hash)s, %(plan_changed)s,
+                    %(planning_ms)s, %(execution_ms)s, %(shared_hit_blocks)s, %(shared_read_blocks)s,
+                    %(temp_written_blocks)s, %(disk_sorts)s, %(slowest_node)s, %(slowest_node_ms)s, %(plan)s
+                )
+                on conflict (invocation_id, unique_id) do update set
+                    plan_hash = excluded.plan_hash,
+                    plan_changed = excluded.plan_changed,
+                    planning_ms = excluded.planning_ms,
+                    execution_ms = excluded.execution_ms,
+                    plan = excluded.plan,
+                    captured_at = now()
+            """, {
+                'planning_ms': None, 'execution_ms': None, 'plan_hash': None,
+                'shared_hit_blocks': None, 'shared_read_blocks': None, 'temp_written_blocks': None,
+                'disk_sorts': None, 'slowest_node': None, 'slowest_node_ms': None,
+                **summary,
+                'invocation_id': invocation_id,
+                'generated_at': generated_at,
+                'plan': Json(plan) if plan else None,
+            })
+        self.conn.commit()
+
+
+def append_history(path, run, keep_runs):
+    """Add this run to the JSON history read by the dashboard, replacing a re-collected run"""
+    path = Path(path)
+    history = {'runs': []}
+    if path.exists():
+        with open(path) as f:
+            history = json.load(f)
+    runs = [r for r in history.get('runs', []) if r['invocation_id'] != run['invocation_id']]
+    runs.append(run)
+    runs.sort(key=lambda r: r['generated_at'])
+    history = {
+        'updated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'runs': runs[-keep_runs:],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(history, f, indent=2, default=str)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Capture query plans and build stats for the last dbt run')
+    add_connection_arguments(parser)
+    parser.add_argument('--target-dir', default=str(PROJECT_ROOT / 'target'),
+                        help='dbt target directory holding run_results.json and manifest.json')
+    parser.add_argument('--select', nargs='+', help='Only these models (default: every model in the run)')
+    parser.add_argument('--perf-schema', default='perf', help='Schema for the performance tables (default: perf)')
+    parser.add_argument('--no-analyze', action='store_true',
+                        help='Plain EXPLAIN without executing the queries (no timings or buffers)')
+    parser.add_argument('--statement-timeout', type=float, default=600,
+                        help='Per-model EXPLAIN ANALYZE timeout in seconds (default: 600)')
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY),
+                        help='JSON history file for the dashboard (default: reports/model_performance.json)')
+    parser.add_argument('--keep-runs', type=int, default=50, help='Runs kept in the history file (default: 50)')
+
+    args = parser.parse_args()
+
+    run_results, manifest = load_artifacts(args.target_dir)
+
+    conn = connect(args.dsn)
+    try:
+        collector = ModelPerformanceCollector(conn, args.perf_schema, analyze=not args.no_analyze,
+                                              statement_timeout_s=args.statement_timeout)
+        collector.ensure_tables()
+        run = collector.collect(run_results, manifest, select=set(args.select or []))
+    finally:
+        conn.close()
+
+    append_history(args.history, run, args.keep_runs)
+    changed = sorted(model['model'] for model in run['models'] if model['plan_changed'])
+    append_events(
+        [make_event('collector', f"Captured query plans of {len(run['models'])} models "
+                                 f"({len(changed)} changed)", invocation_id=run['invocation_id'])]
+        + [make_event('collector', f"Query plan of {model} changed since the previous run", 'warning',
+                      invocation_id=run['invocation_id'], model=model)
+           for model in changed]
+    )
+
+    print(f"⏱️  Captured {len(run['models'])} models from run {run['invocation_id']}")
+    for model in sorted(run['models'], key=lambda m: -(m['execution_time'] or 0)):
+        changed = '  🔀 plan changed' if model['plan_changed'] else ''
+        slowest = f"  slowest: {model['slowest_node']} ({model['slowest_node_ms']:.0f} ms)" if model.get('slowest_node') else ''
+        print(f"  {model['model']:<36} {model['execution_time'] or 0:>7.2f}s  "
+              f"{model['rows_affected'] or 0:>12,} rows{slowest}{changed}")
+
+
+if __name__ == "__main__":
+    main()
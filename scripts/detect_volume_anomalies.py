@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Streaming Volume Anomaly Detector
+Purpose: Score each new batch of daily claim volumes against running statistics
+
+The `test_data_freshness_anomalies` dbt test recomputes avg/stddev over the whole of
+fact_claims on every run. This service keeps the same statistics incrementally instead:
+one Welford accumulator per (claim type, weekday, metric) lives in a small state table,
+each run only reads the days after the last one folded into it, and every day is scored
+against the baseline built from the days before it.
+
+fact_claims is rebuilt on every dbt run and has no ingestion time to track, so claims that
+arrive late land on days that were already scored. The newest --settle-days days are
+therefore a trailing window: re-scored on every run with their current volumes (their
+alerts are provisional and replaced each time), but only folded into the baseline once
+they leave the window, so a partial last day never skews it. Days without any claims of
+a type score as zero rather than being skipped.
+
+The same batch also raises high-cost member alerts: members whose claims since the
+settled days took their total over --high-cost-threshold, once per member. Both kinds of
+alert are appended to the dashboard event log (dashboard/event_log.py) for the activity
+monitor when they are first raised.
+"""
+
+import argparse
+import datetime
+import json
+import math
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from psycopg2.extras import execute_values
+
+from warehouse import add_connection_arguments, connect, quote_ident
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from dashboard.event_log import append_events, make_event  # noqa: E402
+
+METRICS = ('daily_claim_count', 'daily_claim_amount')
+ALL_TYPES = 'All Types'  # same rollup label as metrics_claims_summary
+
+
+@dataclass
+class RunningStats:
+    """Welford accumulator for the mean and variance of a stream of observations"""
+    observations: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, value):
+        self.observations += 1
+        delta = value - self.mean
+        self.mean += delta / self.observations
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def stddev(self):
+        if self.observations < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.observations - 1))
+
+    def z_score(self, value):
+        stddev = self.stddev
+        if stddev == 0:
+            return None
+        return (value - self.mean) / stddev
+
+
+@dataclass
+class VolumeAlert:
+    """A daily volume observation that fell outside the expected band"""
+    metric_date: datetime.date
+    claim_type: str
+    metric: str
+    observed: float
+    expected: float
+    stddev: float
+    z_score: float
+    settled: bool = True
+
+    @property
+    def direction(self):
+        return 'too high' if self.z_score > 0 else 'too low'
+
+    def describe(self):
+        return (f"Volume anomaly - {self.direction}: {self.claim_type} {self.metric} on "
+                f"{self.metric_date} was {self.observed:,.2f} (expected {self.expected:,.2f}, "
+                f"z={self.z_score:+.2f})")
+
+
+@dataclass
+class HighCostMemberAlert:
+    """A member whose newly loaded claims took their total claim amount over the threshold"""
+    beneficiary_id: str
+    total_amount: float
+    new_amount: float
+    threshold: float
+
+    def describe(self):
+        return (f"High-cost member alert: Member ID {self.beneficiary_id} exceeded "
+                f"${self.threshold:,.0f} in claims (${self.total_amount:,.0f}, "
+                f"${self.new_amount:,.0f} in new claims)")
+
+
+class VolumeAnomalyDetector:
+    """Incremental replacement for the test_data_freshness_anomalies cross join"""
+
+    def __init__(self, conn, schema, state_schema='monitoring', threshold=2.0, min_observations=8,
+                 settle_days=3):
+        self.conn = conn
+        self.fact_table = quote_ident(f"{schema}.fact_claims")
+        self.member_table = quote_ident(f"{schema}.dim_beneficiaries")
+        self.state_schema = quote_ident(state_schema)
+        self.baseline_table = quote_ident(f"{state_schema}.volume_baseline")
+        self.alerts_table = quote_ident(f"{state_schema}.volume_anomaly_alerts")
+        self.member_alerts_table = quote_ident(f"{state_schema}.high_cost_member_alerts")
+        self.threshold = threshold
+        self.min_observations = min_observations
+        self.settle_days = settle_days
+
+    def ensure_state_tables(self):
+        """Create the state and alert tables on first use"""
+        with self.conn.cursor() as cur:
+            cur.execute(f"create schema if not exists {self.state_schema}")
+            cur.execute(f"""
+                create table if not exists {self.baseline_table} (
+                    claim_type text not null,
+                    day_of_week smallint not null,
+                    metric text not null,
+                    observations bigint not null,
+                    mean double precision not null,
+                    m2 double precision not null,
+                    last_metric_date date not null,
+                    updated_at timestamptz not null default now(),
+                    primary key (claim_type, day_of_week, metric)
+                )
+            """)
+            cur.execute(f"""
+                create table if not exists {self.alerts_table} (
+                    alert_id bigserial primary key,
+                    metric_date date not null,
+                    claim_type text not null,
+                    metric text not null,
+                    observed double precision not null,
+                    expected double precision not null,
+                    stddev double precision not null,
+                    z_score double precision not null,
+                    direction text not null,
+                    detected_at timestamptz not null default now()
+                )
+            """)
+            # Alerts on days still in the trailing window are replaced on every run
+            cur.execute(f"alter table {self.alerts_table} add column if not exists "
+                        f"settled boolean not null default true")
+            cur.execute(f"""
+                create table if not exists {self.member_alerts_table} (
+                    beneficiary_id text primary key,
+                    total_amount double precision not null,
+                    threshold double precision not null,
+                    detected_at timestamptz not null default now()
+                )
+            """)
+
+    def load_baseline(self):
+        """Read the running statistics and the last settled day folded into them"""
+        with self.conn.cursor() as cur:
+            cur.execute(f"""
+                select claim_type, day_of_week, metric, observations, mean, m2, last_metric_date
+                from {self.baseline_table}
+            """)
+            baseline = {}
+            watermark = None
+            for claim_type, day_of_week, metric, observations, mean, m2, last_date in cur.fetchall():
+                baseline[(claim_type, day_of_week, metric)] = RunningStats(observations, mean, m2)
+                if watermark is None or last_date > watermark:
+                    watermark = last_date
+        return baseline, watermark
+
+    def fetch_batch(self, since=None):
+        """Aggregate only the claim days after the watermark (uses the claim_start_date index)"""
+        query = f"""
+            select claim_start_date, claim_type, count(*), coalesce(sum(claim_amount), 0)
+            from {self.fact_table}
+            {'where claim_start_date > %(since)s' if since else ''}
+            group by claim_start_date, claim_type
+            order by claim_start_date, claim_type
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(query, {'since': since})
+            return cur.fetchall()
+
+    def high_cost_crossings(self, since, threshold):
+        """Members whose claims after the watermark took their total over threshold
+
+        Only members with claims in the batch are aggregated (beneficiary_key index); members
+        already alerted on are left out, as the same days are read again until they settle.
+        """
+        query = f"""
+            with batch_members as (
+                select distinct beneficiary_key
+                from {self.fact_table}
+                where claim_start_date > %(since)s
+            )
+            select b.beneficiary_id, sum(c.claim_amount),
+                   sum(c.claim_amount) filter (where c.claim_start_date > %(since)s)
+            from {self.fact_table} c
+            join batch_members using (beneficiary_key)
+            join {self.member_table} b using (beneficiary_key)
+            group by b.beneficiary_id
+            having sum(c.claim_amount) >= %(threshold)s
+               and coalesce(sum(c.claim_amount) filter (where c.claim_start_date <= %(since)s), 0) < %(threshold)s
+               and b.beneficiary_id not in (select beneficiary_id from {self.member_alerts_table})
+            order by 2 desc
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(query, {'since': since, 'threshold': threshold})
+            return [HighCostMemberAlert(beneficiary_id, float(total), float(new_amount), threshold)
+                    for beneficiary_id, total, new_amount in cur.fetchall()]
+
+    def score_batch(self, rows, baseline, emit_alerts=True, since=None):
+        """Score each day against the statistics of the days before it
+
+        Every day from the one after `since` to the newest in rows is scored, with zero
+        volume for a claim type (or a whole day) without claims. Settled days are folded
+        into `baseline`, updated in place; the last settle_days days are scored against it
+        but not folded in. Runs in O(days x claim types); returns (alerts, touched, dates).
+        """
+        daily = {}
+        claim_types = {claim_type for claim_type, _, _ in baseline} | {ALL_TYPES}
+        for metric_date, claim_type, claim_count, claim_amount in rows:
+            claim_types.add(claim_type)
+            daily[(metric_date, claim_type)] = (float(claim_count), float(claim_amount))
+            totals = daily.get((metric_date, ALL_TYPES), (0.0, 0.0))
+            daily[(metric_date, ALL_TYPES)] = (totals[0] + float(claim_count),
+                                               totals[1] + float(claim_amount))
+        if not daily:
+            return [], {}, []
+
+        latest = max(metric_date for metric_date, _ in daily)
+        first = since + datetime.timedelta(days=1) if since else min(metric_date for metric_date, _ in daily)
+        dates = [first + datetime.timedelta(days=offset) for offset in range((latest - first).days + 1)]
+        settled_through = latest - datetime.timedelta(days=self.settle_days)
+
+        alerts = []
+        touched = {}
+        for metric_date in dates:
+            settled = metric_date <= settled_through
+            day_of_week = metric_date.isoweekday() % 7 + 1  # 1=Sunday, 7=Saturday as in dim_date
+            for claim_type in sorted(claim_types):
+                values = daily.get((metric_date, claim_type), (0.0, 0.0))
+                for metric, value in zip(METRICS, values):
+                    key = (claim_type, day_of_week, metric)
+                    stats = baseline.setdefault(key, RunningStats())
+                    z_score = stats.z_score(value)
+                    if (emit_alerts and z_score is not None
+                            and stats.observations >= self.min_observations
+                            and abs(z_score) > self.threshold):
+                        alerts.append(VolumeAlert(metric_date, claim_type, metric, value,
+                                                  stats.mean, stats.stddev, z_score, settled))
+                    if settled:
+                        stats.update(value)
+                        touched[key] = metric_date
+        return alerts, touched, dates
+
+    def save(self, baseline, touched, alerts, member_alerts=()):
+        """Persist the updated accumulators and alerts in one transaction
+
+        Provisional alerts of the previous run are replaced by this run's, which scored the
+        same days again; returns the alerts that were not raised before.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(f"""
+                delete from {self.alerts_table} where not settled
+                returning metric_date, claim_type, metric
+            """)
+            raised = set(cur.fetchall())
+            if touched:
+                execute_values(cur, f"""
+                    insert into {self.baseline_table}
+                        (claim_type, day_of_week, metric, observations, mean, m2, last_metric_date)
+                    values %s
+                    on conflict (claim_type, day_of_week, metric) do update set
+                        observations = excluded.observations,
+                        mean = excluded.mean,
+                        m2 = excluded.m2,
+                        last_metric_date = excluded.last_metric_date,
+                        updated_at = now()
+                """, [
+                    (*key, baseline[key].observations, baseline[key].mean, baseline[key].m2, last_date)
+                    for key, last_date in touched.items()
+                ])
+            if alerts:
+                execute_values(cur, f"""
+                    insert into {self.alerts_table}
+                        (metric_date, claim_type, metric, observed, expected, stddev, z_score, direction,
+                         settled)
+                    values %s
+                """, [
+                    (a.metric_date, a.claim_type, a.metric, a.observed, a.expected, a.stddev,
+                     a.z_score, a.direction, a.settled)
+                    for a in alerts
+                ])
+            if member_alerts:
+                execute_values(cur, f"""
+                    insert into {self.member_alerts_table} (beneficiary_id, total_amount, threshold)
+                    values %s
+                    on conflict (beneficiary_id) do nothing
+                """, [(a.beneficiary_id, a.total_amount, a.threshold) for a in member_alerts])
+        self.conn.commit()
+        return [a for a in alerts if (a.metric_date, a.claim_type, a.metric) not in raised]
+
+    def run(self, bootstrap=False, high_cost_threshold=None):
+        """Process everything after the last settled day
+
+        Returns (days scored, days settled, new alerts, member alerts, bootstrapped).
+        """
+        self.ensure_state_tables()
+        baseline, watermark = self.load_baseline()
+        # An empty baseline has nothing to score against yet: fold the history in silently
+        bootstrap = bootstrap or not baseline
+        rows = self.fetch_batch(since=watermark)
+        alerts, touched, dates = self.score_batch(rows, baseline, emit_alerts=not bootstrap, since=watermark)
+        member_alerts = []
+        if high_cost_threshold and watermark is not None and not bootstrap:
+            member_alerts = self.high_cost_crossings(watermark, high_cost_threshold)
+        alerts = self.save(baseline, touched, alerts, member_alerts)
+        settled = max(len(dates) - self.settle_days, 0)
+        return len(dates), settled, alerts, member_alerts, bootstrap
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score new claim days against running volume statistics')
+    add_connection_arguments(parser)
+    parser.add_argument('--state-schema', default='monitoring',
+                        help='Schema for the baseline and alert tables (default: monitoring)')
+    parser.add_argument('--threshold', type=float, default=2.0,
+                        help='Alert when |z-score| exceeds this many standard deviations (default: 2.0)')
+    parser.add_argument('--min-observations', type=int, default=8,
+                        help='Days of history a baseline needs before it can alert (default: 8)')
+    parser.add_argument('--settle-days', type=int, default=3,
+                        help='Re-score the newest days this many runs as late claims arrive, and only then '
+                             'add them to the baseline (default: 3)')
+    parser.add_argument('--high-cost-threshold', type=float, default=25000,
+                        help='Alert when new claims take a member over this total claim amount; 0 disables '
+                             '(default: 25000)')
+    parser.add_argument('--bootstrap', action='store_true',
+                        help='Fold the batch into the baseline without emitting alerts')
+    parser.add_argument('--json', action='store_true', help='Print alerts as JSON lines')
+    parser.add_argument('--fail-on-alert', action='store_true',
+                        help='Exit with status 1 when any alert is raised')
+
+    args = parser.parse_args()
+
+    conn = connect(args.dsn)
+    try:
+        detector = VolumeAnomalyDetector(conn, args.schema, args.state_schema,
+                                         threshold=args.threshold,
+                                         min_observations=args.min_observations,
+                                         settle_days=args.settle_days)
+        days, settled, alerts, member_alerts, bootstrapped = detector.run(
+            bootstrap=args.bootstrap, high_cost_threshold=args.high_cost_threshold)
+    finally:
+        conn.close()
+
+    # Activity monitor feed; a run that settled no new days and raised nothing has nothing to report
+    if settled or alerts or member_alerts:
+        summary = (f"Volume baseline bootstrapped from {settled} claim days" if bootstrapped else
+                   f"Volume check scored {days} claim days ({settled} settled): {len(alerts)} new anomalies, "
+                   f"{len(member_alerts)} high-cost members")
+        append_events(
+            [make_event('anomaly', summary, days=days, settled=settled)]
+            + [make_event('anomaly', alert.describe(), 'warning', metric_date=alert.metric_date,
+                          claim_type=alert.claim_type, metric=alert.metric, z_score=round(alert.z_score, 3))
+               for alert in alerts]
+            + [make_event('high_cost_member', alert.describe(), 'warning',
+                          beneficiary_id=alert.beneficiary_id, total_amount=alert.total_amount)
+               for alert in member_alerts]
+        )
+
+    if bootstrapped:
+        print(f"📥 Baseline bootstrapped from {settled} claim days (no alerts emitted)")
+    else:
+        print(f"🔍 Scored {days} claim days ({settled} settled): {len(alerts)} new anomalies, "
+              f"{len(member_alerts)} high-cost members")
+
+    for alert in alerts:
+        if args.json:
+            print(json.dumps({
+                'metric_date': alert.metric_date.isoformat(),
+                'claim_type': alert.claim_type,
+                'metric': alert.metric,
+                'observed': alert.observed,
+                'expected': alert.expected,
+                'z_score': round(alert.z_score, 3),
+                'direction': alert.direction,
+                'settled': alert.settled,
+            }))
+        else:
+            print(f"⚠️  {alert.describe()}")
+    for alert in member_alerts:
+        if args.json:
+            print(json.dumps({
+                'beneficiary_id': alert.beneficiary_id,
+                'total_amount': alert.total_amount,
+                'new_amount': alert.new_amount,
+                'threshold': alert.threshold,
+            }))
+        else:
+            print(f"💰 {alert.describe()}")
+
+    if (alerts or member_alerts) and args.fail_on_alert:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
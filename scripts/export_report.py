@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Streaming Report Exporter
+Purpose: Export marts and compiled analyses as CSV, gzip CSV or Parquet with constant client memory
+
+CSV output is streamed straight from `COPY (...) TO STDOUT`; Parquet output is read through
+a server-side cursor and written one row group per batch. Large extracts can be split into
+claim_start_date ranges that are exported in parallel, one file per range.
+
+Usage:
+    python scripts/export_report.py --model fact_claims --output exports/fact_claims.csv.gz --parts 8
+    python scripts/export_report.py --analysis business_intelligence_report_en --output exports/bi_report.csv
+"""
+
+import argparse
+import datetime
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from warehouse import add_connection_arguments, connect, quote_ident
+
+PROJECT_ROOT = Path(__file__).parent.parent
+COMPILED_ANALYSES = PROJECT_ROOT / "target" / "compiled" / "claims_data_warehouse" / "analyses"
+FORMATS = ('csv', 'csv.gz', 'parquet')
+
+# Postgres type OIDs -> Arrow type names for Parquet output (anything else is written as string).
+# numeric is exported as float64: the marts mix rounded amounts with unbounded-scale ratios.
+PARQUET_TYPES = {
+    16: 'bool_', 20: 'int64', 21: 'int16', 23: 'int32',
+    700: 'float32', 701: 'float64', 1700: 'float64',
+    1082: 'date32', 1114: 'timestamp_us', 1184: 'timestamp_us_utc',
+}
+
+
+def infer_format(output):
+    name = output.name.lower()
+    for fmt in sorted(FORMATS, key=len, reverse=True):
+        if name.endswith('.' + fmt):
+            return fmt
+    raise SystemExit(f"❌ Cannot infer format from {output.name}; use --format")
+
+
+def source_query(args):
+    """Build the SELECT to export from --model / --analysis / --query"""
+    if args.model:
+        return f"select * from {quote_ident(f'{args.schema}.{args.model}')}"
+    if args.analysis:
+        path = COMPILED_ANALYSES / f"{args.analysis}.sql"
+        if not path.exists():
+            raise SystemExit(f"❌ {path} not found. Run `dbt compile` first.")
+        sql = path.read_text(encoding='utf-8')
+    else:
+        sql = args.query
+    return sql.strip().rstrip(';').strip()
+
+
+def part_path(output, index, parts):
+    if parts == 1:
+        return output
+    name = output.name
+    for fmt in sorted(FORMATS, key=len, reverse=True):
+        if name.lower().endswith('.' + fmt):
+            return output.with_name(f"{name[:-len(fmt) - 1]}.part-{index:03d}.{fmt}")
+    return output.with_name(f"{name}.part-{index:03d}")
+
+
+def date_ranges(conn, query, column, parts):
+    """Split [min, max] of `column` into `parts` contiguous half-open ranges"""
+    with conn.cursor() as cur:
+        cur.execute(f"select min({quote_ident(column)}), max({quote_ident(column)}) from ({query}) src")
+        low, high = cur.fetchone()
+    if low is None:
+        return [(None, None)]
+    if isinstance(low, datetime.datetime):
+        low, high = low.date(), high.date()
+    span = (high - low).days + 1
+    parts = max(1, min(parts, span))
+    bounds = [low + datetime.timedelta(days=span * i // parts) for i in range(parts)]
+    bounds.append(high + datetime.timedelta(days=1))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def range_query(cur, query, column, bounds, first):
+    """Restrict the export query to one claim date range (nulls go to the first part)"""
+    low, high = bounds
+    if low is None:
+        return query
+    null_clause = f" or {quote_ident(column)} is null" if first else ""
+    return cur.mogrify(
+        f"select * from ({query}) src where ({quote_ident(column)} >= %s and {quote_ident(column)} < %s{null_clause})",
+        (low, high),
+    ).decode()
+
+
+def export_csv(conn, query, output, compress):
+    with conn.cursor() as cur:
+        opener = gzip.open if compress else open
+        with opener(output, 'wb') as f:
+            cur.copy_expert(f"copy ({query}) to stdout with (format csv, header true)", f, size=1024 * 1024)
+        return cur.rowcount
+
+
+def export_parquet(conn, query, output, batch_size):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise SystemExit("❌ Parquet export requires pyarrow (pip install pyarrow)")
+
+    arrow_types = {
+        'bool_': pa.bool_(), 'int16': pa.int16(), 'int32': pa.int32(), 'int64': pa.int64(),
+        'float32': pa.float32(), 'float64': pa.float64(), 'date32': pa.date32(),
+        'timestamp_us': pa.timestamp('us'), 'timestamp_us_utc': pa.timestamp('us', tz='UTC'),
+    }
+    rows = 0
+    # Named cursor = server-side portal: only batch_size rows are held client-side at a time
+    with conn.cursor(name='export_stream') as cur:
+        cur.itersize = batch_size
+        cur.execute(query)
+        batch = cur.fetchmany(batch_size)
+        schema = pa.schema([
+            (column.name, arrow_types.get(PARQUET_TYPES.get(column.type_code), pa.string()))
+            for column in cur.description
+        ])
+        with pq.ParquetWriter(output, schema, compression='zstd') as writer:
+            while batch:
+                columns = list(zip(*batch))
+                arrays = []
+                for field, values in zip(schema, columns):
+                    if pa.types.is_string(field.type):
+                        values = [None if v is None else str(v) for v in values]
+                    elif pa.types.is_floating(field.type):
+                        values = [None if v is None else float(v) for v in values]
+                    arrays.append(pa.array(values, type=field.type))
+                writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                rows += len(batch)
+                batch = cur.fetchmany(batch_size)
+    return rows
+
+
+def export_part(dsn, query, output, fmt, batch_size):
+    conn = connect(dsn)
+    try:
+        conn.set_session(readonly=True)
+        started = time.perf_counter()
+        if fmt == 'parquet':
+            rows = export_parquet(conn, query, output, batch_size)
+        else:
+            rows = export_csv(conn, query, output, compress=(fmt == 'csv.gz'))
+        conn.commit()
+        return output, rows, time.perf_counter() - started
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream a mart or analysis result to CSV, gzip CSV or Parquet')
+    add_connection_arguments(parser)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--model', help='Mart/model to export, e.g. fact_claims')
+    source.add_argument('--analysis', help='Compiled analysis under target/compiled, e.g. business_intelligence_report_en')
+    source.add_argument('--query', help='Arbitrary SELECT statement')
+    parser.add_argument('--output', type=Path, required=True, help='Output file (.csv, .csv.gz or .parquet)')
+    parser.add_argument('--format', choices=FORMATS, help='Output format (default: inferred from --output)')
+    parser.add_argument('--parts', type=int, default=1,
+                        help='Split into this many date ranges exported in parallel (default: 1)')
+    parser.add_argument('--split-column', default='claim_start_date',
+                        help='Date column used for range splitting (default: claim_start_date)')
+    parser.add_argument('--batch-size', type=int, default=50000,
+                        help='Rows per server-side fetch / Parquet row group (default: 50000)')
+
+    args = parser.parse_args()
+
+    fmt = args.format or infer_format(args.output)
+    query = source_query(args)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = connect(args.dsn)
+    try:
+        ranges = date_ranges(conn, query, args.split_column, args.parts) if args.parts > 1 else [(None, None)]
+        with conn.cursor() as cur:
+            part_queries = [range_query(cur, query, args.split_column, bounds, first=(i == 0))
+                            for i, bounds in enumerate(ranges)]
+    finally:
+        conn.close()
+
+    print(f"💾 Exporting {args.model or args.analysis or 'query'} as {fmt} in {len(part_queries)} part(s)...")
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(part_queries)) as executor:
+        futures = [executor.submit(export_part, args.dsn, part_query,
+                                   part_path(args.output, i, len(part_queries)), fmt, args.batch_size)
+                   for i, part_query in enumerate(part_queries)]
+        results = [future.result() for future in futures]
+
+    total_rows = 0
+    total_bytes = 0
+    for output, rows, seconds in results:
+        size = output.stat().st_size
+        total_rows += max(rows, 0)
+        total_bytes += size
+        print(f"  {output}  {rows:>12,} rows  {size / 1024 / 1024:>9.1f} MB  {seconds:>6.1f}s")
+    elapsed = time.perf_counter() - started
+    print(f"✅ Exported {total_rows:,} rows ({total_bytes / 1024 / 1024:.1f} MB) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Parallel Raw CMS Bulk Loader
+Purpose: Stream CMS DE-SynPUF files into the raw schema with COPY FROM STDIN
+
+`dbt seed` issues row inserts and only suits the sample files. This loader maps each
+file onto its cms_raw source table (see models/staging/sources.yml), splits large
+files into line-aligned byte ranges and COPYs the ranges in parallel over a
+connection pool. Every load (or failed load) is recorded in the dashboard event log for
+the activity monitor.
+
+The parallel streams commit on their own connections, so they write to an unlogged
+loading table per target; the raw table itself is only replaced once every stream has
+finished, in one transaction (truncate, insert from the loading table). Readers and dbt
+see the previous rows until then, and a failed load leaves the raw tables as they were.
+The tables are not swapped by rename because the staging views are bound to them.
+Indexes are dropped in that transaction and rebuilt afterwards.
+
+Usage:
+    python scripts/load_raw_cms.py data/synpuf/ --workers 8
+"""
+
+import argparse
+import gzip
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from psycopg2.pool import ThreadedConnectionPool
+
+from warehouse import add_connection_arguments, connect, quote_ident
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from dashboard.event_log import append_event  # noqa: E402
+
+# File name fragment -> cms_raw table. Matches both the DE-SynPUF release names
+# (DE1_0_2008_to_2010_Inpatient_Claims_Sample_1.csv) and the seeds (sample_inpatient_claims.csv).
+TABLE_PATTERNS = [
+    ('beneficiary_summary', re.compile(r'beneficiary_summary')),
+    ('inpatient_claims', re.compile(r'inpatient_claims')),
+    ('outpatient_claims', re.compile(r'outpatient_claims')),
+    ('carrier_claims', re.compile(r'carrier_claims')),
+    ('provider_data', re.compile(r'provider_data')),
+]
+
+# Indexes the staging models join and filter on; created only after the data is in
+TABLE_INDEXES = {
+    'beneficiary_summary': ['desynpuf_id'],
+    'inpatient_claims': ['clm_id', 'desynpuf_id', 'prvdr_num'],
+    'outpatient_claims': ['clm_id', 'desynpuf_id', 'prvdr_num'],
+    'carrier_claims': ['clm_id', 'desynpuf_id', 'prvdr_npi'],
+    'provider_data': ['npi'],
+}
+
+# Claim dates arrive as YYYYMMDD, which Postgres accepts for date columns.
+# Birth/death dates stay text: staging compares them against '19000101' / '00000000'.
+DATE_COLUMNS = {'clm_from_dt', 'clm_thru_dt', 'clm_admsn_dt', 'nch_bene_dschrg_dt'}
+INTEGER_COLUMNS = {
+    'bene_hi_cvrage_tot_mons', 'bene_smi_cvrage_tot_mons',
+    'bene_hmo_cvrage_tot_mons', 'plan_cvrg_mos_num',
+}
+
+
+def column_type(column):
+    """Postgres type for a raw CMS column"""
+    if column in DATE_COLUMNS:
+        return 'date'
+    if column in INTEGER_COLUMNS:
+        return 'integer'
+    if column.endswith(('_amt', '_am')) or '_amt_' in column:
+        return 'numeric'
+    return 'text'
+
+
+def table_for_file(path):
+    name = path.name.lower()
+    for table, pattern in TABLE_PATTERNS:
+        if pattern.search(name):
+            return table
+    return None
+
+
+def read_header(path):
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8', newline='') as f:
+        header = f.readline()
+    return [column.strip().strip('"').lower() for column in header.rstrip('\r\n').split(',')]
+
+
+@dataclass
+class Chunk:
+    """A line-aligned byte range of one input file"""
+    table: str
+    path: Path
+    start: int
+    end: int  # -1 streams to end of file (used for gzip input, which cannot seek)
+
+
+class RangeReader:
+    """File-like view over [start, end) of a file, consumed by cursor.copy_expert"""
+
+    def __init__(self, path, start, end):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b''
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def readline(self, size=-1):
+        if self._remaining <= 0:
+            return b''
+        limit = self._remaining if size < 0 else min(size, self._remaining)
+        data = self._file.readline(limit)
+        self._remaining -= len(data)
+        return data
+
+    def close(self):
+        self._file.close()
+
+
+def split_file(table, path, chunk_bytes):
+    """Split a file after its header into ranges that start and end on line boundaries
+
+    CMS extracts never quote embedded newlines, so a newline is always a row boundary.
+    """
+    if path.suffix == '.gz':
+        return [Chunk(table, path, 0, -1)]
+
+    size = path.stat().st_size
+    chunks = []
+    with open(path, 'rb') as f:
+        f.readline()
+        start = f.tell()
+        while start < size:
+            target = start + chunk_bytes
+            if target >= size:
+                end = size
+            else:
+                f.seek(target)
+                f.readline()
+                end = f.tell()
+            chunks.append(Chunk(table, path, start, end))
+            start = end
+    return chunks
+
+
+class RawBulkLoader:
+    """Loads CMS files into the raw schema in parallel over a connection pool"""
+
+    def __init__(self, dsn, raw_schema='raw', workers=4, chunk_mb=64, append=False, build_indexes=True):
+        self.dsn = dsn
+        self.raw_schema = raw_schema
+        self.workers = workers
+        self.chunk_bytes = chunk_mb * 1024 * 1024
+        self.append = append
+        self.build_indexes = build_indexes
+
+    def discover(self, paths):
+        """Group input files by target table"""
+        files = {}
+        for path in map(Path, paths):
+            candidates = sorted(path.glob('*.csv')) + sorted(path.glob('*.csv.gz')) if path.is_dir() else [path]
+            for candidate in candidates:
+                table = table_for_file(candidate)
+                if table is None:
+                    print(f"⚠️  Skipping {candidate.name}: no matching cms_raw table")
+                    continue
+                files.setdefault(table, []).append(candidate)
+        return files
+
+    def loading_table(self, table):
+        return quote_ident(f"{self.raw_schema}._loading_{table}")
+
+    def prepare_table(self, conn, table, columns):
+        """Create the target table if needed and an empty loading table shaped like it"""
+        qualified = quote_ident(f"{self.raw_schema}.{table}")
+        loading = self.loading_table(table)
+        with conn.cursor() as cur:
+            cur.execute(f"create schema if not exists {quote_ident(self.raw_schema)}")
+            column_ddl = ', '.join(f"{quote_ident(c)} {column_type(c)}" for c in columns)
+            cur.execute(f"create table if not exists {qualified} ({column_ddl})")
+
+            cur.execute("""
+                select column_name from information_schema.columns
+                where table_schema = %s and table_name = %s
+            """, (self.raw_schema, table))
+            existing = {row[0] for row in cur.fetchall()}
+            missing = [c for c in columns if c not in existing]
+            if missing:
+                raise SystemExit(f"❌ {qualified} has no column(s) {', '.join(missing)}; "
+                                 f"drop it or align the file header")
+
+            # unlogged: the rows are written to the WAL once, when they are published
+            cur.execute(f"drop table if exists {loading}")
+            cur.execute(f"create unlogged table {loading} (like {qualified} including defaults)")
+        conn.commit()
+
+    def publish_tables(self, conn, tables):
+        """Move the loaded rows into the raw tables in one transaction and drop the loading tables"""
+        with conn.cursor() as cur:
+            for table in tables:
+                qualified = quote_ident(f"{self.raw_schema}.{table}")
+                for column in TABLE_INDEXES.get(table, []):
+                    cur.execute(f"drop index if exists {quote_ident(f'{self.raw_schema}.{table}_{column}_idx')}")
+                if not self.append:
+                    # truncate rather than drop: the staging views depend on these tables
+                    cur.execute(f"truncate table {qualified}")
+                cur.execute(f"insert into {qualified} select * from {self.loading_table(table)}")
+                cur.execute(f"drop table {self.loading_table(table)}")
+        conn.commit()
+
+    def drop_loading_tables(self, tables):
+        """Clean up after a failed load; the raw tables were never touched"""
+        conn = connect(self.dsn)
+        try:
+            with conn.cursor() as cur:
+                for table in tables:
+                    cur.execute(f"drop table if exists {self.loading_table(table)}")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def copy_chunk(self, pool, chunk, columns):
+        """COPY one byte range into the loading table on a pooled connection; returns rows loaded"""
+        qualified = self.loading_table(chunk.table)
+        column_list = ', '.join(quote_ident(c) for c in columns)
+        header = 'true' if chunk.end == -1 else 'false'
+        sql = f"copy {qualified} ({column_list}) from stdin with (format csv, header {header})"
+
+        if chunk.end == -1:
+            source = gzip.open(chunk.path, 'rb')
+        else:
+            source = RangeReader(chunk.path, chunk.start, chunk.end)
+
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.copy_expert(sql, source, size=1024 * 1024)
+                rows = cur.rowcount
+            conn.commit()
+            return rows
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            source.close()
+            pool.putconn(conn)
+
+    def create_index(self, pool, table, column):
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    create index if not exists {quote_ident(f'{table}_{column}_idx')}
+                    on {quote_ident(f'{self.raw_schema}.{table}')} ({quote_ident(column)})
+                """)
+            conn.commit()
+        finally:
+            pool.putconn(conn)
+
+    def load(self, paths):
+        """Load every discovered file; returns {table: (rows, seconds)}"""
+        files = self.discover(paths)
+        if not files:
+            raise SystemExit("❌ No CMS files found")
+
+        columns = {}
+        conn = connect(self.dsn)
+        try:
+            for table, table_files in files.items():
+                headers = {tuple(read_header(path)) for path in table_files}
+                if len(headers) > 1:
+                    raise SystemExit(f"❌ Files for {table} have different headers")
+                columns[table] = list(headers.pop())
+                self.prepare_table(conn, table, columns[table])
+        finally:
+            conn.close()
+
+        chunks = [chunk
+                  for table, table_files in files.items()
+                  for path in table_files
+                  for chunk in split_file(table, path, self.chunk_bytes)]
+        # Largest ranges first so a single big gzip file does not finish last
+        chunks.sort(key=lambda c: -(c.path.stat().st_size if c.end == -1 else c.end - c.start))
+
+        print(f"🚚 Loading {len(chunks)} streams from {sum(map(len, files.values()))} files "
+              f"with {self.workers} workers...")
+
+        stats = {table: [0, 0.0] for table in files}
+        pool = ThreadedConnectionPool(1, self.workers, self.dsn)
+        try:
+            load_started = time.perf_counter()
+            try:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = {}
+                    for chunk in chunks:
+                        futures[executor.submit(self.copy_chunk, pool, chunk, columns[chunk.table])] = chunk
+                    for future in as_completed(futures):
+                        chunk = futures[future]
+                        stats[chunk.table][0] += future.result()
+                        # tables share the workers, so report wall time until their last stream finished
+                        stats[chunk.table][1] = time.perf_counter() - load_started
+
+                conn = pool.getconn()
+                try:
+                    self.publish_tables(conn, files)
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    pool.putconn(conn)
+            except BaseException:
+                self.drop_loading_tables(files)
+                raise
+            print(f"📦 Published {len(files)} tables in {time.perf_counter() - load_started:.1f}s")
+
+            if self.build_indexes:
+                index_started = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    futures = [executor.submit(self.create_index, pool, table, column)
+                               for table in files
+                               for column in TABLE_INDEXES.get(table, [])
+                               if column in columns[table]]
+                    for future in as_completed(futures):
+                        future.result()
+                print(f"🗂️  Indexes rebuilt in {time.perf_counter() - index_started:.1f}s")
+
+            conn = pool.getconn()
+            try:
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    for table in files:
+                        cur.execute(f"analyze {quote_ident(f'{self.raw_schema}.{table}')}")
+            finally:
+                conn.autocommit = False
+                pool.putconn(conn)
+        finally:
+            pool.closeall()
+
+        return {table: tuple(values) for table, values in stats.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk load CMS DE-SynPUF files into the raw schema')
+    parser.add_argument('paths', nargs='+', help='CMS CSV files (.csv or .csv.gz) or directories containing them')
+    add_connection_arguments(parser)
+    parser.add_argument('--raw-schema', default='raw', help='Target schema (default: raw, as in sources.yml)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4,
+                        help='Parallel COPY streams / pooled connections (default: CPU count)')
+    parser.add_argument('--chunk-mb', type=int, default=64,
+                        help='Split files into ranges of roughly this size (default: 64)')
+    parser.add_argument('--append', action='store_true', help='Keep existing rows instead of truncating')
+    parser.add_argument('--skip-indexes', action='store_true', help='Do not rebuild indexes after loading')
+
+    args = parser.parse_args()
+
+    loader = RawBulkLoader(args.dsn, raw_schema=args.raw_schema, workers=args.workers,
+                           chunk_mb=args.chunk_mb, append=args.append,
+                           build_indexes=not args.skip_indexes)
+    started = time.perf_counter()
+    try:
+        results = loader.load(args.paths)
+    except Exception as exc:
+        append_event('loader', f"Raw CMS load into {args.raw_schema} failed: {str(exc).splitlines()[0]}", 'error')
+        raise
+    elapsed = time.perf_counter() - started
+
+    print("\n📊 Load summary")
+    total_rows = 0
+    for table, (rows, seconds) in sorted(results.items()):
+        total_rows += rows
+        rate = rows / seconds if seconds else 0
+        print(f"  {args.raw_schema}.{table:<22} {rows:>12,} rows  {seconds:>7.1f}s  {rate:>12,.0f} rows/s")
+    print(f"✅ Loaded {total_rows:,} rows in {elapsed:.1f}s ({total_rows / elapsed if elapsed else 0:,.0f} rows/s overall)")
+    append_event('loader', f"Loaded {total_rows:,} raw CMS rows into {len(results)} {args.raw_schema} tables "
+                           f"in {elapsed:.0f}s", rows=total_rows, tables=sorted(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Dashboard load test
+Purpose: Find out how many concurrent analysts one dashboard process can serve
+
+Simulates N concurrent sessions against one in-process copy of streamlit_app.py with
+Streamlit's headless app-testing API (AppTest). All sessions share the process, and so
+the report loader, warehouse pool, figure cache and shared frame store, exactly like the
+sessions of one replica. Each session loops: pick a sidebar page or (in live warehouse
+mode) change a global filter, rerun, think, repeat. Reported at the end:
+
+- rerun latency p50 / p95 / p99, overall and per action
+- throughput in reruns per second
+- process RSS after a warm-up session and at the end, and the growth per session
+- exceptions raised by the app
+
+Without --warehouse the sessions read the static report. For the live path, build the
+local DuckDB stand-in first (`dbt run --target embedded`) and pass its path.
+
+Usage:
+    python scripts/load_test_dashboard.py --sessions 20 --duration 60
+    python scripts/load_test_dashboard.py --sessions 50 --duration 120 --warehouse claims_warehouse.duckdb
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import streamlit.testing.v1.app_test as app_test  # noqa: E402
+import streamlit.testing.v1.local_script_runner as local_script_runner  # noqa: E402
+from streamlit.runtime import Runtime  # noqa: E402
+from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager  # noqa: E402
+from streamlit.runtime.media_file_manager import MediaFileManager  # noqa: E402
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage  # noqa: E402
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from unittest.mock import MagicMock  # noqa: E402
+
+from dashboard.data_sources import WAREHOUSE_ENV_VAR  # noqa: E402
+from dashboard.perf import process_rss_bytes  # noqa: E402
+
+APP = PROJECT_ROOT / "streamlit_app.py"
+NAV_PREFIX = "nav_"
+FILTER_KEYS = ("filter_claim_types", "filter_states", "filter_specialties")
+
+
+class _PinnedInstance(type):
+    """Metaclass that ignores assignments to _instance"""
+
+    def __setattr__(cls, name, value):
+        if name != '_instance':
+            super().__setattr__(name, value)
+
+
+class _SharedRuntime(Runtime, metaclass=_PinnedInstance):
+    """Stand-in for Runtime inside AppTest.
+
+    AppTest installs a fresh mock Runtime singleton for every run and clears it when the run
+    ends, which breaks any other session running at the same time. Like the server, all
+    sessions here share one runtime, installed once by share_runtime().
+    """
+
+
+def share_runtime():
+    """Install one mock runtime and one compiled-script cache for all concurrent AppTest sessions"""
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    Runtime._instance = runtime
+    app_test.Runtime = _SharedRuntime
+    # AppTest recompiles the script for every run; the server compiles it once
+    script_cache = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: script_cache
+
+
+class Session(threading.Thread):
+    """One simulated analyst: navigates and filters until the deadline"""
+
+    def __init__(self, number, deadline, think_time, results, rng):
+        super().__init__(name=f"session-{number}", daemon=True)
+        self.deadline = deadline
+        self.think_time = think_time
+        self.results = results
+        self.rng = rng
+        self.app = None
+
+    def run(self):
+        self.app = AppTest.from_file(str(APP), default_timeout=120)
+        self.rerun("open", self.app.run)
+        while time.monotonic() < self.deadline:
+            action, step = self.next_action()
+            self.rerun(action, step)
+            time.sleep(self.rng.uniform(0, 2 * self.think_time))
+
+    def next_action(self):
+        """(label, callable rerunning the app) for a random navigation or filter change"""
+        filters = [w for w in self.app.sidebar.multiselect if w.key in FILTER_KEYS]
+        if filters and self.rng.random() < 0.3:
+            widget = self.rng.choice(filters)
+            values = self.rng.sample(widget.options, k=min(len(widget.options), self.rng.randint(0, 2)))
+            return f"filter {widget.key}", widget.set_value(values).run
+
+        buttons = [b for b in self.app.sidebar.button if b.key and b.key.startswith(NAV_PREFIX)]
+        if not buttons:
+            # The last rerun failed before the sidebar was drawn; start over
+            return "open", self.app.run
+        button = self.rng.choice(buttons)
+        return f"page {button.key[len(NAV_PREFIX):]}", button.click().run
+
+    def rerun(self, action, step):
+        start = time.perf_counter()
+        try:
+            step()
+            errors = [e.value for e in self.app.exception]
+            if not any(b.key and b.key.startswith(NAV_PREFIX) for b in self.app.sidebar.button):
+                errors.append("rerun ended without drawing the sidebar")
+        except Exception as exc:  # a crashed rerun is a result, not a reason to stop
+            errors = [repr(exc)]
+        elapsed = (time.perf_counter() - start) * 1000
+        with self.results['lock']:
+            self.results['latencies'][action].append(elapsed)
+            self.results['errors'].extend(errors)
+
+
+def percentiles(values):
+    """(p50, p95, p99) in the units of values"""
+    if len(values) < 2:
+        value = values[0] if values else float('nan')
+        return value, value, value
+    cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return cuts[49], cuts[94], cuts[98]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent dashboard sessions")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent sessions")
+    parser.add_argument("--duration", type=float, default=30, help="seconds each session keeps interacting")
+    parser.add_argument("--think-time", type=float, default=0.5, help="mean pause between interactions (s)")
+    parser.add_argument("--ramp-up", type=float, default=5, help="seconds over which sessions start")
+    parser.add_argument("--warehouse", help="DuckDB file or Postgres DSN for live mode (sets DASHBOARD_WAREHOUSE)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.warehouse:
+        os.environ[WAREHOUSE_ENV_VAR] = args.warehouse
+    os.chdir(PROJECT_ROOT)  # the app reads reports/ relative to the working directory
+
+    rng = random.Random(args.seed)
+    results = {'lock': threading.Lock(), 'latencies': defaultdict(list), 'errors': []}
+
+    share_runtime()
+
+    # One warm-up session imports the app modules and fills the process-wide caches, so the
+    # memory growth measured below is what the sessions themselves cost
+    AppTest.from_file(str(APP), default_timeout=120).run()
+    rss_before = process_rss_bytes()
+    started = time.monotonic()
+    deadline = started + args.ramp_up + args.duration
+
+    sessions = []
+    for number in range(args.sessions):
+        session = Session(number, deadline, args.think_time, results, random.Random(rng.random()))
+        session.start()
+        sessions.append(session)
+        time.sleep(args.ramp_up / max(args.sessions, 1))
+    for session in sessions:
+        session.join()
+
+    elapsed = time.monotonic() - started
+    rss_after = process_rss_bytes()
+    latencies = results['latencies']
+    all_latencies = [value for values in latencies.values() for value in values]
+
+    mode = f"live ({args.warehouse})" if args.warehouse else "static report"
+    print(f"📈 {args.sessions} sessions, {elapsed:.0f}s, {mode}")
+    print(f"  reruns       {len(all_latencies):,}  ({len(all_latencies) / elapsed:.1f}/s)")
+    p50, p95, p99 = percentiles(all_latencies)
+    print(f"  latency      p50 {p50:7.0f} ms   p95 {p95:7.0f} ms   p99 {p99:7.0f} ms")
+    if rss_before is not None and rss_after is not None:
+        per_session = (rss_after - rss_before) / max(args.sessions, 1)
+        print(f"  memory       RSS {rss_before / 2**20:.0f} -> {rss_after / 2**20:.0f} MB"
+              f"  ({per_session / 2**20:.2f} MB per session)")
+    print(f"  exceptions   {len(results['errors'])}")
+
+    print("\n  action                                      n      p50      p95      p99")
+    for action in sorted(latencies, key=lambda name: -statistics.median(latencies[name])):
+        p50, p95, p99 = percentiles(latencies[action])
+        print(f"  {action:<40} {len(latencies[action]):>4} {p50:>8.0f} {p95:>8.0f} {p99:>8.0f}")
+    for error in sorted(set(map(str, results['errors'])))[:5]:
+        print(f"  ❌ {error}")
+
+    return 1 if results['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - dbt run event logger
+Purpose: Record the outcome of every dbt invocation in the dashboard event log
+
+Reads target/run_results.json and appends one summary event (what was built, tested or
+skipped, and how long it took) plus one event per failed model or data test to the event
+log the activity monitor tails (dashboard/event_log.py). dbt hooks cannot write local
+files, so this runs right after dbt; an invocation already in the log is not recorded
+twice, so it is safe to call after every command and from the cache warm-up sidecar.
+
+Usage:
+    dbt build; python scripts/log_dbt_run.py
+    python scripts/log_dbt_run.py --target-dir target/
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dashboard.event_log import append_events, event_log_path, make_event, read_tail  # noqa: E402
+
+# How far back the log is searched for an invocation that was already recorded
+RECENT_EVENTS = 500
+FAILED_STATUSES = {'error': 'error', 'fail': 'warning', 'runtime error': 'error'}
+
+
+def run_events(run_results):
+    """Summary event of one dbt invocation, then one event per failed node"""
+    invocation_id = run_results['metadata']['invocation_id']
+    command = run_results.get('args', {}).get('which', 'run')
+    counts = Counter((result['unique_id'].split('.', 1)[0], result['status'])
+                     for result in run_results.get('results', []))
+    built = ', '.join(f"{n} {kind}s" for (kind, status), n in sorted(counts.items())
+                      if status == 'success' and kind in ('model', 'seed', 'snapshot'))
+    tests = sum(n for (kind, status), n in counts.items() if kind == 'test' and status == 'pass')
+    failed = sum(n for (_, status), n in counts.items() if status in FAILED_STATUSES)
+    skipped = sum(n for (_, status), n in counts.items() if status == 'skipped')
+    parts = [part for part in (built, f"{tests} tests passed" if tests else '',
+                               f"{failed} failed" if failed else '', f"{skipped} skipped" if skipped else '')
+             if part]
+    message = (f"dbt {command} finished in {run_results.get('elapsed_time', 0):.0f}s: "
+               f"{', '.join(parts) or 'nothing to do'}")
+    events = [make_event('dbt', message, 'warning' if failed else 'info', invocation_id=invocation_id)]
+
+    for result in run_results.get('results', []):
+        level = FAILED_STATUSES.get(result['status'])
+        if level is None:
+            continue
+        kind, name = result['unique_id'].split('.')[0], result['unique_id'].split('.')[2]
+        # dbt messages start with "<Error type> in <node>"; the cause is on the next line
+        lines = [line.strip() for line in (result.get('message') or '').splitlines() if line.strip()]
+        detail = (f"{result['failures']:,} failing rows" if result.get('failures')
+                  else lines[min(1, len(lines) - 1)] if lines else 'no message')
+        events.append(make_event('dbt', f"dbt {kind} {name} {result['status']}: {detail}", level,
+                                 invocation_id=invocation_id, unique_id=result['unique_id']))
+    return events
+
+
+def already_logged(invocation_id, path):
+    """Whether the newest events of the log include this invocation"""
+    try:
+        events, _ = read_tail(path, RECENT_EVENTS)
+    except FileNotFoundError:
+        return False
+    return any(event.get('invocation_id') == invocation_id for event in events)
+
+
+def log_run(run_results_path, path=None):
+    """Append the events of the invocation in run_results_path; returns them ([] if already logged)"""
+    path = Path(path) if path is not None else event_log_path()
+    with open(run_results_path) as f:
+        run_results = json.load(f)
+    if already_logged(run_results['metadata']['invocation_id'], path):
+        return []
+    events = run_events(run_results)
+    append_events(events, path)
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record the last dbt invocation in the dashboard event log')
+    parser.add_argument('--target-dir', default='target', help='dbt target directory holding run_results.json')
+    parser.add_argument('--event-log', help='Event log file (default: $DASHBOARD_EVENT_LOG or logs/events.jsonl)')
+    args = parser.parse_args()
+
+    events = log_run(Path(args.target_dir) / 'run_results.json', args.event_log)
+    if not events:
+        print("ℹ️  This dbt invocation is already in the event log")
+    for event in events:
+        print(f"{'⚠️ ' if event['level'] != 'info' else '📝'} {event['message']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Claims Data Warehouse - Shared warehouse connection helpers
+Purpose: Common connection and argument handling for the command line tools in scripts/
+"""
+
+import os
+
+import psycopg2
+
+DSN_ENV_VAR = "CLAIMS_WAREHOUSE_DSN"
+SCHEMA_ENV_VAR = "CLAIMS_WAREHOUSE_SCHEMA"
+DEFAULT_SCHEMA = "analytics_dev"  # matches the dev output in profiles.yml.template
+
+
+def add_connection_arguments(parser):
+    """Add the --dsn/--schema options shared by every warehouse tool"""
+    parser.add_argument('--dsn', default=os.environ.get(DSN_ENV_VAR),
+                        help=f'libpq connection string (default: ${DSN_ENV_VAR})')
+    parser.add_argument('--schema', default=os.environ.get(SCHEMA_ENV_VAR, DEFAULT_SCHEMA),
+                        help=f'Schema holding the dbt marts (default: ${SCHEMA_ENV_VAR} or {DEFAULT_SCHEMA})')
+
+
+def connect(dsn):
+    """Open a warehouse connection, failing with a readable message when no DSN is configured"""
+    if not dsn:
+        raise SystemExit(f"❌ No warehouse connection configured. Pass --dsn or set {DSN_ENV_VAR}.")
+    return psycopg2.connect(dsn)
+
+
+def quote_ident(name):
+    """Quote a (possibly schema-qualified) identifier for interpolation into SQL"""
+    return '.'.join('"' + part.replace('"', '""') + '"' for part in name.split('.'))
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Claims Data Warehouse - Dashboard cache warm-up job
+Purpose: Fill the dashboard caches after a deploy and after every dbt run
+
+Renders every dashboard page under the common filter combinations (no filter and each
+claim type on its own) with Streamlit's AppTest runner, so every warehouse query the
+pages issue by default runs once. The results land in the query cache the replicas share
+(DASHBOARD_CACHE_PATH), and their first visitors are served from it instead of the
+warehouse. Everything else this process builds dies with it, so without
+DASHBOARD_CACHE_PATH the job refuses to run. Each replica's page imports are warmed by
+its in-process warmer (dashboard/warmup.py); its figures and shared frames are built by
+the first session that opens each page. Per page, the first render (what the job paid)
+and a second render (steady state) are reported.
+
+--watch keeps running and warms again whenever dbt rewrites target/run_results.json, for
+use as a sidecar next to the replicas; it also records each dbt invocation in the event
+log behind the activity monitor (scripts/log_dbt_run.py). Without DASHBOARD_CACHE_PATH the
+sidecar only records the invocations.
+
+Usage:
+    DASHBOARD_WAREHOUSE=claims_warehouse.duckdb DASHBOARD_CACHE_PATH=/cache/dashboard.sqlite \\
+        python scripts/warm_dashboard_cache.py
+    python scripts/warm_dashboard_cache.py --watch --interval 30
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# This job is the warm-up; the app's background warmer would only duplicate it
+os.environ["DASHBOARD_WARMUP"] = "0"
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from dashboard.data_sources import WarehouseError, data_source_from_env  # noqa: E402
+from dashboard.result_cache import CACHE_PATH_ENV_VAR  # noqa: E402
+from dashboard.runtime import get_data_source  # noqa: E402
+from dashboard.views import PAGES  # noqa: E402
+from dashboard.warmup import RunResultsWatcher, invalidate_changed, run_results_path  # noqa: E402
+from log_dbt_run import log_run  # noqa: E402
+
+APP = PROJECT_ROOT / "streamlit_app.py"
+
+
+def filter_states():
+    """Session state of each filter combination to warm; just the unfiltered view without a warehouse"""
+    try:
+        source = data_source_from_env()
+        claim_types = source.claims_filter_options()['claim_type'] if source is not None else []
+    except WarehouseError as exc:
+        print(f"⚠️  Warehouse unavailable, warming the static report only ({exc})")
+        claim_types = []
+    return [{}] + [{'filter_claim_types': [claim_type]} for claim_type in claim_types]
+
+
+def render(page, state):
+    """(ms, exceptions) of one script run showing page with the given session state"""
+    app = AppTest.from_file(str(APP), default_timeout=120)
+    app.session_state.selected_page = page
+    for key, value in state.items():
+        app.session_state[key] = value
+    start = time.perf_counter()
+    app.run()
+    return (time.perf_counter() - start) * 1000, [e.value for e in app.exception]
+
+
+def warm(pages):
+    """Render every page under every filter combination; returns the number of failed renders"""
+    states = filter_states()
+    failures = 0
+    print(f"🔥 Warming {len(pages)} pages x {len(states)} filter combinations")
+    for page in pages:
+        first, errors = render(page, {})
+        for state in states[1:]:
+            errors += render(page, state)[1]
+        steady, _ = render(page, {})
+        failures += bool(errors)
+        status = f"❌ {errors[0]}" if errors else "✅"
+        print(f"  {page:<30} first {first:7.0f} ms   steady {steady:7.0f} ms   {status}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-compute the dashboard caches")
+    parser.add_argument("--page", action="append", dest="pages", help="page to warm (repeatable, default: all)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and warm again after every dbt run")
+    parser.add_argument("--interval", type=float, default=10, help="seconds between run_results.json checks")
+    args = parser.parse_args()
+
+    shared_cache = bool(os.environ.get(CACHE_PATH_ENV_VAR))
+    if not shared_cache:
+        if not args.watch:
+            raise SystemExit(f"❌ {CACHE_PATH_ENV_VAR} is not set: the results would be cached in this "
+                             f"process only and discarded when it exits. Point it at the replicas' shared cache.")
+        print(f"⚠️  {CACHE_PATH_ENV_VAR} is not set: recording dbt runs in the event log without warming")
+
+    os.chdir(PROJECT_ROOT)  # the app reads reports/ and target/ relative to the working directory
+    pages = args.pages or list(PAGES)
+    failures = warm(pages) if shared_cache else 0
+    if not args.watch:
+        return 1 if failures else 0
+
+    dbt_finished = threading.Event()
+    RunResultsWatcher(lambda path: dbt_finished.set(), interval=args.interval).start()
+    print(f"👀 Watching {run_results_path()}")
+    while True:
+        dbt_finished.wait()
+        dbt_finished.clear()
+        print(f"🔄 dbt run finished at {time.strftime('%H:%M:%S')}")
+        try:
+            log_run(run_results_path())
+        except (OSError, ValueError, KeyError) as exc:
+            print(f"  ⚠️  Could not record the run in the event log ({exc})")
+        if not shared_cache:
+            continue
+        try:
+            source = get_data_source()  # the instance the rendered pages query
+        except WarehouseError:
+            source = None
+        if source is not None:
+            # Only results that read a relation the run changed are refreshed (for all replicas)
+            relations, expired = invalidate_changed(source, run_results_path().parent)
+            if relations is None:
+                print("  no dbt artifacts to compare against, dropped every cached result")
+            else:
+                print(f"  changed: {', '.join(relations) or '-'} · {expired} cached results expired")
+        warm(pages)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Unit tests for the dashboard and script modules (the dbt data tests are the .sql files in tests/)
+
+Run from the project root:
+    python -m pytest -q tests/unit
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+# dashboard.* imports from the project root; the scripts import their siblings (warehouse.py) directly
+sys.path[:0] = [str(PROJECT_ROOT), str(PROJECT_ROOT / "scripts")]
+
+
+class FakeClock:
+    """Stand-in for the time module: time() and monotonic() return the same settable value"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -0,0 +1,17 @@
+from dashboard.event_log import parse_lines
+
+
+def test_parse_lines_keeps_offsets_and_skips_bad_lines():
+    lines = [
+        b'{"ts": 1.5, "message": "ok"}\n',
+        b'not json\n',
+        b'{"message": "no ts"}\n',
+        b'{"ts": "yesterday", "message": "text ts"}\n',
+        b'{"ts": true, "message": "bool ts"}\n',
+        b'[1, 2]\n',
+        b'{"ts": 2, "message": "int ts"}\n',
+    ]
+    events = parse_lines(b''.join(lines), 100)
+    assert [event['message'] for event in events] == ['ok', 'int ts']
+    assert events[0]['offset'] == 100
+    assert events[1]['offset'] == 100 + sum(len(line) for line in lines[:-1])
@@ -0,0 +1,30 @@
+import pytest
+
+from dashboard import exports
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(exports, 'EXPORT_DIR', tmp_path)
+    return tmp_path
+
+
+def write_rows(path, fmt):
+    path.write_text("a,b\n1,2\n")
+    return 1
+
+
+def test_exports_are_off_by_default(export_dir, monkeypatch):
+    monkeypatch.delenv(exports.EXPORTS_ENV_VAR, raising=False)
+    with pytest.raises(PermissionError):
+        exports.export_file("claims", "csv", write_rows)
+    assert list(export_dir.iterdir()) == []
+
+
+def test_enabled_export_is_published_under_a_token(export_dir, monkeypatch):
+    monkeypatch.setenv(exports.EXPORTS_ENV_VAR, "1")
+    export = exports.export_file("claims", "csv", write_rows)
+    assert export.rows == 1
+    assert export.directory.parent == export_dir and not export.directory.name.startswith('.')
+    [part] = export.parts
+    assert part.url == f"{exports.EXPORT_URL}/{export.directory.name}/{part.file_name}"
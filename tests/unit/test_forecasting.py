@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from dashboard.forecasting import HoltWintersFit, fit_holt_winters
+
+MONTHS = np.arange(36)
+SEASON = 10 * np.sin(2 * np.pi * MONTHS / 12)
+
+
+def make_fit(alpha=0.45, beta=0.15, gamma=0.3, sigma=1.0, n_obs=30):
+    return HoltWintersFit(alpha=np.array([alpha]), beta=np.array([beta]), gamma=np.array([gamma]),
+                          level=np.array([10.0]), trend=np.array([0.5]), season=np.zeros((12, 1)),
+                          sigma=np.array([sigma]), n_obs=n_obs, season_length=12)
+
+
+def simulate_errors(fit, horizon, n_paths=50_000, seed=3):
+    """Forecast errors of paths generated by the fit's own update equations"""
+    rng = np.random.default_rng(seed)
+    alpha, beta, gamma, sigma = fit.alpha[0], fit.beta[0], fit.gamma[0], fit.sigma[0]
+    level = np.full(n_paths, fit.level[0])
+    trend = np.full(n_paths, fit.trend[0])
+    season = np.repeat(fit.season[:, :1], n_paths, axis=1)
+    observed = []
+    for step in range(1, horizon + 1):
+        phase = (fit.n_obs + step - 1) % fit.season_length
+        s = season[phase]
+        y = level + trend + s + rng.normal(0, sigma, n_paths)
+        new_level = alpha * (y - s) + (1 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1 - beta) * trend
+        season[phase] = gamma * (y - new_level) + (1 - gamma) * s
+        level = new_level
+        observed.append(y)
+    return np.array(observed) - fit.mean(horizon)[0][:, None]
+
+
+def test_recovers_trend_and_season():
+    y = np.vstack([100 + 2 * MONTHS + SEASON, 50 + 0 * MONTHS])
+    fit = fit_holt_winters(y)
+    mean, lower, upper = fit.forecast(12)
+    expected = 100 + 2 * np.arange(36, 48) + 10 * np.sin(2 * np.pi * np.arange(36, 48) / 12)
+    np.testing.assert_allclose(mean[0], expected, atol=1.0)
+    np.testing.assert_allclose(mean[1], 50, atol=1e-6)
+    assert np.all(lower <= mean) and np.all(mean <= upper)
+
+
+def test_short_history_is_trend_only():
+    fit = fit_holt_winters([[1.0, 2.0, 3.0, 4.0]])
+    assert fit.gamma[0] == 0
+    np.testing.assert_allclose(fit.mean(2)[0], [5.0, 6.0], atol=1e-4)
+
+
+def test_needs_two_months():
+    with pytest.raises(ValueError):
+        fit_holt_winters([[1.0]])
+
+
+def test_lower_bound_is_clipped_at_zero():
+    fit = fit_holt_winters([[40.0, 30.0, 20.0, 10.0]])
+    _, lower, _ = fit.forecast(6)
+    assert np.all(lower >= 0)
+
+
+def test_step_variance_matches_simulation():
+    fit = make_fit()
+    simulated = simulate_errors(fit, 24).var(axis=1)
+    np.testing.assert_allclose(fit.variance(24)[0], simulated, rtol=0.03)
+
+
+def test_seasonal_error_weight_is_gamma_times_one_minus_alpha():
+    fit = make_fit(alpha=0.5, beta=0.0, gamma=0.4)
+    weights = fit.error_weights(13)[0]
+    assert weights[11] == pytest.approx(0.5 + 0.4 * 0.5)
+    assert weights[10] == pytest.approx(0.5)
+
+
+def test_total_variance_covers_correlated_months():
+    fit = make_fit()
+    simulated = simulate_errors(fit, 12).sum(axis=0).var()
+    assert fit.total_variance(12)[0] == pytest.approx(simulated, rel=0.03)
+    # Far wider than months treated as independent
+    assert fit.total_variance(12)[0] > 2 * fit.variance(12)[0].sum()
+    assert fit.total_variance(1)[0] == pytest.approx(fit.sigma[0] ** 2)
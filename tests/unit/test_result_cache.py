@@ -0,0 +1,136 @@
+import threading
+import time
+
+import pytest
+
+from dashboard import result_cache
+from dashboard.data_sources import WarehouseDataSource
+from dashboard.result_cache import MISSING, MemoryResultCache, SQLiteResultCache, result_key
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache(request, tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(result_cache, 'time', clock)
+    if request.param == 'memory':
+        return MemoryResultCache()
+    return SQLiteResultCache(tmp_path / "results.db")
+
+
+def test_result_key_is_stable_and_parameter_sensitive():
+    assert result_key("select $1", [['a', 'b']]) == result_key("select $1", (('a', 'b'),))
+    assert result_key("select $1", [1]) != result_key("select $1", [2])
+
+
+def test_get_set_and_counters(cache):
+    assert cache.get('k') is MISSING
+    cache.set('k', [{'a': 1}], ttl_seconds=60)
+    assert cache.get('k') == [{'a': 1}]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_none_is_a_cached_value(cache):
+    cache.set('k', None, ttl_seconds=60)
+    assert cache.get('k') is None
+
+
+def test_uncounted_lookup(cache):
+    cache.set('k', 1, ttl_seconds=60)
+    assert cache.get('k', count=False) == 1
+    assert cache.get('other', count=False) is MISSING
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_expired_results_stay_available_as_stale(cache, clock):
+    cache.set('k', 'old', ttl_seconds=60)
+    clock.advance(61)
+    assert cache.get('k') is MISSING
+    assert cache.get_stale('k') == 'old'
+    assert cache.get_stale('never set') is MISSING
+
+
+def test_invalidate_expires_only_tagged_results(cache):
+    cache.set('claims', 1, ttl_seconds=60, tags=['fact_claims'])
+    cache.set('members', 2, ttl_seconds=60, tags=['dim_beneficiaries'])
+    cache.invalidate(['fact_claims'])
+    assert cache.get('claims') is MISSING
+    assert cache.get_stale('claims') == 1
+    assert cache.get('members') == 2
+
+
+def test_sqlite_is_shared_between_instances(tmp_path):
+    SQLiteResultCache(tmp_path / "results.db").set('k', 'shared', ttl_seconds=60)
+    assert SQLiteResultCache(tmp_path / "results.db").get('k') == 'shared'
+
+
+def test_sqlite_hits_only_write_last_used_once_a_minute(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(result_cache, 'time', clock)
+    cache = SQLiteResultCache(tmp_path / "results.db")
+    cache.set('k', 1, ttl_seconds=3600)
+    conn = cache._connection()
+    writes = conn.total_changes
+    clock.advance(30)
+    cache.get('k')
+    assert conn.total_changes == writes
+    clock.advance(result_cache.LAST_USED_RESOLUTION_SECONDS)
+    cache.get('k')
+    assert conn.total_changes == writes + 1
+
+
+def test_sqlite_evicts_expired_then_least_recently_used(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(result_cache, 'time', clock)
+    blob = 'x' * 1000
+    cache = SQLiteResultCache(tmp_path / "results.db", max_bytes=3500)
+    cache.set('expired', blob, ttl_seconds=10)
+    clock.advance(100)
+    cache.set('old', blob, ttl_seconds=3600)
+    clock.advance(100)
+    cache.set('recent', blob, ttl_seconds=3600)
+    clock.advance(100)
+    assert cache.get('old') == blob  # now the most recently used
+    cache.set('new', blob, ttl_seconds=3600)
+    assert cache.get_stale('expired') is MISSING
+    cache.set('newer', blob, ttl_seconds=3600)
+    assert cache.get('recent') is MISSING
+    assert cache.get('old') == blob
+    assert cache.evictions == 2
+
+
+class SlowBackend:
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.fetches = 0
+
+    def fetch(self, name, sql, params):
+        self.fetches += 1
+        time.sleep(self.seconds)
+        return [{'rows': self.fetches}]
+
+
+def test_query_waits_for_the_running_fetch_without_stale_rows():
+    backend = SlowBackend(0.3)
+    source = WarehouseDataSource(backend, wait_seconds=0.05)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(source.query('risk_tiers'))) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert backend.fetches == 1
+    assert results == [[{'rows': 1}]] * 6
+
+
+def test_query_serves_stale_rows_while_refreshing(clock, monkeypatch):
+    monkeypatch.setattr(result_cache, 'time', clock)
+    backend = SlowBackend(0.3)
+    source = WarehouseDataSource(backend, ttl_seconds=60, wait_seconds=0.05)
+    assert source.query('risk_tiers') == [{'rows': 1}]
+    clock.advance(61)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(source.query('risk_tiers'))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert backend.fetches == 2
+    assert sorted(row[0]['rows'] for row in results) == [1, 1, 2]
+    assert source.stale['risk_tiers'] == 2
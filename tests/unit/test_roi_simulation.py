@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from dashboard.roi_simulation import Intervention, Scenario, Simulation, payback_months, simulate, summarize
+
+INTERVENTIONS = (
+    Intervention("Automation", investment=850_000, cost_base=12_800_000, effect=(0.15, 0.25, 0.35), lead_months=3),
+    Intervention("Network", investment=450_000, cost_base=24_000_000, effect=(0.05, 0.10, 0.15), lead_months=6),
+)
+
+
+def fixed(savings, investment):
+    """Simulation of one scenario per column, (intervention x scenario) $ per year"""
+    return Simulation(savings=np.array(savings, dtype=float), investment=np.array(investment, dtype=float))
+
+
+def test_single_intervention_pays_back_after_its_lead_time():
+    # $10/month from month 3 against $50
+    assert payback_months(fixed([[120]], [[50]]), [3])[0] == pytest.approx(8.0)
+
+
+def test_later_interventions_speed_up_payback():
+    # $12 owed: $1/month from month 0, $2/month more from month 4 -> 4 + 8 / 3
+    months = payback_months(fixed([[12], [24]], [[6], [6]]), [0, 4])
+    assert months[0] == pytest.approx(4 + 8 / 3)
+
+
+def test_paid_back_before_the_next_intervention_starts():
+    months = payback_months(fixed([[120], [120]], [[10], [10]]), [0, 12])
+    assert months[0] == pytest.approx(2.0)
+
+
+def test_never_pays_back():
+    assert np.isinf(payback_months(fixed([[0, 120]], [[50, 50]]), [0])[0])
+
+
+def test_summary_keeps_never_as_inf():
+    summary = summarize(simulate(INTERVENTIONS, Scenario(effect_scale=0.0, n_scenarios=1000)), INTERVENTIONS)
+    assert np.all(np.isinf(summary.payback_months))
+
+
+def test_summary_percentiles_are_ordered():
+    summary = summarize(simulate(INTERVENTIONS, Scenario(n_scenarios=10_000)), INTERVENTIONS)
+    for values in (summary.total_savings, summary.total_roi, summary.payback_months):
+        assert values[0] <= values[1] <= values[2]
+    assert np.all(np.isfinite(summary.payback_months))
+
+
+def test_draws_are_reproducible():
+    first = simulate(INTERVENTIONS, Scenario(n_scenarios=100, seed=7))
+    second = simulate(INTERVENTIONS, Scenario(n_scenarios=100, seed=7))
+    np.testing.assert_array_equal(first.savings, second.savings)
+
+
+def test_break_even_counts_only_the_months_after_the_lead_time():
+    interventions = (
+        Intervention("Now", investment=90, cost_base=0, effect=(0, 0, 0), lead_months=0),
+        Intervention("Later", investment=90, cost_base=0, effect=(0, 0, 0), lead_months=3),
+        Intervention("Next year", investment=1, cost_base=0, effect=(0, 0, 0), lead_months=12),
+    )
+    # $120 a year: all of it in year one for the first, 9 months' worth ($90) for the second
+    summary = summarize(fixed([[120, 100], [120, 100], [120, 100]], [[90, 90], [90, 90], [1, 1]]), interventions)
+    np.testing.assert_allclose(summary.break_even, [1.0, 0.5, 0.0])
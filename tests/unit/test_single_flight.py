@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from dashboard.single_flight import FlightTimeout, SingleFlight
+
+
+def run_concurrently(count, target):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(target())
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_callers_share_one_computation():
+    flights = SingleFlight()
+    computed = []
+
+    def compute():
+        computed.append(1)
+        time.sleep(0.2)
+        return 'rows'
+
+    results, errors = run_concurrently(8, lambda: flights.do('key', compute))
+    assert results == ['rows'] * 8 and not errors
+    assert len(computed) == 1
+    assert flights.calls == 8 and flights.coalesced == 7
+    assert flights.in_flight() == 0
+
+
+def test_waiters_see_the_leaders_exception():
+    flights = SingleFlight()
+
+    def compute():
+        time.sleep(0.2)
+        raise ValueError("warehouse down")
+
+    results, errors = run_concurrently(4, lambda: flights.do('key', compute))
+    assert not results
+    assert len(errors) == 4 and all(isinstance(error, ValueError) for error in errors)
+
+
+def test_waiter_gives_up_after_timeout():
+    flights = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=flights.do, args=('key', release.wait))
+    leader.start()
+    while not flights.in_flight():
+        time.sleep(0.01)
+    with pytest.raises(FlightTimeout):
+        flights.do('key', lambda: 'never called', timeout=0.05)
+    release.set()
+    leader.join()
+
+
+def test_finished_flights_are_not_reused():
+    flights = SingleFlight()
+    assert flights.do('key', lambda: 1) == 1
+    assert flights.do('key', lambda: 2) == 2
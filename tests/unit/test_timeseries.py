@@ -0,0 +1,29 @@
+import numpy as np
+
+from dashboard.timeseries import lttb_indices
+
+
+def test_short_series_is_kept_whole():
+    assert list(lttb_indices(np.arange(5), np.ones(5), 10)) == [0, 1, 2, 3, 4]
+
+
+def test_keeps_threshold_points_in_order_with_both_ends():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=1000)
+    kept = lttb_indices(np.arange(1000), y, 100)
+    assert len(kept) == 100
+    assert kept[0] == 0 and kept[-1] == 999
+    assert np.all(np.diff(kept) > 0)
+
+
+def test_keeps_isolated_spikes():
+    y = np.zeros(1000)
+    y[[137, 512, 901]] = [50.0, -40.0, 30.0]
+    kept = set(lttb_indices(np.arange(1000), y, 50))
+    assert {137, 512, 901} <= kept
+
+
+def test_uneven_x_spacing():
+    x = np.cumsum(np.random.default_rng(1).uniform(0.5, 2.0, size=500))
+    kept = lttb_indices(x, np.sin(x), 60)
+    assert len(kept) == 60 and kept[-1] == 499
@@ -0,0 +1,78 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from detect_volume_anomalies import ALL_TYPES, RunningStats, VolumeAnomalyDetector
+
+START = datetime.date(2024, 1, 1)
+
+
+def day(offset):
+    return START + datetime.timedelta(days=offset)
+
+
+def detector(settle_days=2):
+    # score_batch never touches the connection
+    return VolumeAnomalyDetector(None, 'analytics_dev', threshold=2.0, min_observations=4, settle_days=settle_days)
+
+
+def test_running_stats_match_batch_statistics():
+    values = np.random.default_rng(0).normal(100, 15, size=500)
+    stats = RunningStats()
+    for value in values:
+        stats.update(value)
+    assert stats.observations == 500
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.stddev == pytest.approx(values.std(ddof=1))
+
+
+def test_running_stats_resume_from_stored_state():
+    values = [3.0, 5.0, 4.0, 8.0, 6.0]
+    first = RunningStats()
+    for value in values[:3]:
+        first.update(value)
+    resumed = RunningStats(first.observations, first.mean, first.m2)
+    for value in values[3:]:
+        resumed.update(value)
+    assert resumed.stddev == pytest.approx(np.std(values, ddof=1))
+
+
+def test_z_score_needs_spread():
+    stats = RunningStats()
+    stats.update(5.0)
+    assert stats.z_score(7.0) is None
+
+
+def test_trailing_window_is_scored_but_not_folded_in():
+    rows = [(day(i), 'Inpatient', 10 + i % 3, 1000.0) for i in range(10)]
+    baseline = {}
+    _, touched, dates = detector(settle_days=2).score_batch(rows, baseline)
+    assert dates == [day(i) for i in range(10)]
+    assert max(touched.values()) == day(7)
+    assert sum(stats.observations for (claim_type, _, metric), stats in baseline.items()
+               if claim_type == ALL_TYPES and metric == 'daily_claim_count') == 8
+
+
+def test_days_without_claims_score_as_zero():
+    rows = [(day(0), 'Inpatient', 5, 500.0), (day(3), 'Inpatient', 5, 500.0)]
+    _, _, dates = detector(settle_days=0).score_batch(rows, {})
+    assert dates == [day(0), day(1), day(2), day(3)]
+
+
+def test_rescoring_from_the_watermark_sees_late_claims():
+    baseline = {}
+    scorer = detector(settle_days=1)
+    # Weekly history, so every weekday has a baseline
+    history = [(day(i), 'Inpatient', 100 + (i // 7) % 2, 1000.0) for i in range(42)]
+    _, touched, _ = scorer.score_batch(history, baseline)
+    watermark = max(touched.values())
+    assert watermark == day(40)
+
+    # Day 41 was partial last run; its late claims arrive with a spike on day 42
+    alerts, touched, dates = scorer.score_batch(
+        [(day(41), 'Inpatient', 100, 1000.0), (day(42), 'Inpatient', 400, 1000.0)], baseline, since=watermark)
+    assert dates == [day(41), day(42)]
+    assert max(touched.values()) == day(41)
+    spikes = [a for a in alerts if a.metric == 'daily_claim_count' and a.claim_type == 'Inpatient']
+    assert [(a.metric_date, a.settled, a.direction) for a in spikes] == [(day(42), False, 'too high')]